@@ -0,0 +1,85 @@
+"""Import-time regression benchmark for photonics_helper.
+
+Runs ``import <module>`` in fresh interpreters and reports the median wall
+time. Exits non-zero when the median exceeds ``--max-ms`` or when one of the
+heavy optional dependencies is pulled in at import time.
+
+    python benchmarks/bench_import.py --repeat 10 --max-ms 250
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("scipy", "matplotlib", "rich")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    # numpy is a hard dependency, so its import cost is measured separately
+    # and subtracted to isolate the cost of the package itself.
+    probe = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    baseline = _PROBE.format(module="numpy", heavy=HEAVY_MODULES)
+    totals, numpy_only, loaded = [], [], set()
+    for _ in range(repeat):
+        result = json.loads(
+            subprocess.run(
+                [sys.executable, "-c", probe],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        totals.append(result["seconds"])
+        loaded.update(result["loaded"])
+        numpy_only.append(
+            json.loads(
+                subprocess.run(
+                    [sys.executable, "-c", baseline],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+            )["seconds"]
+        )
+    return {
+        "module": module,
+        "median_ms": statistics.median(totals) * 1e3,
+        "numpy_median_ms": statistics.median(numpy_only) * 1e3,
+        "heavy_modules_loaded": sorted(loaded),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="photonics_helper")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    result = measure(args.module, args.repeat)
+    print(json.dumps(result, indent=2))
+
+    if result["heavy_modules_loaded"]:
+        print(f"FAIL: import loaded {result['heavy_modules_loaded']}")
+        return 1
+    if args.max_ms is not None and result["median_ms"] > args.max_ms:
+        print(f"FAIL: median import {result['median_ms']:.1f} ms > {args.max_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Lookup-server throughput benchmark for photonics_helper.
+
+Serves a silica Dispersion from a separate process on a Unix socket and
+compares single-point requests per second through LookupClient against the
+same lookups made in-process, one Python call per point and one vectorized
+call for all points. Client requests are issued concurrently over a few
+connections so that the server can coalesce them into batches.
+
+    python benchmarks/bench_server.py --requests 20000 --connections 4
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from photonics_helper import Dispersion, RefractiveIndex, WavelengthArray
+from photonics_helper.server import DEFAULT_WINDOW, LookupClient, LookupServer
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+def _dispersion() -> Dispersion:
+    wl = WavelengthArray(np.linspace(1.3, 1.8, 2000), "um")
+    neff = RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), 2000).n
+    return Dispersion.from_neff(neff, wl, 1550)
+
+
+def _serve(path: str, window: float, ready) -> None:
+    async def run():
+        server = LookupServer({"silica": _dispersion()}, window=window)
+        await server.start(path)
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+
+async def _client_run(path: str, wavelengths: list, connections: int) -> float:
+    clients = [await LookupClient.connect(path=path) for _ in range(connections)]
+    shares = [wavelengths[i::connections] for i in range(connections)]
+
+    async def lookups(client, share):
+        return await asyncio.gather(*(client.dispersion("silica", w) for w in share))
+
+    await lookups(clients[0], wavelengths[:10])  # warm up
+    start = time.perf_counter()
+    await asyncio.gather(*(lookups(c, s) for c, s in zip(clients, shares)))
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+    return elapsed
+
+
+def measure(requests: int, connections: int, window: float) -> dict:
+    dispersion = _dispersion()
+    wavelengths = np.linspace(1400, 1700, requests).tolist()
+
+    dispersion.fn_ps_nm_km(1550)
+    start = time.perf_counter()
+    for w in wavelengths:
+        dispersion.fn_ps_nm_km(w)
+    scalar = time.perf_counter() - start
+
+    grid = WavelengthArray(np.asarray(wavelengths), "nm")
+    start = time.perf_counter()
+    dispersion.fn_array(grid, "ps/nm.km")
+    vectorized = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lookup.sock")
+        ready = multiprocessing.Event()
+        process = multiprocessing.Process(
+            target=_serve, args=(path, window, ready), daemon=True
+        )
+        process.start()
+        try:
+            if not ready.wait(60):
+                raise RuntimeError("server did not start")
+            served = asyncio.run(_client_run(path, wavelengths, connections))
+        finally:
+            process.terminate()
+            process.join()
+
+    return {
+        "requests": requests,
+        "connections": connections,
+        "window_s": window,
+        "in_process_scalar_per_s": requests / scalar,
+        "in_process_vectorized_per_s": requests / vectorized,
+        "server_per_s": requests / served,
+        "server_vs_scalar": scalar / served,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW)
+    parser.add_argument("--min-per-s", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    result = measure(args.requests, args.connections, args.window)
+    print(json.dumps(result, indent=2))
+
+    if args.min_per_s is not None and result["server_per_s"] < args.min_per_s:
+        print(f"FAIL: {result['server_per_s']:.0f} requests/s < {args.min_per_s}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Throughput and memory benchmark suite for photonics_helper.
+
+Times unit conversions, Dispersion queries, Sellmeier tables and dispersion
+fitting over grid sizes from 10**2 to 10**7, records items per second and the
+peak traced memory of each case, and optionally compares the run against a
+baseline. Exits non-zero when a case is slower or uses more memory than the
+baseline allows.
+
+Throughput is machine specific, so baselines are not committed (the path
+below is ignored by git). Record one from the reference commit on the same
+machine, then compare the change against it:
+
+    python benchmarks/suite.py --max-exp 6 --save benchmarks/baseline.json
+    python benchmarks/suite.py --max-exp 6 --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from photonics_helper import (
+    Dispersion,
+    LazyArray,
+    RefractiveIndex,
+    Wavelength,
+    WavelengthArray,
+    FrequencyArray,
+    convert,
+)
+
+# Pure Python loops are capped so that the largest sizes finish quickly; the
+# throughput is still per item.
+SCALAR_CAP = 10**5
+MIN_SECONDS = 0.05
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+def _silica_neff(points: int) -> Tuple[np.ndarray, WavelengthArray]:
+    wl = WavelengthArray(np.linspace(1.3, 1.8, points), "um")
+    return RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), points).n, wl
+
+
+def _reference_dispersion() -> Dispersion:
+    neff, wl = _silica_neff(2000)
+    return Dispersion.from_neff(neff, wl, 1550)
+
+
+# Each case takes a size and returns (function to time, items it processes).
+# Setup work happens outside the timed function.
+def case_scalar_conversion(size: int):
+    count = min(size, SCALAR_CAP)
+    values = np.linspace(1500, 1600, count).tolist()
+
+    def run():
+        for value in values:
+            Wavelength(value, "nm").to_freq().as_THz
+
+    return run, count
+
+
+def case_array_conversion(size: int):
+    wl = WavelengthArray(np.linspace(1500, 1600, size), "nm")
+    out = np.empty(size)
+
+    def run():
+        wl.to_freq(out=out)
+
+    return run, size
+
+
+def case_array_roundtrip(size: int):
+    freq = FrequencyArray(np.linspace(180, 200, size), "THz")
+
+    def run():
+        freq.to_wl().to_omega().as_rad_s
+
+    return run, size
+
+
+def case_convert(size: int):
+    wl = WavelengthArray(np.linspace(1500, 1600, size), "nm")
+
+    def run():
+        convert(wl, FrequencyArray)
+
+    return run, size
+
+
+def case_dispersion_scalar_query(size: int):
+    dispersion = _reference_dispersion()
+    count = min(size, SCALAR_CAP)
+    values = np.linspace(1400, 1700, count).tolist()
+    dispersion.fn_ps_nm_km(1550)
+    dispersion.get_beta2(1550)
+
+    def run():
+        for value in values:
+            dispersion.fn_ps_nm_km(value)
+            dispersion.get_beta2(value)
+
+    return run, count
+
+
+def case_dispersion_array_query(size: int):
+    dispersion = _reference_dispersion()
+    wl = WavelengthArray(np.linspace(1400, 1700, size), "nm")
+
+    def run():
+        dispersion.fn_array(wl, "ps/nm.km")
+        dispersion.get_beta2_array(wl)
+
+    return run, size
+
+
+def case_lazy_dispersion(size: int):
+    dispersion = _reference_dispersion()
+    wl = LazyArray.linspace(1400, 1700, size, "nm")
+    lazy = dispersion.fn_array(wl, "ps/nm.km")
+    out = np.empty(size)
+
+    def run():
+        lazy.compute(out=out)
+
+    return run, size
+
+
+def case_sellmeier_index(size: int):
+    def run():
+        RefractiveIndex.from_sellmeier(1, A, B, (0.5, 2.0), size)
+
+    return run, size
+
+
+def case_dispersion_from_neff(size: int):
+    neff, wl = _silica_neff(size)
+
+    # On very dense grids rounding dominates the second difference and the
+    # smoothness check rejects the fit; only the cost is measured here.
+    def run():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            Dispersion.from_neff(neff, wl, 1550, ignore_fit_error=True)
+
+    return run, size
+
+
+CASES: Dict[str, Callable] = {
+    "base.scalar_conversion": case_scalar_conversion,
+    "base.array_conversion": case_array_conversion,
+    "base.array_roundtrip": case_array_roundtrip,
+    "convert.array": case_convert,
+    "Dispersion.scalar_query": case_dispersion_scalar_query,
+    "Dispersion.array_query": case_dispersion_array_query,
+    "LazyArray.dispersion": case_lazy_dispersion,
+    "RefractiveIndex.from_sellmeier": case_sellmeier_index,
+    "Dispersion.from_neff": case_dispersion_from_neff,
+}
+
+
+def measure(case: Callable, size: int, repeat: int) -> dict:
+    run, items = case(size)
+    run()  # warm up caches and lazy imports
+
+    # Like timeit's autorange: small sizes are looped until one measurement
+    # takes at least MIN_SECONDS, so timer resolution does not dominate.
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        if time.perf_counter() - start >= MIN_SECONDS:
+            break
+        loops *= 10
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, (time.perf_counter() - start) / loops)
+
+    # numpy reports its buffers to tracemalloc, so this captures array memory
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "items": items,
+        "seconds": best,
+        "items_per_second": items / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    failures = []
+    for name, sizes in results.items():
+        for size, current in sizes.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference is None:
+                continue
+            slowdown = reference["items_per_second"] / current["items_per_second"]
+            if slowdown > 1 + tolerance:
+                failures.append(f"{name}[{size}]: {slowdown:.2f}x slower")
+            growth = current["peak_bytes"] / max(reference["peak_bytes"], 1)
+            if current["peak_bytes"] > 2**16 and growth > 1 + tolerance:
+                failures.append(f"{name}[{size}]: {growth:.2f}x peak memory")
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-exp", type=int, default=2)
+    parser.add_argument("--max-exp", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", action="append", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--save", default=None)
+    args = parser.parse_args(argv)
+
+    names = args.case or list(CASES)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {sorted(unknown)}, use {list(CASES)}")
+
+    results: Dict[str, Dict[str, dict]] = {}
+    for name in names:
+        results[name] = {}
+        for exp in range(args.min_exp, args.max_exp + 1):
+            result = measure(CASES[name], 10**exp, args.repeat)
+            results[name][str(10**exp)] = result
+            print(
+                f"{name:34s} 1e{exp}  {result['items_per_second']:12.4g} items/s"
+                f"  {result['peak_bytes'] / 2**20:9.2f} MiB"
+            )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            stored = json.load(file)
+        if stored["meta"] != report["meta"]:
+            print(f"WARNING: baseline recorded on {stored['meta']}, not comparable")
+        failures = compare(results, stored["results"], args.tolerance)
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        if failures:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,11 +7,28 @@ from .base import (
     AngularFrequencyArray,
     PI,
     C_MS,
+    parse_array,
+    get_precision,
+    precision,
+    set_precision,
 )
 
+from .lazy import LazyArray
 from .materials import RefractiveIndex
 from .fiber import Dispersion, PropagationConstant
-
+from .modes import ModeSet
+from .stepindex import StepIndexFiber
+from .sellmeier import sellmeier_derivatives, sellmeier_table
+from .convert import ConversionPlan, convert, plan_conversion
+from .cache import MaterialCache
+from .library import compile_library, iter_library, load_library, read_nk_file
+from .batch import DispersionBatch, build_dispersions
+from .nlse import SplitStepSolver, gaussian_pulse, sech_pulse
+from .streaming import stream_range, stream_spectrum, wavelength_chunks
+from .thinfilm import ThinFilmResult, transfer_matrix
+from .fwm import PhaseMatching
+from .looks import set_verbose
+from . import instrument
 
 __all__ = [
     "Wavelength",
@@ -22,7 +39,37 @@ __all__ = [
     "AngularFrequencyArray",
     "PI",
     "C_MS",
+    "parse_array",
+    "get_precision",
+    "precision",
+    "set_precision",
+    "LazyArray",
     "RefractiveIndex",
     "Dispersion",
     "PropagationConstant",
+    "ModeSet",
+    "StepIndexFiber",
+    "sellmeier_table",
+    "sellmeier_derivatives",
+    "ConversionPlan",
+    "convert",
+    "plan_conversion",
+    "MaterialCache",
+    "compile_library",
+    "iter_library",
+    "load_library",
+    "read_nk_file",
+    "DispersionBatch",
+    "build_dispersions",
+    "SplitStepSolver",
+    "gaussian_pulse",
+    "sech_pulse",
+    "stream_range",
+    "stream_spectrum",
+    "wavelength_chunks",
+    "ThinFilmResult",
+    "transfer_matrix",
+    "PhaseMatching",
+    "set_verbose",
+    "instrument",
 ]
@@ -0,0 +1,27 @@
+# scipy is imported on first use so that unit conversions do not pay for it.
+from . import instrument as _instrument
+
+
+def make_splrep(x, y, **kwargs):
+    from scipy.interpolate import make_splrep
+
+    if not _instrument.enabled:
+        return make_splrep(x, y, **kwargs)
+    with _instrument.timer("spline.fit", len(x)):
+        return make_splrep(x, y, **kwargs)
+
+
+def spline_from_tck(t, c, k: int):
+    # Rebuilds a fitted spline from stored knots and coefficients, no fitting.
+    from scipy.interpolate import BSpline
+
+    return BSpline.construct_fast(t, c, int(k))
+
+
+def make_interp_spline(x, y, k: int = 3, **kwargs):
+    from scipy.interpolate import make_interp_spline
+
+    if not _instrument.enabled:
+        return make_interp_spline(x, y, k=k, **kwargs)
+    with _instrument.timer("spline.fit", len(x)):
+        return make_interp_spline(x, y, k=k, **kwargs)
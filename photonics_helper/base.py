@@ -1,105 +1,292 @@
 from __future__ import annotations
-from typing import Literal, Self
+from contextlib import contextmanager
+from typing import Iterator, Literal, Self
 from numpy.typing import NDArray
 
 
+import math
+import os
 import numpy as np
-import scipy as sp
-from rich.traceback import install
 
-install()
+from . import instrument as _instrument
 
-# Constants
-PI: float = sp.constants.pi
-C_MS: float = sp.constants.c
+# Constants (same values as scipy.constants, which is too slow to import here)
+PI: float = math.pi
+C_MS: float = 299792458.0
+
+# Multipliers from each unit to the base unit of its domain. Shared by the
+# scalar and array constructors, the conversion planner and parse_array.
+UNIT_FACTORS: dict[str, dict[str, float]] = {
+    "wavelength": {"nm": 1e-9, "um": 1e-6, "m": 1.0},
+    "frequency": {"THz": 1e12, "GHz": 1e9, "MHz": 1e6, "Hz": 1.0},
+    "angular frequency": {"rad/ps": 1e12, "rad/s": 1.0},
+    "wavenumber": {"1/cm": 1e2, "1/m": 1.0},
+}
+
+
+# Floating point types the arrays can store. "single" halves memory and
+# bandwidth for large sweeps where about 7 significant digits are enough.
+PRECISIONS: dict[str, type] = {"double": np.float64, "single": np.float32}
+_COMPLEX = {np.dtype(np.float64): np.complex128, np.dtype(np.float32): np.complex64}
+# Resolved once: every array constructor looks its precision up here
+_DTYPES = {name: np.dtype(float_type) for name, float_type in PRECISIONS.items()}
+# Two units of rounding of each float type, the slack of _grid_limits
+_GRID_EPS = {dtype: 2 * float(np.finfo(dtype).eps) for dtype in _COMPLEX}
+_precision = "double"
+
+
+# Elements per pass for chunked conversions of memory-mapped arrays (32 MiB
+# of float64)
+DEFAULT_CHUNK_SIZE = 2**22
+
+
+def set_precision(precision: Literal["double", "single"]) -> None:
+    global _precision
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {precision} use 'double' or 'single'")
+    _precision = precision
+
+
+def get_precision() -> str:
+    return _precision
+
+
+@contextmanager
+def precision(value: Literal["double", "single"]) -> Iterator[None]:
+    previous = _precision
+    set_precision(value)
+    try:
+        yield
+    finally:
+        set_precision(previous)
+
+
+def resolve_dtype(dtype=None) -> np.dtype:
+    # None follows the global policy; otherwise a precision name or a dtype
+    if dtype is None:
+        dtype = _precision
+    if isinstance(dtype, str) and dtype in _DTYPES:
+        return _DTYPES[dtype]
+    dtype = np.dtype(dtype)
+    if dtype not in _COMPLEX:
+        raise ValueError(f"Unsupported dtype: {dtype} use float32 or float64")
+    return dtype
+
+
+def complex_dtype(dtype) -> np.dtype:
+    return np.dtype(_COMPLEX[resolve_dtype(dtype)])
+
+
+def _grid_limits(values: NDArray, dtype) -> tuple[float, float]:
+    # Bounds of a grid stored in dtype, widened by two units of its rounding
+    # so that the float64 endpoints a float32 grid was cast from still count
+    # as inside the grid.
+    values = np.asarray(values)
+    lower, upper = float(values.min()), float(values.max())
+    eps = _GRID_EPS[resolve_dtype(dtype)]
+    return lower - eps * abs(lower), upper + eps * abs(upper)
+
+
+def _unit_factor(factors: dict[str, float], unit: str) -> float:
+    try:
+        return factors[unit]
+    except (KeyError, TypeError):
+        choices = ", ".join(f"'{u}'" for u in factors)
+        raise ValueError(f"Unsupported unit: {unit} use {choices}") from None
+
+
+def _as_factors(domain: str) -> dict[str, float]:
+    # Multipliers from the base unit to each unit of UNIT_FACTORS, used by the
+    # as_* accessors; rounded so that 1 / 1e-9 is exactly 1e9
+    return {u: float(f"{1 / f:.15g}") for u, f in UNIT_FACTORS[domain].items()}
+
+
+def _count_array_conversion(values: NDArray, out: NDArray | None) -> None:
+    # Called only while instrumentation is enabled
+    _instrument.count("base.array_conversions")
+    _instrument.count("base.array_elements", values.size)
+    if out is None:
+        _instrument.count("base.array_allocations")
+
+
+def _chunked(
+    ufunc: np.ufunc,
+    x1: float | NDArray,
+    x2: float | NDArray,
+    out: NDArray | str | os.PathLike | None = None,
+    chunk_size: int | None = None,
+) -> NDArray:
+    # ufunc(x1, x2, out=out), optionally into a new .npy file and in chunks
+    # so that conversions of memory-mapped data run in bounded memory.
+    if chunk_size is None and not isinstance(out, (str, os.PathLike)):
+        return ufunc(x1, x2, out=out)
+
+    values = x1 if isinstance(x1, np.ndarray) else x2
+    dtype = np.result_type(x1, x2)
+    if isinstance(out, (str, os.PathLike)):
+        out = np.lib.format.open_memmap(out, mode="w+", dtype=dtype, shape=values.shape)
+    elif out is None:
+        out = np.empty(values.shape, dtype=dtype)
+    elif out.shape != values.shape:
+        raise ValueError(f"out should have shape {values.shape}, got {out.shape}")
+    if chunk_size is None:
+        chunk_size = max(values.size, 1)
+    elif chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer")
+
+    flat_values = values.reshape(-1)
+    flat_out = out.reshape(-1)
+    for start in range(0, values.size, chunk_size):
+        part = slice(start, start + chunk_size)
+        if values is x1:
+            ufunc(flat_values[part], x2, out=flat_out[part])
+        else:
+            ufunc(x1, flat_values[part], out=flat_out[part])
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def _from_memmap(
+    cls,
+    source: NDArray | str | os.PathLike,
+    unit: str,
+    dtype=None,
+    mode: Literal["r", "r+", "c"] = "r",
+    shape: int | tuple[int, ...] | None = None,
+    offset: int = 0,
+    out: NDArray | str | os.PathLike | None = None,
+    chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+):
+    factor = _unit_factor(cls._UNITS, unit)
+    if isinstance(source, np.ndarray):
+        values = source
+    elif os.fspath(source).endswith(".npy"):
+        values = np.load(source, mmap_mode=mode)
+    else:
+        # Raw binary file without a header
+        values = np.memmap(
+            source, dtype=resolve_dtype(dtype), mode=mode, shape=shape, offset=offset
+        )
+    if values.dtype not in _COMPLEX:
+        raise ValueError(f"Unsupported dtype: {values.dtype} use float32 or float64")
+
+    if factor == 1.0 and out is None:
+        # Already in the base unit: wrap the mapping itself, nothing is read
+        return values.view(cls)
+    if out is None:
+        raise ValueError(
+            f"values in '{unit}' must be scaled to the base unit; "
+            "pass out= (a path or array) to convert them in chunks"
+        )
+    return cls.from_base(_chunked(np.multiply, values, factor, out, chunk_size))
 
 
 class Wavelength(float):
+    _UNITS = UNIT_FACTORS["wavelength"]
+    _AS_FACTORS = _as_factors("wavelength")
+
     def __new__(cls, value: float, unit: Literal["nm", "um", "m"]) -> Self:
-        if unit == "nm":
-            value *= 1e-9
-        elif unit == "um":
-            value *= 1e-6
-        elif unit == "m":
-            pass  # Already in meters, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use 'nm', 'um', or 'm'")
+        factor = _unit_factor(cls._UNITS, unit)
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        if factor != 1.0:
+            value *= factor
         return super().__new__(cls, value)
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        # Skips unit validation for values already in the base unit
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        return float.__new__(cls, value)
+
     @property
     def as_m(self) -> float:
         return float(self)
 
     @property
     def as_um(self) -> float:
-        return self * 1e6
+        return float(self) * self._AS_FACTORS["um"]
 
     @property
     def as_nm(self) -> float:
-        return self * 1e9
+        return float(self) * self._AS_FACTORS["nm"]
 
     def to_freq(self) -> Frequency:
-        return Frequency(C_MS / self, "Hz")
+        return Frequency.from_base(C_MS / self)
 
     def to_omega(self) -> AngularFrequency:
-        return AngularFrequency(2 * PI * C_MS / self, "rad/s")
+        return AngularFrequency.from_base(2 * PI * C_MS / self)
 
     def to_wn(self) -> Wavenumber:
-        return Wavenumber(value=1 / self.as_m, unit="1/m")
+        return Wavenumber.from_base(1 / self.as_m)
 
 
 class Frequency(float):
+    _UNITS = UNIT_FACTORS["frequency"]
+    _AS_FACTORS = _as_factors("frequency")
+
     def __new__(cls, value: float, unit: Literal["THz", "GHz", "MHz", "Hz"]) -> Self:
-        if unit == "THz":
-            value *= 1e12
-        elif unit == "GHz":
-            value *= 1e9
-        elif unit == "MHz":
-            value *= 1e6
-        elif unit == "Hz":
-            pass  # Already in Hz, no conversion needed
-        else:
-            raise ValueError(
-                f"Unsupported unit: {unit} use 'THz', 'GHz', 'MHz' or 'Hz'"
-            )
+        factor = _unit_factor(cls._UNITS, unit)
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        if factor != 1.0:
+            value *= factor
         return super().__new__(cls, value)
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        # Skips unit validation for values already in the base unit
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        return float.__new__(cls, value)
+
     @property
     def as_Hz(self) -> float:
         return float(self)
 
     @property
     def as_THz(self) -> float:
-        return self * 1e-12
+        return float(self) * self._AS_FACTORS["THz"]
 
     @property
     def as_GHz(self) -> float:
-        return self * 1e-9
+        return float(self) * self._AS_FACTORS["GHz"]
 
     @property
     def as_MHz(self) -> float:
-        return self * 1e-6
+        return float(self) * self._AS_FACTORS["MHz"]
 
     def to_wl(self) -> Wavelength:
-        return Wavelength(C_MS / self, "m")
+        return Wavelength.from_base(C_MS / self)
 
     def to_omega(self) -> AngularFrequency:
-        return AngularFrequency(2 * PI * self.as_Hz, "rad/s")
+        return AngularFrequency.from_base(2 * PI * self.as_Hz)
 
     def to_wn(self) -> Wavenumber:
-        return Wavenumber(value=self.as_Hz / C_MS, unit="1/m")
+        return Wavenumber.from_base(self.as_Hz / C_MS)
 
 
 class AngularFrequency(float):
+    _UNITS = UNIT_FACTORS["angular frequency"]
+    _AS_FACTORS = _as_factors("angular frequency")
+
     def __new__(cls, value: float, unit: Literal["rad/s", "rad/ps"]) -> Self:
-        if unit == "rad/ps":
-            value *= 1e-12  # Convert from rad/ps to rad/s
-        elif unit == "rad/s":
-            pass  # Already in rad/s, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use 'rad/s' or 'rad/ps'")
+        factor = _unit_factor(cls._UNITS, unit)
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        if factor != 1.0:
+            value *= factor
         return super().__new__(cls, value)
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        # Skips unit validation for values already in the base unit
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        return float.__new__(cls, value)
+
     def __repr__(self) -> str:
         # Use float() to avoid recursion when converting self to string
         return f"Angular Frequency -> {float(self)} rad/s"
@@ -112,89 +299,151 @@ class AngularFrequency(float):
     @property
     def as_rad_ps(self) -> float:
         # Use float() to avoid recursion in multiplication
-        return float(self) * 1e-12  # Convert from rad/s to rad/ps
+        return float(self) * self._AS_FACTORS["rad/ps"]
 
     def to_wl(self) -> Wavelength:
-        return Wavelength((2 * PI) * C_MS / self, "m")
+        return Wavelength.from_base((2 * PI) * C_MS / self)
 
     def to_freq(self) -> Frequency:
-        return Frequency(self / (2 * PI), "Hz")
+        return Frequency.from_base(self / (2 * PI))
 
     def to_wn(self) -> Wavenumber:
-        return Wavenumber(value=self.as_rad_s / (2 * PI * C_MS), unit="1/m")
+        return Wavenumber.from_base(self.as_rad_s / (2 * PI * C_MS))
 
 
 class Wavenumber(float):
+    _UNITS = UNIT_FACTORS["wavenumber"]
+    # "angular" is the angular wavenumber 2π/λ, an output-only unit
+    _AS_FACTORS = {**_as_factors("wavenumber"), "angular": 2 * PI}
+
     def __new__(cls, value: float, unit: Literal["1/cm", "1/m"]) -> Self:
-        if unit == "1/cm":
-            value *= 1e2  # Convert from 1/cm to 1/m
-        elif unit == "1/m":
-            pass  # Already in 1/m, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use '1/cm' or '1/m'")
+        factor = _unit_factor(cls._UNITS, unit)
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        if factor != 1.0:
+            value *= factor
         return super().__new__(cls, value)
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        # Skips unit validation for values already in the base unit
+        if _instrument.enabled:
+            _instrument.count("base.scalar_conversions")
+        return float.__new__(cls, value)
+
     @property
     def as_1_m(self) -> float:
         return float(self)
 
     @property
     def as_1_cm(self) -> float:
-        return float(self) * 1e-2
+        return float(self) * self._AS_FACTORS["1/cm"]
 
     @property
     def as_angular(self) -> float:
-        return float(self) * 2 * PI
+        return float(self) * self._AS_FACTORS["angular"]
 
     def to_wl(self) -> Wavelength:
-        return Wavelength(value=1 / self.as_1_m, unit="m")
+        return Wavelength.from_base(1 / self.as_1_m)
 
     def to_freq(self) -> Frequency:
-        return Frequency(value=C_MS * self.as_1_m, unit="Hz")
+        return Frequency.from_base(C_MS * self.as_1_m)
 
     def to_omega(self) -> AngularFrequency:
-        return AngularFrequency(value=C_MS * 2 * PI * self.as_1_m, unit="rad/s")
+        return AngularFrequency.from_base(C_MS * 2 * PI * self.as_1_m)
 
 
 class WavelengthArray(np.ndarray):
-    def __new__(cls, value: NDArray, unit: Literal["nm", "um", "m"]) -> Self:
-        # Convert input array to float type
-        value = np.array(value, dtype=float)
-        if unit == "nm":
-            value *= 1e-9
-        elif unit == "um":
-            value *= 1e-6
-        elif unit == "m":
-            pass  # Already in meters, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use 'nm', 'um', or 'm'")
+    _UNITS = UNIT_FACTORS["wavelength"]
+    _AS_FACTORS = Wavelength._AS_FACTORS
+
+    def __new__(
+        cls, value: NDArray, unit: Literal["nm", "um", "m"], dtype=None
+    ) -> Self:
+        factor = _unit_factor(cls._UNITS, unit)
+        # Convert input array to the float type of the precision policy
+        value = np.array(value, dtype=resolve_dtype(dtype))
+        if _instrument.enabled:
+            _instrument.count("base.array_allocations")
+        if factor != 1.0:
+            value *= factor
         obj = np.asarray(value).view(cls)
         return obj
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        # Wrap values already in meters without copying them
+        return np.asarray(value).view(cls)
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["nm", "um", "m"] = "m",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        return _from_memmap(
+            cls, source, unit, dtype, mode, shape, offset, out, chunk_size
+        )
+
     def __array_finalize__(self, obj):
         if obj is None:
             return
 
     @property
     def as_m(self) -> NDArray:
-        return np.array(self)
+        return self.view(np.ndarray)
 
     @property
     def as_um(self) -> NDArray:
-        return np.array(self) * 1e6
+        return self.as_unit("um")
 
     @property
     def as_nm(self) -> NDArray:
-        return np.array(self) * 1e9
-
-    def to_freq(self) -> FrequencyArray:
-        return FrequencyArray(C_MS / self.as_m, "Hz")
-
-    def to_omega(self) -> AngularFrequencyArray:
-        return AngularFrequencyArray(2 * PI * C_MS / self.as_m, "rad/s")
-
-    def to_wn(self) -> WavenumberArray:
-        return WavenumberArray(value=1 / self.as_m, unit="1/m")
+        return self.as_unit("nm")
+
+    def as_unit(
+        self,
+        unit: Literal["nm", "um", "m"],
+        out: NDArray | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        factor = _unit_factor(self._AS_FACTORS, unit)
+        return _chunked(np.multiply, self.view(np.ndarray), factor, out, chunk_size)
+
+    def to_freq(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> FrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return FrequencyArray.from_base(
+            _chunked(np.divide, C_MS, self.as_m, out, chunk_size)
+        )
+
+    def to_omega(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> AngularFrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return AngularFrequencyArray.from_base(
+            _chunked(np.divide, 2 * PI * C_MS, self.as_m, out, chunk_size)
+        )
+
+    def to_wn(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavenumberArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavenumberArray.from_base(
+            _chunked(np.divide, 1, self.as_m, out, chunk_size)
+        )
 
     def to_equally_spaced(self, points=51) -> NDArray:
         min = self.as_m.min()
@@ -203,52 +452,100 @@ class WavelengthArray(np.ndarray):
 
 
 class FrequencyArray(np.ndarray):
-    def __new__(cls, value: NDArray, unit: Literal["THz", "GHz", "MHz", "Hz"]) -> Self:
-        # Convert input array to float type
-        value = np.array(value, dtype=float)
-        if unit == "THz":
-            value *= 1e12
-        elif unit == "GHz":
-            value *= 1e9
-        elif unit == "MHz":
-            value *= 1e6
-        elif unit == "Hz":
-            pass  # Already in Hz, no conversion needed
-        else:
-            raise ValueError(
-                f"Unsupported unit: {unit} use 'THz', 'GHz', 'MHz' or 'Hz'"
-            )
+    _UNITS = UNIT_FACTORS["frequency"]
+    _AS_FACTORS = Frequency._AS_FACTORS
+
+    def __new__(
+        cls, value: NDArray, unit: Literal["THz", "GHz", "MHz", "Hz"], dtype=None
+    ) -> Self:
+        factor = _unit_factor(cls._UNITS, unit)
+        # Convert input array to the float type of the precision policy
+        value = np.array(value, dtype=resolve_dtype(dtype))
+        if _instrument.enabled:
+            _instrument.count("base.array_allocations")
+        if factor != 1.0:
+            value *= factor
         obj = np.asarray(value).view(cls)
         return obj
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        # Wrap values already in Hz without copying them
+        return np.asarray(value).view(cls)
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["THz", "GHz", "MHz", "Hz"] = "Hz",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        return _from_memmap(
+            cls, source, unit, dtype, mode, shape, offset, out, chunk_size
+        )
+
     def __array_finalize__(self, obj):
         if obj is None:
             return
 
     @property
     def as_Hz(self) -> NDArray:
-        return np.array(self)
+        return self.view(np.ndarray)
 
     @property
     def as_THz(self) -> NDArray:
-        return np.array(self) * 1e-12
+        return self.as_unit("THz")
 
     @property
     def as_GHz(self) -> NDArray:
-        return np.array(self) * 1e-9
+        return self.as_unit("GHz")
 
     @property
     def as_MHz(self) -> NDArray:
-        return np.array(self) * 1e-6
-
-    def to_wl(self) -> WavelengthArray:
-        return WavelengthArray(C_MS / self, "m")
-
-    def to_omega(self) -> AngularFrequencyArray:
-        return AngularFrequencyArray(2 * PI * self.as_Hz, "rad/s")
-
-    def to_wn(self) -> WavenumberArray:
-        return WavenumberArray(value=self.as_Hz / C_MS, unit="1/m")
+        return self.as_unit("MHz")
+
+    def as_unit(
+        self,
+        unit: Literal["THz", "GHz", "MHz", "Hz"],
+        out: NDArray | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        factor = _unit_factor(self._AS_FACTORS, unit)
+        return _chunked(np.multiply, self.view(np.ndarray), factor, out, chunk_size)
+
+    def to_wl(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavelengthArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavelengthArray.from_base(
+            _chunked(np.divide, C_MS, self.as_Hz, out, chunk_size)
+        )
+
+    def to_omega(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> AngularFrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return AngularFrequencyArray.from_base(
+            _chunked(np.multiply, 2 * PI, self.as_Hz, out, chunk_size)
+        )
+
+    def to_wn(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavenumberArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavenumberArray.from_base(
+            _chunked(np.divide, self.as_Hz, C_MS, out, chunk_size)
+        )
 
     def to_equally_spaced(self, points=51) -> NDArray:
         min = self.as_Hz.min()
@@ -257,38 +554,92 @@ class FrequencyArray(np.ndarray):
 
 
 class AngularFrequencyArray(np.ndarray):
-    def __new__(cls, value: NDArray, unit: Literal["rad/s", "rad/ps"]) -> Self:
-        # Convert input array to float type
-        value = np.array(value, dtype=float)
-        if unit == "rad/ps":
-            value *= 1e-12  # Convert from rad/ps to rad/s
-        elif unit == "rad/s":
-            pass  # Already in rad/s, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use 'rad/s' or 'rad/ps'")
+    _UNITS = UNIT_FACTORS["angular frequency"]
+    _AS_FACTORS = AngularFrequency._AS_FACTORS
+
+    def __new__(
+        cls, value: NDArray, unit: Literal["rad/s", "rad/ps"], dtype=None
+    ) -> Self:
+        factor = _unit_factor(cls._UNITS, unit)
+        # Convert input array to the float type of the precision policy
+        value = np.array(value, dtype=resolve_dtype(dtype))
+        if _instrument.enabled:
+            _instrument.count("base.array_allocations")
+        if factor != 1.0:
+            value *= factor
         obj = np.asarray(value).view(cls)
         return obj
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        # Wrap values already in rad/s without copying them
+        return np.asarray(value).view(cls)
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["rad/s", "rad/ps"] = "rad/s",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        return _from_memmap(
+            cls, source, unit, dtype, mode, shape, offset, out, chunk_size
+        )
+
     def __array_finalize__(self, obj):
         if obj is None:
             return
 
     @property
     def as_rad_s(self) -> NDArray:
-        return np.array(self)
+        return self.view(np.ndarray)
 
     @property
     def as_rad_ps(self) -> NDArray:
-        return np.array(self) * 1e-12
-
-    def to_wl(self) -> WavelengthArray:
-        return WavelengthArray((2 * PI) * C_MS / self, "m")
-
-    def to_freq(self) -> FrequencyArray:
-        return FrequencyArray(self / (2 * PI), "Hz")
-
-    def to_wn(self) -> WavenumberArray:
-        return WavenumberArray(value=self.as_rad_s / (2 * PI * C_MS), unit="1/m")
+        return self.as_unit("rad/ps")
+
+    def as_unit(
+        self,
+        unit: Literal["rad/s", "rad/ps"],
+        out: NDArray | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        factor = _unit_factor(self._AS_FACTORS, unit)
+        return _chunked(np.multiply, self.view(np.ndarray), factor, out, chunk_size)
+
+    def to_wl(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavelengthArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavelengthArray.from_base(
+            _chunked(np.divide, (2 * PI) * C_MS, self.as_rad_s, out, chunk_size)
+        )
+
+    def to_freq(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> FrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return FrequencyArray.from_base(
+            _chunked(np.divide, self.as_rad_s, 2 * PI, out, chunk_size)
+        )
+
+    def to_wn(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavenumberArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavenumberArray.from_base(
+            _chunked(np.divide, self.as_rad_s, 2 * PI * C_MS, out, chunk_size)
+        )
 
     def to_equally_spaced(self, points=51) -> NDArray:
         min = self.as_rad_s.min()
@@ -297,40 +648,136 @@ class AngularFrequencyArray(np.ndarray):
 
 
 class WavenumberArray(np.ndarray):
-    def __new__(cls, value: NDArray, unit: Literal["1/cm", "1/m"]) -> Self:
-        # Convert input array to float type
-        value = np.array(value, dtype=float)
-        if unit == "1/cm":
-            value *= 1e2  # Convert from 1/cm to 1/m
-        elif unit == "1/m":
-            pass  # Already in 1/m, no conversion needed
-        else:
-            raise ValueError(f"Unsupported unit: {unit} use '1/cm' or '1/m'")
+    _UNITS = UNIT_FACTORS["wavenumber"]
+    _AS_FACTORS = Wavenumber._AS_FACTORS
+
+    def __new__(cls, value: NDArray, unit: Literal["1/cm", "1/m"], dtype=None) -> Self:
+        factor = _unit_factor(cls._UNITS, unit)
+        # Convert input array to the float type of the precision policy
+        value = np.array(value, dtype=resolve_dtype(dtype))
+        if _instrument.enabled:
+            _instrument.count("base.array_allocations")
+        if factor != 1.0:
+            value *= factor
         obj = np.asarray(value).view(cls)
         return obj
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        # Wrap values already in 1/m without copying them
+        return np.asarray(value).view(cls)
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["1/cm", "1/m"] = "1/m",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        return _from_memmap(
+            cls, source, unit, dtype, mode, shape, offset, out, chunk_size
+        )
+
     @property
     def as_1_m(self) -> NDArray:
-        return np.array(self)
+        return self.view(np.ndarray)
 
     @property
     def as_1_cm(self) -> NDArray:
-        return np.array(self) * 1e-2
+        return self.as_unit("1/cm")
 
     @property
     def as_angular(self) -> NDArray:
-        return np.array(self) * 2 * PI
-
-    def to_wl(self) -> WavelengthArray:
-        return WavelengthArray(value=1 / self.as_1_m, unit="m")
-
-    def to_freq(self) -> FrequencyArray:
-        return FrequencyArray(value=C_MS * self.as_1_m, unit="Hz")
-
-    def to_omega(self) -> AngularFrequencyArray:
-        return AngularFrequencyArray(value=C_MS * 2 * PI * self.as_1_m, unit="rad/s")
+        return self.as_unit("angular")
+
+    def as_unit(
+        self,
+        unit: Literal["1/cm", "1/m", "angular"],
+        out: NDArray | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        factor = _unit_factor(self._AS_FACTORS, unit)
+        return _chunked(np.multiply, self.view(np.ndarray), factor, out, chunk_size)
+
+    def to_wl(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> WavelengthArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return WavelengthArray.from_base(
+            _chunked(np.divide, 1, self.as_1_m, out, chunk_size)
+        )
+
+    def to_freq(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> FrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return FrequencyArray.from_base(
+            _chunked(np.multiply, C_MS, self.as_1_m, out, chunk_size)
+        )
+
+    def to_omega(
+        self, out: NDArray | None = None, chunk_size: int | None = None
+    ) -> AngularFrequencyArray:
+        if _instrument.enabled:
+            _count_array_conversion(self, out)
+        return AngularFrequencyArray.from_base(
+            _chunked(np.multiply, C_MS * 2 * PI, self.as_1_m, out, chunk_size)
+        )
 
     def to_equally_spaced(self, points=51) -> NDArray:
         min = self.as_1_m.min()
         max = self.as_1_m.max()
         return np.linspace(max, min, points)
+
+
+_ARRAY_TYPES = {
+    "wavelength": WavelengthArray,
+    "frequency": FrequencyArray,
+    "angular frequency": AngularFrequencyArray,
+    "wavenumber": WavenumberArray,
+}
+
+_DOMAIN_OF_UNIT = {
+    unit: domain for domain, factors in UNIT_FACTORS.items() for unit in factors
+}
+
+
+def parse_array(
+    values: NDArray | list[str], dtype=None
+) -> WavelengthArray | FrequencyArray | AngularFrequencyArray | WavenumberArray:
+    strings = np.strings.strip(np.asarray(values, dtype=np.str_))
+    if strings.size == 0:
+        raise ValueError("Cannot infer the quantity of an empty array")
+    numbers, _, units = np.strings.partition(strings, " ")
+    units = np.strings.strip(units)
+
+    unique_units, inverse = np.unique(units, return_inverse=True)
+    unknown = [str(u) for u in unique_units if str(u) not in _DOMAIN_OF_UNIT]
+    if unknown:
+        raise ValueError(
+            f"Unsupported unit: {unknown} use one of "
+            + ", ".join(f"'{u}'" for u in _DOMAIN_OF_UNIT)
+        )
+    domains = {_DOMAIN_OF_UNIT[str(u)] for u in unique_units}
+    if len(domains) > 1:
+        raise ValueError(f"Cannot mix units of different quantities: {sorted(domains)}")
+    domain = domains.pop()
+
+    try:
+        parsed = numbers.astype(resolve_dtype(dtype))
+    except ValueError as err:
+        raise ValueError(f"Cannot parse value: {err}") from None
+
+    factors = np.array([UNIT_FACTORS[domain][str(u)] for u in unique_units])
+    if len(factors) > 1 or factors[0] != 1.0:
+        parsed *= factors[inverse.reshape(parsed.shape)]
+    return _ARRAY_TYPES[domain].from_base(parsed)
@@ -1,12 +1,63 @@
 from __future__ import annotations
-from typing import Literal, Self
+from contextlib import contextmanager
+from typing import Iterator, Literal, Self
 
+import os
 import numpy as np
 from numpy.typing import NDArray
 
 PI: float
 C_MS: float
 
+UNIT_FACTORS: dict[str, dict[str, float]]
+"""Multipliers from each supported unit to the base unit of its quantity.
+
+Keyed by quantity ('wavelength', 'frequency', 'angular frequency',
+'wavenumber') and then by unit. All constructors read their factors here.
+"""
+
+DEFAULT_CHUNK_SIZE: int
+"""Elements converted per pass by from_memmap (2**22, 32 MiB of float64)."""
+
+PRECISIONS: dict[str, type]
+"""Floating point types selectable by name: 'double' (float64) and 'single' (float32)."""
+
+def set_precision(precision: Literal["double", "single"]) -> None:
+    """Set the global precision policy used by array constructors.
+
+    New *Array objects, and RefractiveIndex/Dispersion objects built from
+    them, store float32 under 'single' and float64 under 'double' (the
+    default). Conversions keep the dtype of their input.
+
+    Raises:
+        ValueError: If precision is not 'double' or 'single'.
+    """
+    ...
+
+def get_precision() -> str:
+    """Current global precision policy, 'double' or 'single'."""
+    ...
+
+@contextmanager
+def precision(value: Literal["double", "single"]) -> Iterator[None]:
+    """Use another precision policy inside a with block."""
+    ...
+
+def resolve_dtype(dtype=None) -> np.dtype:
+    """Turn a dtype argument into float32 or float64.
+
+    Args:
+        dtype: None for the global policy, 'single'/'double', or a dtype.
+
+    Raises:
+        ValueError: If the dtype is not float32 or float64.
+    """
+    ...
+
+def complex_dtype(dtype) -> np.dtype:
+    """complex64 for float32 and complex128 for float64."""
+    ...
+
 class Wavelength(float):
     """Represents a scalar wavelength value with unit conversion methods."""
 
@@ -22,6 +73,20 @@ class Wavelength(float):
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        """Fast constructor for a value already in meters.
+
+        Skips unit parsing and validation.
+
+        Args:
+            value: The value in meters.
+
+        Returns:
+            A Wavelength object.
+        """
+        ...
+
     @property
     def as_m(self) -> float:
         """Return the wavelength in meters."""
@@ -66,6 +131,20 @@ class Frequency(float):
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        """Fast constructor for a value already in Hz.
+
+        Skips unit parsing and validation.
+
+        Args:
+            value: The value in Hz.
+
+        Returns:
+            A Frequency object.
+        """
+        ...
+
     @property
     def as_Hz(self) -> float:
         """Return the frequency in Hertz."""
@@ -115,6 +194,20 @@ class AngularFrequency(float):
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        """Fast constructor for a value already in rad/s.
+
+        Skips unit parsing and validation.
+
+        Args:
+            value: The value in rad/s.
+
+        Returns:
+            A AngularFrequency object.
+        """
+        ...
+
     def __repr__(self) -> str: ...
 
     @property
@@ -154,6 +247,20 @@ class Wavenumber(float):
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: float) -> Self:
+        """Fast constructor for a value already in 1/m.
+
+        Skips unit parsing and validation.
+
+        Args:
+            value: The value in 1/m.
+
+        Returns:
+            A Wavenumber object.
+        """
+        ...
+
     @property
     def as_1_m(self) -> float:
         """Return the wavenumber in 1/m."""
@@ -184,23 +291,79 @@ class Wavenumber(float):
 class WavelengthArray(np.ndarray):
     """Numpy array wrapper for multiple wavelength values with unit conversions."""
 
-    def __new__(cls, value: NDArray, unit: Literal["nm", "um", "m"]) -> Self:
+    def __new__(
+        cls, value: NDArray, unit: Literal["nm", "um", "m"], dtype=None
+    ) -> Self:
         """Create a new WavelengthArray instance.
 
         Args:
             value: An array of wavelength values.
             unit: The unit of each wavelength ('nm', 'um', or 'm').
+            dtype: float32/float64 or 'single'/'double'; None follows
+                the global precision policy.
 
         Returns:
             A WavelengthArray object with values in meters.
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        """Wrap an array already in meters without copying or unit checks.
+
+        Args:
+            value: Float array of values in meters.
+
+        Returns:
+            A WavelengthArray view of value.
+        """
+        ...
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["nm", "um", "m"] = "m",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        """Wrap a memory-mapped array without reading it into memory.
+
+        Values already in meters are wrapped as a view of the mapping. Other
+        units are scaled chunk by chunk into out.
+
+        Args:
+            source: A .npy file (opened with np.load(mmap_mode=mode)), a raw
+                binary file (opened with np.memmap) or an existing array
+                such as a np.memmap.
+            unit: The unit of the stored values.
+            dtype: Element type of a raw binary file; None follows the
+                global precision policy.
+            mode: Memory-map mode ('r', 'r+', or 'c').
+            shape: Shape of a raw binary file, None for a flat array.
+            offset: Byte offset of the data in a raw binary file.
+            out: Array or .npy path that receives the values in meters;
+                required when unit is not "m".
+            chunk_size: Elements scaled per pass.
+
+        Returns:
+            A WavelengthArray backed by the mapping or by out.
+
+        Raises:
+            ValueError: If the dtype is not float32/float64, or unit needs
+                scaling and out is not given.
+        """
+        ...
+
     def __array_finalize__(self, obj) -> None: ...
 
     @property
     def as_m(self) -> NDArray:
-        """Return the wavelengths in meters."""
+        """Return the wavelengths in meters (a view, not a copy)."""
         ...
 
     @property
@@ -213,16 +376,72 @@ class WavelengthArray(np.ndarray):
         """Return the wavelengths in nanometers."""
         ...
 
-    def to_freq(self) -> FrequencyArray:
-        """Convert wavelengths to frequency array."""
+    def as_unit(
+        self,
+        unit: Literal["nm", "um", "m"],
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        """Return the values in the given unit.
+
+        Args:
+            unit: Target unit ('nm', 'um', or 'm').
+            out: Optional preallocated array, or a .npy path to create, to
+                write the result into.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+
+        Returns:
+            The scaled values, written into out when it is given.
+        """
         ...
 
-    def to_omega(self) -> AngularFrequencyArray:
-        """Convert wavelengths to angular frequency array."""
+    def to_freq(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> FrequencyArray:
+        """Convert wavelengths to frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
+        ...
+
+    def to_omega(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> AngularFrequencyArray:
+        """Convert wavelengths to angular frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
-    def to_wn(self) -> WavenumberArray:
-        """Convert wavelengths to wavenumber array."""
+    def to_wn(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavenumberArray:
+        """Convert wavelengths to wavenumber array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
     def to_equally_spaced(self, points: int = 51) -> NDArray:
@@ -233,24 +452,78 @@ class FrequencyArray(np.ndarray):
     """Numpy array wrapper for multiple frequency values with unit conversions."""
 
     def __new__(
-        cls, value: NDArray, unit: Literal["THz", "GHz", "MHz", "Hz"]
+        cls, value: NDArray, unit: Literal["THz", "GHz", "MHz", "Hz"], dtype=None
     ) -> Self:
         """Create a new FrequencyArray instance.
 
         Args:
             value: An array of frequency values.
             unit: The unit of each frequency ('THz', 'GHz', 'MHz', or 'Hz').
+            dtype: float32/float64 or 'single'/'double'; None follows
+                the global precision policy.
 
         Returns:
             A FrequencyArray object with values in Hz.
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        """Wrap an array already in Hz without copying or unit checks.
+
+        Args:
+            value: Float array of values in Hz.
+
+        Returns:
+            A FrequencyArray view of value.
+        """
+        ...
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["THz", "GHz", "MHz", "Hz"] = "Hz",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        """Wrap a memory-mapped array without reading it into memory.
+
+        Values already in Hz are wrapped as a view of the mapping. Other
+        units are scaled chunk by chunk into out.
+
+        Args:
+            source: A .npy file (opened with np.load(mmap_mode=mode)), a raw
+                binary file (opened with np.memmap) or an existing array
+                such as a np.memmap.
+            unit: The unit of the stored values.
+            dtype: Element type of a raw binary file; None follows the
+                global precision policy.
+            mode: Memory-map mode ('r', 'r+', or 'c').
+            shape: Shape of a raw binary file, None for a flat array.
+            offset: Byte offset of the data in a raw binary file.
+            out: Array or .npy path that receives the values in Hz;
+                required when unit is not "Hz".
+            chunk_size: Elements scaled per pass.
+
+        Returns:
+            A FrequencyArray backed by the mapping or by out.
+
+        Raises:
+            ValueError: If the dtype is not float32/float64, or unit needs
+                scaling and out is not given.
+        """
+        ...
+
     def __array_finalize__(self, obj) -> None: ...
 
     @property
     def as_Hz(self) -> NDArray:
-        """Return the frequencies in Hz."""
+        """Return the frequencies in Hz (a view, not a copy)."""
         ...
 
     @property
@@ -268,16 +541,72 @@ class FrequencyArray(np.ndarray):
         """Return the frequencies in MHz."""
         ...
 
-    def to_wl(self) -> WavelengthArray:
-        """Convert frequencies to wavelength array."""
+    def as_unit(
+        self,
+        unit: Literal["THz", "GHz", "MHz", "Hz"],
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        """Return the values in the given unit.
+
+        Args:
+            unit: Target unit ('THz', 'GHz', 'MHz', or 'Hz').
+            out: Optional preallocated array, or a .npy path to create, to
+                write the result into.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+
+        Returns:
+            The scaled values, written into out when it is given.
+        """
+        ...
+
+    def to_wl(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavelengthArray:
+        """Convert frequencies to wavelength array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
-    def to_omega(self) -> AngularFrequencyArray:
-        """Convert frequencies to angular frequency array."""
+    def to_omega(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> AngularFrequencyArray:
+        """Convert frequencies to angular frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
-    def to_wn(self) -> WavenumberArray:
-        """Convert frequencies to wavenumber array."""
+    def to_wn(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavenumberArray:
+        """Convert frequencies to wavenumber array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
     def to_equally_spaced(self, points: int = 51) -> NDArray:
@@ -288,24 +617,78 @@ class AngularFrequencyArray(np.ndarray):
     """Numpy array wrapper for multiple angular frequency values with unit conversions."""
 
     def __new__(
-        cls, value: NDArray, unit: Literal["rad/s", "rad/ps"]
+        cls, value: NDArray, unit: Literal["rad/s", "rad/ps"], dtype=None
     ) -> Self:
         """Create a new AngularFrequencyArray instance.
 
         Args:
             value: An array of angular frequency values.
             unit: The unit of each value ('rad/s' or 'rad/ps').
+            dtype: float32/float64 or 'single'/'double'; None follows
+                the global precision policy.
 
         Returns:
             An AngularFrequencyArray object with values in rad/s.
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        """Wrap an array already in rad/s without copying or unit checks.
+
+        Args:
+            value: Float array of values in rad/s.
+
+        Returns:
+            A AngularFrequencyArray view of value.
+        """
+        ...
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["rad/s", "rad/ps"] = "rad/s",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        """Wrap a memory-mapped array without reading it into memory.
+
+        Values already in rad/s are wrapped as a view of the mapping. Other
+        units are scaled chunk by chunk into out.
+
+        Args:
+            source: A .npy file (opened with np.load(mmap_mode=mode)), a raw
+                binary file (opened with np.memmap) or an existing array
+                such as a np.memmap.
+            unit: The unit of the stored values.
+            dtype: Element type of a raw binary file; None follows the
+                global precision policy.
+            mode: Memory-map mode ('r', 'r+', or 'c').
+            shape: Shape of a raw binary file, None for a flat array.
+            offset: Byte offset of the data in a raw binary file.
+            out: Array or .npy path that receives the values in rad/s;
+                required when unit is not "rad/s".
+            chunk_size: Elements scaled per pass.
+
+        Returns:
+            A AngularFrequencyArray backed by the mapping or by out.
+
+        Raises:
+            ValueError: If the dtype is not float32/float64, or unit needs
+                scaling and out is not given.
+        """
+        ...
+
     def __array_finalize__(self, obj) -> None: ...
 
     @property
     def as_rad_s(self) -> NDArray:
-        """Return the angular frequencies in rad/s."""
+        """Return the angular frequencies in rad/s (a view, not a copy)."""
         ...
 
     @property
@@ -313,16 +696,72 @@ class AngularFrequencyArray(np.ndarray):
         """Return the angular frequencies in rad/ps."""
         ...
 
-    def to_wl(self) -> WavelengthArray:
-        """Convert angular frequencies to wavelength array."""
+    def as_unit(
+        self,
+        unit: Literal["rad/s", "rad/ps"],
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        """Return the values in the given unit.
+
+        Args:
+            unit: Target unit ('rad/s' or 'rad/ps').
+            out: Optional preallocated array, or a .npy path to create, to
+                write the result into.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+
+        Returns:
+            The scaled values, written into out when it is given.
+        """
         ...
 
-    def to_freq(self) -> FrequencyArray:
-        """Convert angular frequencies to frequency array."""
+    def to_wl(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavelengthArray:
+        """Convert angular frequencies to wavelength array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
-    def to_wn(self) -> WavenumberArray:
-        """Convert angular frequencies to wavenumber array."""
+    def to_freq(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> FrequencyArray:
+        """Convert angular frequencies to frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
+        ...
+
+    def to_wn(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavenumberArray:
+        """Convert angular frequencies to wavenumber array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
     def to_equally_spaced(self, points: int = 51) -> NDArray:
@@ -332,21 +771,77 @@ class AngularFrequencyArray(np.ndarray):
 class WavenumberArray(np.ndarray):
     """Numpy array wrapper for multiple wavenumber values with unit conversions."""
 
-    def __new__(cls, value: NDArray, unit: Literal["1/cm", "1/m"]) -> Self:
+    def __new__(
+        cls, value: NDArray, unit: Literal["1/cm", "1/m"], dtype=None
+    ) -> Self:
         """Create a new WavenumberArray instance.
 
         Args:
             value: An array of wavenumber values.
             unit: The unit of each wavenumber ('1/cm' or '1/m').
+            dtype: float32/float64 or 'single'/'double'; None follows
+                the global precision policy.
 
         Returns:
             A WavenumberArray object with values in 1/m.
         """
         ...
 
+    @classmethod
+    def from_base(cls, value: NDArray) -> Self:
+        """Wrap an array already in 1/m without copying or unit checks.
+
+        Args:
+            value: Float array of values in 1/m.
+
+        Returns:
+            A WavenumberArray view of value.
+        """
+        ...
+
+    @classmethod
+    def from_memmap(
+        cls,
+        source: NDArray | str | os.PathLike,
+        unit: Literal["1/cm", "1/m"] = "1/m",
+        dtype=None,
+        mode: Literal["r", "r+", "c"] = "r",
+        shape: int | tuple[int, ...] | None = None,
+        offset: int = 0,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        """Wrap a memory-mapped array without reading it into memory.
+
+        Values already in 1/m are wrapped as a view of the mapping. Other
+        units are scaled chunk by chunk into out.
+
+        Args:
+            source: A .npy file (opened with np.load(mmap_mode=mode)), a raw
+                binary file (opened with np.memmap) or an existing array
+                such as a np.memmap.
+            unit: The unit of the stored values.
+            dtype: Element type of a raw binary file; None follows the
+                global precision policy.
+            mode: Memory-map mode ('r', 'r+', or 'c').
+            shape: Shape of a raw binary file, None for a flat array.
+            offset: Byte offset of the data in a raw binary file.
+            out: Array or .npy path that receives the values in 1/m;
+                required when unit is not "1/m".
+            chunk_size: Elements scaled per pass.
+
+        Returns:
+            A WavenumberArray backed by the mapping or by out.
+
+        Raises:
+            ValueError: If the dtype is not float32/float64, or unit needs
+                scaling and out is not given.
+        """
+        ...
+
     @property
     def as_1_m(self) -> NDArray:
-        """Return the wavenumbers in 1/m."""
+        """Return the wavenumbers in 1/m (a view, not a copy)."""
         ...
 
     @property
@@ -359,18 +854,97 @@ class WavenumberArray(np.ndarray):
         """Return the angular wavenumbers (k = 2π/λ)."""
         ...
 
-    def to_wl(self) -> WavelengthArray:
-        """Convert wavenumbers to wavelength array."""
+    def as_unit(
+        self,
+        unit: Literal["1/cm", "1/m", "angular"],
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> NDArray:
+        """Return the values in the given unit.
+
+        Args:
+            unit: Target unit ('1/cm', '1/m', or 'angular' for k = 2π/λ).
+            out: Optional preallocated array, or a .npy path to create, to
+                write the result into.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+
+        Returns:
+            The scaled values, written into out when it is given.
+        """
         ...
 
-    def to_freq(self) -> FrequencyArray:
-        """Convert wavenumbers to frequency array."""
+    def to_wl(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> WavelengthArray:
+        """Convert wavenumbers to wavelength array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
-    def to_omega(self) -> AngularFrequencyArray:
-        """Convert wavenumbers to angular frequency array."""
+    def to_freq(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> FrequencyArray:
+        """Convert wavenumbers to frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
+        ...
+
+    def to_omega(
+        self,
+        out: NDArray | str | os.PathLike | None = None,
+        chunk_size: int | None = None,
+    ) -> AngularFrequencyArray:
+        """Convert wavenumbers to angular frequency array.
+
+        Args:
+            out: Optional preallocated array to write the result into. It
+                may be this array itself to convert in place, or a .npy path
+                to create as a memory-mapped result.
+            chunk_size: Process this many elements per pass, bounding the
+                temporaries when converting memory-mapped data.
+        """
         ...
 
     def to_equally_spaced(self, points: int = 51) -> NDArray:
         """Convert to equally spaced array."""
-        ...
\ No newline at end of file
+        ...
+
+def parse_array(
+    values: NDArray | list[str], dtype=None
+) -> WavelengthArray | FrequencyArray | AngularFrequencyArray | WavenumberArray:
+    """Parse strings such as "1550 nm" or "193.4 THz" into a unit-aware array.
+
+    Values and units must be separated by whitespace. Units may differ
+    between entries but must all belong to one quantity. Parsing runs as
+    vectorized NumPy string operations, without a Python object per entry.
+
+    Args:
+        values: Array or list of strings, any shape.
+        dtype: Float type of the result; None follows the precision policy.
+
+    Returns:
+        The *Array type matching the units, in base units, with the shape
+        of values.
+
+    Raises:
+        ValueError: If a unit is unknown, units of different quantities are
+            mixed, a value cannot be parsed or values is empty.
+    """
+    ...
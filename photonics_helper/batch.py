@@ -0,0 +1,216 @@
+from .base import Wavelength, WavelengthArray
+from .fiber import Dispersion
+
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+)
+from numpy.typing import NDArray
+
+import math
+import os
+import warnings
+import numpy as np
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+# Shared block layout, all float64 and concatenated over the sweeps:
+#   [neff | wavelengths (m) | dispersion (s/m^2)]
+_FIELDS = 3
+
+# Blocks attached by this worker process, keyed by name
+_ATTACHED: Dict[str, "SharedMemory"] = {}
+
+
+def _attach(name: str) -> "SharedMemory":
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        try:
+            # The parent owns the block; workers must not unlink it on exit.
+            shm = SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13
+            shm = SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    return shm
+
+
+def _build_items(
+    table: NDArray,
+    items: Sequence[Tuple[int, int, int, float]],
+    method: str,
+    ignore_fit_error: bool,
+) -> List[Exception | None]:
+    neff, wl, out = table
+    errors = []
+    for _, start, stop, central_wavelength_nm in items:
+        part = slice(start, stop)
+        try:
+            with warnings.catch_warnings():
+                # A bad fit is reported through the returned error instead
+                warnings.simplefilter("ignore")
+                dispersion = Dispersion.from_neff(
+                    neff[part],
+                    WavelengthArray.from_base(wl[part]),
+                    central_wavelength_nm,
+                    ignore_fit_error=ignore_fit_error,
+                    method=method,
+                )
+            out[part] = dispersion._values
+            errors.append(None)
+        except Exception as error:
+            errors.append(error)
+    return errors
+
+
+def _build_chunk(
+    name: str,
+    size: int,
+    items: Sequence[Tuple[int, int, int, float]],
+    method: str,
+    ignore_fit_error: bool,
+) -> List[Exception | None]:
+    shm = _attach(name)
+    table = np.ndarray((_FIELDS, size), dtype=float, buffer=shm.buf)
+    return _build_items(table, items, method, ignore_fit_error)
+
+
+class DispersionBatch:
+    def __init__(
+        self, results: List[Dispersion | None], errors: Dict[int, Exception]
+    ) -> None:
+        self._results = results
+        self._errors = errors
+
+    def __repr__(self):
+        return (
+            f"DispersionBatch: {len(self._results)} sweeps, {len(self._errors)} failed"
+        )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __getitem__(self, index: int) -> Dispersion | None:
+        return self._results[index]
+
+    def __iter__(self) -> Iterator[Dispersion | None]:
+        return iter(self._results)
+
+    @property
+    def results(self) -> List[Dispersion | None]:
+        return self._results
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        return self._errors
+
+    @property
+    def failed(self) -> List[int]:
+        return sorted(self._errors)
+
+    @property
+    def succeeded(self) -> List[int]:
+        return [i for i, result in enumerate(self._results) if result is not None]
+
+
+def build_dispersions(
+    sweeps: Iterable[Tuple[NDArray, WavelengthArray]],
+    central_wavelength_nm: float | Sequence[float],
+    method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+    ignore_fit_error: bool = False,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> DispersionBatch:
+    sweeps = list(sweeps)
+    count = len(sweeps)
+    if np.ndim(central_wavelength_nm) == 0:
+        centrals = [float(central_wavelength_nm)] * count
+    else:
+        centrals = [float(c) for c in central_wavelength_nm]
+        if len(centrals) != count:
+            raise ValueError("central_wavelength_nm needs one value per sweep")
+
+    # Invalid sweeps are recorded up front and never sent to a worker
+    errors: Dict[int, Exception] = {}
+    items = []
+    start = 0
+    for index, (neff, wavelengths) in enumerate(sweeps):
+        if not isinstance(wavelengths, WavelengthArray):
+            errors[index] = TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+            continue
+        if len(neff) != len(wavelengths):
+            errors[index] = ValueError(
+                "Length of both neff and wavelengths should be same"
+            )
+            continue
+        items.append((index, start, start + len(neff), centrals[index]))
+        start += len(neff)
+    size = start
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize is None:
+        # A few chunks per worker balances uneven fits without many round trips
+        chunksize = max(1, math.ceil(len(items) / (4 * workers)))
+    elif chunksize < 1:
+        raise ValueError("chunksize should be a positive integer")
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+
+    shm = None
+    if workers == 1 or len(chunks) <= 1:
+        table = np.empty((_FIELDS, size))
+    else:
+        # Imported here: multiprocessing is slow to load and only needed for pools
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(create=True, size=max(_FIELDS * size * 8, 1))
+        table = np.ndarray((_FIELDS, size), dtype=float, buffer=shm.buf)
+
+    try:
+        for index, begin, end, _ in items:
+            neff, wavelengths = sweeps[index]
+            table[0, begin:end] = neff
+            table[1, begin:end] = wavelengths.as_m
+
+        if shm is None:
+            outcomes = _build_items(table, items, method, ignore_fit_error)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _build_chunk, shm.name, size, chunk, method, ignore_fit_error
+                    )
+                    for chunk in chunks
+                ]
+                outcomes = [error for f in futures for error in f.result()]
+
+        results: List[Dispersion | None] = [None] * count
+        for (index, begin, end, central), error in zip(items, outcomes):
+            if error is not None:
+                errors[index] = error
+                continue
+            wavelengths = sweeps[index][1]
+            results[index] = Dispersion(
+                wavelengths=wavelengths,
+                values=table[2, begin:end].copy(),
+                unit="s/m^2",
+                central_wavelength=Wavelength(central, "nm"),
+            )
+    finally:
+        if shm is not None:
+            del table
+            shm.close()
+            shm.unlink()
+
+    return DispersionBatch(results, dict(sorted(errors.items())))
@@ -0,0 +1,79 @@
+from typing import Dict, Iterable, Iterator, List, Literal, Sequence, Tuple
+from numpy.typing import NDArray
+
+from .base import WavelengthArray
+from .fiber import Dispersion
+
+class DispersionBatch:
+    """Results of build_dispersions, in submission order.
+
+    Failed sweeps hold None in results and their exception in errors, so one
+    bad fit never discards the rest of the batch.
+    """
+
+    def __init__(
+        self, results: List[Dispersion | None], errors: Dict[int, Exception]
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Dispersion | None:
+        """Dispersion of sweep index, or None if it failed."""
+        ...
+
+    def __iter__(self) -> Iterator[Dispersion | None]: ...
+    @property
+    def results(self) -> List[Dispersion | None]:
+        """One Dispersion (or None on failure) per submitted sweep."""
+        ...
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        """Exception raised for each failed sweep, keyed by sweep index."""
+        ...
+
+    @property
+    def failed(self) -> List[int]:
+        """Indices of the failed sweeps."""
+        ...
+
+    @property
+    def succeeded(self) -> List[int]:
+        """Indices of the sweeps that produced a Dispersion."""
+        ...
+
+def build_dispersions(
+    sweeps: Iterable[Tuple[NDArray, WavelengthArray]],
+    central_wavelength_nm: float | Sequence[float],
+    method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+    ignore_fit_error: bool = False,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> DispersionBatch:
+    """
+    Build Dispersion.from_neff for many (neff, wavelengths) sweeps in parallel.
+
+    All sweeps are packed into one shared memory block (neff, wavelengths and
+    the output dispersion), so workers receive only offsets and write their
+    results in place; no large array is pickled in either direction. Sweeps
+    are scheduled in chunks over a process pool. Errors such as the
+    ChildProcessError of a bad fit are collected per sweep instead of
+    aborting the batch.
+
+    Args:
+        sweeps: Pairs of effective index values and their wavelengths
+        central_wavelength_nm: Central wavelength in nanometers, one for all
+            sweeps or one per sweep
+        method: Differentiation method, see Dispersion.from_neff
+        ignore_fit_error: Keep bad fits instead of recording them as errors
+        workers: Number of worker processes, defaults to the CPU count;
+            1 builds serially in this process
+        chunksize: Sweeps per task, defaults to about four tasks per worker
+
+    Returns:
+        DispersionBatch with results in submission order
+
+    Raises:
+        ValueError: If central_wavelength_nm has the wrong length or
+            chunksize is not positive
+    """
+    ...
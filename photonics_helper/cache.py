@@ -0,0 +1,244 @@
+from .base import WavelengthArray, resolve_dtype
+from .materials import RefractiveIndex
+from .sellmeier import _as_coefficient_tables
+from ._interp import spline_from_tck
+from . import instrument
+
+from os import PathLike
+from pathlib import Path
+from typing import List, Literal, Tuple
+
+import hashlib
+import os
+import tempfile
+import numpy as np
+
+# Bump when the on-disk layout below changes so stale entries are not read.
+LAYOUT_VERSION = 3
+
+# Entry layout: one float64 .npy file, so np.load(mmap_mode="r") shares pages
+# between processes. itemsize is that of the RefractiveIndex dtype (4 for
+# float32 entries, whose values are stored exactly as float64). form is 0
+# for a tabulated index and 1 or 2 for a standard or alt Sellmeier one, whose
+# A0, A and B (terms values each) are kept for its closed-form derivatives.
+#   header: [version, points, len(t_n), len(c_n), k_n, len(t_k), len(c_k), k_k,
+#            itemsize, form, terms]
+#   body:   wl (m), n, k, t_n, c_n, t_k, c_k, A0, A, B
+_HEADER_SIZE = 11
+
+_FORMS = (None, "standard", "alt")
+
+# Only files named <_PREFIX><key>.npy belong to the cache; anything else in
+# the directory is never read, evicted or cleared.
+_PREFIX = "photonics-"
+
+
+def _default_directory() -> Path:
+    env = os.environ.get("PHOTONICS_HELPER_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path.home() / ".cache" / "photonics_helper"
+
+
+class MaterialCache:
+    def __init__(
+        self,
+        directory: str | PathLike | None = None,
+        max_bytes: int = 512 * 2**20,
+    ) -> None:
+        self._directory = (
+            Path(directory) if directory is not None else _default_directory()
+        )
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def __repr__(self) -> str:
+        return f"MaterialCache: {self._directory} ({self.size()} of {self._max_bytes} bytes)"
+
+    @staticmethod
+    def key(
+        form: Literal["standard", "alt"],
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wl_from_to_in_um: Tuple[float, float],
+        n_points: int,
+        dtype=None,
+    ) -> str:
+        A, B = _as_coefficient_tables(A, B)
+        dtype = resolve_dtype(dtype)
+        digest = hashlib.sha256()
+        digest.update(
+            f"v{LAYOUT_VERSION}:{form}:{A.shape}:{n_points}:{dtype.name}:".encode()
+        )
+        for values in (np.asarray(A0, dtype=float), A, B):
+            digest.update(np.ascontiguousarray(values, dtype="<f8").tobytes())
+        digest.update(np.asarray(wl_from_to_in_um, dtype="<f8").tobytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{_PREFIX}{key}.npy"
+
+    def get(self, key: str) -> RefractiveIndex | None:
+        index = self._read(key)
+        if instrument.enabled:
+            hit = "hits" if index is not None else "misses"
+            instrument.count(f"cache.{hit}")
+        return index
+
+    def _read(self, key: str) -> RefractiveIndex | None:
+        path = self._path(key)
+        try:
+            data = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.ndim != 1 or data.size < _HEADER_SIZE or data[0] != LAYOUT_VERSION:
+            return None
+
+        points, nt_n, nc_n, k_n, nt_k, nc_k, k_k, itemsize, form, terms = (
+            int(v) for v in data[1:_HEADER_SIZE]
+        )
+        sizes = [points, points, points, nt_n, nc_n, nt_k, nc_k]
+        sizes += [1 if form else 0, terms, terms]
+        if data.size != _HEADER_SIZE + sum(sizes):
+            return None
+        offsets = np.cumsum([_HEADER_SIZE] + sizes)
+        wl, n, k, t_n, c_n, t_k, c_k, A0, A, B = (
+            data[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])
+        )
+
+        # float64 entries stay memory-mapped; float32 ones are cast back
+        dtype = np.float32 if itemsize == 4 else np.float64
+        index = RefractiveIndex(n=n, k=k, wl=WavelengthArray.from_base(wl), dtype=dtype)
+        index._splines["n"] = spline_from_tck(t_n, c_n, k_n)
+        index._splines["k"] = spline_from_tck(t_k, c_k, k_k)
+        if form:
+            index._sellmeier = (float(A0[0]), A.tolist(), B.tolist(), _FORMS[form])
+        # Refresh the access time used for least-recently-used eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return index
+
+    def put(self, key: str, index: RefractiveIndex) -> None:
+        spline_n = index._spline("n")
+        spline_k = index._spline("k")
+        wl = np.asarray(index.wl, dtype=float)
+        if index._sellmeier is not None:
+            A0, A, B, form = index._sellmeier
+            A, B = _as_coefficient_tables(A, B)
+            coefficients = [np.asarray(A0, dtype=float).reshape(-1), A[0], B[0]]
+        else:
+            form = None
+            coefficients = [np.empty(0)] * 3
+        header = [
+            LAYOUT_VERSION,
+            wl.size,
+            spline_n.t.size,
+            spline_n.c.size,
+            spline_n.k,
+            spline_k.t.size,
+            spline_k.c.size,
+            spline_k.k,
+            index.dtype.itemsize,
+            _FORMS.index(form),
+            coefficients[1].size,
+        ]
+        data = np.concatenate(
+            [
+                np.asarray(header, dtype=float),
+                wl,
+                np.asarray(index.n, dtype=float),
+                np.asarray(index.k, dtype=float),
+                spline_n.t,
+                spline_n.c,
+                spline_k.t,
+                spline_k.c,
+                *coefficients,
+            ]
+        )
+
+        # Write to a temporary file and rename it so that concurrent readers
+        # never map a half-written entry.
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=_PREFIX, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, data)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict(keep=key)
+
+    def sellmeier(
+        self,
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wl_from_to_in_um: Tuple[float, float],
+        n_points: int = 200,
+        form: Literal["standard", "alt"] = "standard",
+        dtype=None,
+    ) -> RefractiveIndex:
+        if form not in ("standard", "alt"):
+            raise ValueError(f"Unsupported form: {form} use 'standard' or 'alt'")
+        # Resolved once, so the key and a built index follow the same policy
+        dtype = resolve_dtype(dtype)
+        key = self.key(form, A0, A, B, wl_from_to_in_um, n_points, dtype)
+        index = self.get(key)
+        if index is not None:
+            return index
+
+        if form == "standard":
+            index = RefractiveIndex.from_sellmeier(
+                A0=A0,
+                A=A,
+                B=B,
+                wl_from_to_in_um=wl_from_to_in_um,
+                n_points=n_points,
+                dtype=dtype,
+            )
+        else:
+            index = RefractiveIndex.from_alt_sellmeier(
+                A0=A0,
+                A=A,
+                B=B,
+                wl_from_to_in_um=wl_from_to_in_um,
+                n_points=n_points,
+                dtype=dtype,
+            )
+        self.put(key, index)
+        return index
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self._directory.glob(f"{_PREFIX}*.npy"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                pass
+        return entries
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self, keep: str | None = None) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        kept = self._path(keep) if keep is not None else None
+        for path, stat in entries:
+            if total <= self._max_bytes:
+                break
+            if path == kept:
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def clear(self) -> None:
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
@@ -0,0 +1,125 @@
+from os import PathLike
+from pathlib import Path
+from typing import List, Literal, Tuple
+
+from .materials import RefractiveIndex
+
+LAYOUT_VERSION: int
+
+class MaterialCache:
+    """On-disk cache of precomputed refractive index tables.
+
+    Each entry holds the wavelength grid, n, k and the fitted spline
+    knots/coefficients for n and k in a single float64 .npy file, plus the
+    Sellmeier coefficients of indices built from them, so that group_index,
+    gvd and group_velocity stay closed form on a cache hit. Entries are
+    opened with np.load(mmap_mode="r"), so worker processes on one node share
+    the same pages and start without refitting any spline. Writes are atomic
+    and the directory is kept under max_bytes by evicting the least recently
+    used entries. Entry files are named photonics-<key>.npy. Only those are
+    counted, evicted or cleared, so the directory may be shared with other
+    files.
+
+    The directory defaults to $PHOTONICS_HELPER_CACHE_DIR, or
+    ~/.cache/photonics_helper when that is not set.
+    """
+
+    def __init__(
+        self,
+        directory: str | PathLike | None = None,
+        max_bytes: int = 512 * 2**20,
+    ) -> None:
+        """Open (and create if needed) a cache directory.
+
+        Args:
+            directory: Cache directory, see the class docstring for the default
+            max_bytes: Size limit of all entries together, in bytes
+        """
+        ...
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the cache entries."""
+        ...
+
+    def __repr__(self) -> str: ...
+    @staticmethod
+    def key(
+        form: Literal["standard", "alt"],
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wl_from_to_in_um: Tuple[float, float],
+        n_points: int,
+        dtype=None,
+    ) -> str:
+        """Hash the Sellmeier coefficients, grid parameters and dtype into a cache key.
+
+        dtype None follows the global precision policy, so the same call gives
+        different keys under precision("single") and precision("double").
+        """
+        ...
+
+    def get(self, key: str) -> RefractiveIndex | None:
+        """Load an entry as a memory-mapped RefractiveIndex with fitted splines.
+
+        Returns:
+            The cached RefractiveIndex, or None if the key is missing or the
+            entry was written with another layout version
+        """
+        ...
+
+    def put(self, key: str, index: RefractiveIndex) -> None:
+        """Store a RefractiveIndex and its n and k splines under key.
+
+        Fits the splines first if the index has not done so yet, then evicts
+        old entries if the cache grew beyond max_bytes.
+        """
+        ...
+
+    def sellmeier(
+        self,
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wl_from_to_in_um: Tuple[float, float],
+        n_points: int = 200,
+        form: Literal["standard", "alt"] = "standard",
+        dtype=None,
+    ) -> RefractiveIndex:
+        """Cached equivalent of RefractiveIndex.from_sellmeier / from_alt_sellmeier.
+
+        Args:
+            A0: Offset coefficient
+            A: List of amplitude coefficients
+            B: List of wavelength coefficients
+            wl_from_to_in_um: Tuple of (min, max) wavelength in micrometers
+            n_points: Number of points to generate
+            form: 'standard' for from_sellmeier, 'alt' for from_alt_sellmeier
+            dtype: float32/float64 or 'single'/'double'; None follows the
+                global precision policy. Hits and misses return the same dtype
+
+        Returns:
+            RefractiveIndex loaded from the cache, or built and stored on a miss
+
+        Raises:
+            ValueError: If A and B lists have different lengths or form is unknown
+        """
+        ...
+
+    def size(self) -> int:
+        """Total size of all cache entries in bytes."""
+        ...
+
+    def evict(self, keep: str | None = None) -> None:
+        """Remove least recently used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Key of an entry that is never removed, such as the one
+                just written
+        """
+        ...
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        ...
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Literal
+from numpy.typing import NDArray
+
+import numpy as np
+
+from . import instrument
+from .base import (
+    C_MS,
+    PI,
+    UNIT_FACTORS,
+    AngularFrequency,
+    AngularFrequencyArray,
+    Frequency,
+    FrequencyArray,
+    Wavelength,
+    WavelengthArray,
+    Wavenumber,
+    WavenumberArray,
+    _unit_factor,
+)
+
+# Every domain value is k * wavelength**power in base units, so any hop between
+# two domains is either a linear scale (same power) or a reciprocal.
+# name: (scalar class, array class, base unit, k, power)
+_DOMAINS = {
+    "wavelength": (Wavelength, WavelengthArray, "m", 1.0, 1),
+    "frequency": (Frequency, FrequencyArray, "Hz", C_MS, -1),
+    "angular frequency": (
+        AngularFrequency,
+        AngularFrequencyArray,
+        "rad/s",
+        2 * PI * C_MS,
+        -1,
+    ),
+    "wavenumber": (Wavenumber, WavenumberArray, "1/m", 1.0, -1),
+}
+
+_DOMAIN_OF_TYPE = {}
+for _name, (_scalar, _array, *_) in _DOMAINS.items():
+    _DOMAIN_OF_TYPE[_scalar] = _name
+    _DOMAIN_OF_TYPE[_array] = _name
+
+
+def _domain(cls: type) -> str:
+    for klass in cls.__mro__:
+        if klass in _DOMAIN_OF_TYPE:
+            return _DOMAIN_OF_TYPE[klass]
+    raise TypeError(
+        f"cannot convert the type: {cls}, required one of "
+        + ", ".join(k.__name__ for k in _DOMAIN_OF_TYPE)
+    )
+
+
+class ConversionPlan:
+    __slots__ = ("kind", "factor")
+
+    def __init__(self, kind: Literal["scale", "reciprocal"], factor: float) -> None:
+        self.kind = kind
+        self.factor = factor
+
+    def __repr__(self) -> str:
+        if self.kind == "scale":
+            return f"ConversionPlan({self.factor!r} * x)"
+        return f"ConversionPlan({self.factor!r} / x)"
+
+    def __call__(self, values: float | NDArray, out: NDArray | None = None):
+        if isinstance(values, np.ndarray) or out is not None:
+            values = np.asarray(values).view(np.ndarray)
+            if self.kind == "scale":
+                return np.multiply(values, self.factor, out=out)
+            return np.divide(self.factor, values, out=out)
+        if self.kind == "scale":
+            return self.factor * values
+        return self.factor / values
+
+
+@lru_cache(maxsize=None)
+def plan_conversion(
+    source: type, source_unit: str, target: type, target_unit: str
+) -> ConversionPlan:
+    source_domain = _domain(source)
+    target_domain = _domain(target)
+    _, _, _, k_s, p_s = _DOMAINS[source_domain]
+    _, target_array, _, k_t, p_t = _DOMAINS[target_domain]
+
+    u_s = _unit_factor(UNIT_FACTORS[source_domain], source_unit)
+    u_t = _unit_factor(target_array._AS_FACTORS, target_unit)
+
+    if p_s == p_t:
+        return ConversionPlan("scale", k_t / k_s * u_s * u_t)
+    return ConversionPlan("reciprocal", k_t * k_s * u_t / u_s)
+
+
+def convert(value, target: type, out: NDArray | None = None):
+    source_domain = _domain(type(value))
+    target_domain = _domain(target)
+    scalar_cls, array_cls, base_unit, _, _ = _DOMAINS[target_domain]
+    plan = plan_conversion(type(value), _DOMAINS[source_domain][2], target, base_unit)
+    if instrument.enabled:
+        instrument.count("convert.conversions")
+        instrument.count("convert.elements", np.size(value))
+
+    if isinstance(value, np.ndarray):
+        return array_cls.from_base(plan(value, out=out))
+    if out is not None:
+        raise ValueError("out is only supported for array values")
+    return scalar_cls.from_base(plan(float(value)))
@@ -0,0 +1,102 @@
+from typing import Literal, TypeVar, overload
+from numpy.typing import NDArray
+
+from .base import (
+    AngularFrequency,
+    AngularFrequencyArray,
+    Frequency,
+    FrequencyArray,
+    Wavelength,
+    WavelengthArray,
+    Wavenumber,
+    WavenumberArray,
+)
+
+_Scalar = Wavelength | Frequency | AngularFrequency | Wavenumber
+_Array = WavelengthArray | FrequencyArray | AngularFrequencyArray | WavenumberArray
+_T = TypeVar("_T")
+
+class ConversionPlan:
+    """A fused conversion kernel: either ``factor * x`` or ``factor / x``.
+
+    Attributes:
+        kind: 'scale' for factor * x, 'reciprocal' for factor / x.
+        factor: The collapsed constant of the whole conversion chain.
+    """
+
+    kind: Literal["scale", "reciprocal"]
+    factor: float
+
+    def __init__(self, kind: Literal["scale", "reciprocal"], factor: float) -> None: ...
+    def __repr__(self) -> str: ...
+    @overload
+    def __call__(self, values: float, out: None = None) -> float: ...
+    @overload
+    def __call__(self, values: NDArray, out: NDArray | None = None) -> NDArray:
+        """Apply the kernel to raw numbers in the source unit.
+
+        Args:
+            values: A float or array of values in the source unit.
+            out: Optional preallocated array to write the result into.
+
+        Returns:
+            Values in the target unit, as a float for float input or a plain
+            array otherwise. Arrays are converted in a single pass.
+        """
+        ...
+
+def plan_conversion(
+    source: type[_Scalar] | type[_Array],
+    source_unit: str,
+    target: type[_Scalar] | type[_Array],
+    target_unit: str,
+) -> ConversionPlan:
+    """Collapse a conversion between two domains and units into one kernel.
+
+    The plan gives the same result as
+    ``Source(x, source_unit).to_<target>().as_<target_unit>`` without
+    building intermediate objects. Scalar and *Array classes of the same
+    domain are interchangeable. Plans are cached.
+
+    Args:
+        source: Source class, e.g. Wavelength or WavelengthArray.
+        source_unit: Unit of the input values, as accepted by the source
+            constructor (e.g. 'nm').
+        target: Target class, e.g. AngularFrequency.
+        target_unit: Unit of the output values, as returned by the target
+            accessors (e.g. 'rad/ps', or 'angular' for wavenumbers).
+
+    Returns:
+        The cached ConversionPlan.
+
+    Raises:
+        TypeError: If source or target is not one of the domain classes.
+        ValueError: If a unit is not supported by its domain.
+    """
+    ...
+
+@overload
+def convert(value: _Scalar, target: type[_Scalar] | type[_Array]) -> _Scalar: ...
+@overload
+def convert(
+    value: _Array, target: type[_Scalar] | type[_Array], out: NDArray | None = None
+) -> _Array:
+    """Convert a domain object to another domain in a single pass.
+
+    Scalars give the target scalar class and arrays give the target *Array
+    class, whichever of the two is passed as target.
+
+    Args:
+        value: Wavelength, Frequency, AngularFrequency or Wavenumber object,
+            scalar or array.
+        target: Class of the target domain.
+        out: Optional preallocated array, only for array values.
+
+    Returns:
+        The converted object.
+
+    Raises:
+        TypeError: If value or target is not one of the domain classes.
+        ValueError: If out is given for a scalar value.
+    """
+    ...
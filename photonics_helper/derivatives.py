@@ -0,0 +1,138 @@
+from .base import C_MS, PI, WavelengthArray
+from ._interp import make_splrep
+
+from typing import Literal, Tuple
+from numpy.typing import NDArray
+
+import math
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def stencil_weights(offsets: NDArray, deriv: int) -> NDArray:
+    # Weights w with sum(w_j * s_j**m) = m! * (m == deriv) for m < len(offsets)
+    offsets = np.asarray(offsets, dtype=float)
+    points = offsets.size
+    if deriv >= points:
+        raise ValueError(f"need more than {deriv} points for derivative {deriv}")
+    vander = np.vander(offsets, points, increasing=True).T
+    rhs = np.zeros(points)
+    rhs[deriv] = math.factorial(deriv)
+    return np.linalg.solve(vander, rhs)
+
+
+def is_uniform(x: NDArray, rtol: float = 1e-6) -> bool:
+    x = np.asarray(x)
+    if x.ndim != 1 or x.size < 3:
+        return False
+    step = np.diff(x)
+    return bool(np.all(np.abs(step - step[0]) <= rtol * abs(step[0])))
+
+
+def uniform_derivative(
+    y: NDArray, dx: float, deriv: int = 1, accuracy: int = 4, axis: int = -1
+) -> NDArray:
+    if accuracy < 2 or accuracy % 2:
+        raise ValueError("accuracy should be an even integer of at least 2")
+    points = 2 * ((deriv + 1) // 2) - 1 + accuracy
+    half = points // 2
+
+    y = np.moveaxis(np.asarray(y, dtype=float), axis, -1)
+    n = y.shape[-1]
+    if n < points:
+        raise ValueError(
+            f"derivative {deriv} at accuracy {accuracy} needs at least {points} samples"
+        )
+
+    out = np.empty_like(y)
+    central = stencil_weights(np.arange(-half, half + 1), deriv)
+    out[..., half : n - half] = sliding_window_view(y, points, axis=-1) @ central
+
+    # Edges use one-sided stencils of the same width
+    left, right = y[..., :points], y[..., n - points :]
+    for i in range(half):
+        out[..., i] = left @ stencil_weights(np.arange(points) - i, deriv)
+        j = points - 1 - i
+        out[..., n - 1 - i] = right @ stencil_weights(np.arange(points) - j, deriv)
+
+    out /= dx**deriv
+    return np.moveaxis(out, -1, axis)
+
+
+def savgol_derivative(
+    y: NDArray,
+    dx: float,
+    deriv: int = 1,
+    window: int = 11,
+    polyorder: int = 4,
+    axis: int = -1,
+) -> NDArray:
+    from scipy.signal import savgol_filter
+
+    return savgol_filter(
+        np.asarray(y, dtype=float),
+        window_length=window,
+        polyorder=polyorder,
+        deriv=deriv,
+        delta=dx,
+        axis=axis,
+        mode="interp",
+    )
+
+
+def _spline_second_derivative(y: NDArray, wavelengths: WavelengthArray) -> NDArray:
+    # Resample on an equally spaced grid, refit and differentiate. This is the
+    # historical Dispersion.from_neff path, kept for non-uniform grids.
+    wl = wavelengths.as_m
+    wl_eq = wavelengths.to_equally_spaced()
+
+    def second_derivative(values: NDArray) -> NDArray:
+        interp = make_splrep(wl, values)(wl_eq)
+        return make_splrep(wl_eq, interp).derivative(2)(wl)
+
+    return np.apply_along_axis(second_derivative, -1, y)
+
+
+def dispersion_from_neff(
+    neff: NDArray,
+    wavelengths: WavelengthArray,
+    method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+    accuracy: int = 4,
+    window: int = 11,
+    polyorder: int = 4,
+) -> Tuple[NDArray, NDArray]:
+    if not isinstance(wavelengths, WavelengthArray):
+        raise TypeError(
+            f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+        )
+    # Differences of nearly equal numbers: always work in float64
+    neff = np.asarray(neff, dtype=float)
+    wl = wavelengths.as_m.astype(float, copy=False)
+    if neff.shape[-1] != wl.size:
+        raise ValueError("Length of both neff and wavelengths should be same")
+
+    uniform = is_uniform(wl)
+    if method == "auto":
+        method = "finite_difference" if uniform else "spline"
+
+    if method == "spline":
+        d2n = _spline_second_derivative(neff, wavelengths)
+    elif method in ("finite_difference", "savgol"):
+        if not uniform:
+            raise ValueError(f"method '{method}' needs equally spaced wavelengths")
+        dx = wl[1] - wl[0]
+        if method == "finite_difference":
+            d2n = uniform_derivative(neff, dx, deriv=2, accuracy=accuracy)
+        else:
+            d2n = savgol_derivative(
+                neff, dx, deriv=2, window=window, polyorder=polyorder
+            )
+    else:
+        raise ValueError(
+            f"Unsupported method: {method} use 'auto', 'finite_difference', 'savgol' or 'spline'"
+        )
+
+    # D = -lambda / c * d2n/dlambda2, beta2 = -lambda^2 / (2 pi c) * D
+    dispersion = -wl / C_MS * d2n
+    beta2 = wl**3 / (2 * PI * C_MS**2) * d2n
+    return dispersion, beta2
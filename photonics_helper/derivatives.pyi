@@ -0,0 +1,107 @@
+from typing import Literal, Tuple
+from numpy.typing import NDArray
+
+from .base import WavelengthArray
+
+def stencil_weights(offsets: NDArray, deriv: int) -> NDArray:
+    """Finite difference weights for a derivative on arbitrary sample offsets.
+
+    Args:
+        offsets: Sample positions relative to the evaluation point, in steps
+        deriv: Order of the derivative
+
+    Returns:
+        Weights w such that Σ w_j f(x + s_j h) / h^deriv ≈ f^(deriv)(x)
+
+    Raises:
+        ValueError: If there are not more offsets than the derivative order
+    """
+    ...
+
+def is_uniform(x: NDArray, rtol: float = 1e-6) -> bool:
+    """Check whether a 1D grid is equally spaced (within rtol of the first step)."""
+    ...
+
+def uniform_derivative(
+    y: NDArray, dx: float, deriv: int = 1, accuracy: int = 4, axis: int = -1
+) -> NDArray:
+    """Differentiate samples on an equally spaced grid with high-order stencils.
+
+    Interior points use central stencils of the given accuracy order, the
+    first and last few points use one-sided stencils of the same width.
+    Works along any axis of an N-dimensional array in one vectorized pass.
+
+    Args:
+        y: Samples, equally spaced along axis
+        dx: Grid step
+        deriv: Order of the derivative
+        accuracy: Even accuracy order of the central stencil
+        axis: Axis along which to differentiate
+
+    Returns:
+        Derivative with the shape of y
+
+    Raises:
+        ValueError: If accuracy is not even and at least 2, or there are too
+            few samples for the stencil
+    """
+    ...
+
+def savgol_derivative(
+    y: NDArray,
+    dx: float,
+    deriv: int = 1,
+    window: int = 11,
+    polyorder: int = 4,
+    axis: int = -1,
+) -> NDArray:
+    """Differentiate noisy equally spaced samples with a Savitzky–Golay filter.
+
+    Args:
+        y: Samples, equally spaced along axis
+        dx: Grid step
+        deriv: Order of the derivative
+        window: Odd filter window length in samples
+        polyorder: Order of the local polynomial fit
+        axis: Axis along which to differentiate
+
+    Returns:
+        Smoothed derivative with the shape of y
+    """
+    ...
+
+def dispersion_from_neff(
+    neff: NDArray,
+    wavelengths: WavelengthArray,
+    method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+    accuracy: int = 4,
+    window: int = 11,
+    polyorder: int = 4,
+) -> Tuple[NDArray, NDArray]:
+    """Compute D and β₂ from neff in one pass.
+
+    D = -λ/c * d²neff/dλ² and β₂ = λ³/(2πc²) * d²neff/dλ².
+
+    Methods:
+        finite_difference: high-order stencils, needs equally spaced wavelengths
+        savgol: Savitzky–Golay derivative, needs equally spaced wavelengths
+        spline: resample and refit a spline, works on any grid
+        auto: finite_difference on equally spaced grids, spline otherwise
+
+    Args:
+        neff: Effective index, 1D or with wavelengths along the last axis
+        wavelengths: Corresponding wavelength array
+        method: Differentiation method
+        accuracy: Stencil accuracy order for finite_difference
+        window: Window length for savgol
+        polyorder: Polynomial order for savgol
+
+    Returns:
+        (D in s/m², β₂ in s²/m), each with the shape of neff
+
+    Raises:
+        TypeError: If wavelengths is not a WavelengthArray
+        ValueError: If the lengths differ, the method is unknown, or a
+            uniform-grid method is used on an uneven grid
+    """
+    ...
@@ -4,18 +4,22 @@ from photonics_helper.base import (
     AngularFrequencyArray,
     Wavelength,
     WavelengthArray,
+    _grid_limits,
+    resolve_dtype,
 )
 from photonics_helper.looks import c_info
+from photonics_helper import instrument
+from photonics_helper._interp import make_interp_spline, make_splrep
+from photonics_helper.derivatives import dispersion_from_neff, is_uniform
+from photonics_helper.lazy import LazyArray
+from photonics_helper.sellmeier import sellmeier_derivatives
 
 from numpy.typing import NDArray
-from typing import Literal, Self
+from typing import List, Literal, Self
 
+import math
 import warnings
 import numpy as np
-from scipy.interpolate import make_splrep
-from rich.traceback import install
-
-install()
 
 
 class Dispersion:
@@ -25,14 +29,21 @@ class Dispersion:
         values: NDArray,
         unit: Literal["ps/nm.km", "s/m^2"],
         central_wavelength: Wavelength,
+        dtype=None,
     ):
+        # Without an explicit dtype the precision of the wavelengths is kept
+        if dtype is None:
+            dtype = wavelengths.dtype
+        self._dtype = resolve_dtype(dtype)
+        values = np.asarray(values, dtype=self._dtype)
         if unit == "ps/nm.km":
             values = values * 1e-6  # (12-9+3)
         elif unit == "s/m^2":
             pass
         self._values = values
-        self._wavelengths = wavelengths
+        self._wavelengths = wavelengths.astype(self._dtype, copy=False)
         self._unit = "s/m^2"
+        self.clear_cache()
 
     def __repr__(self):
         return f"Dispersion: from wl: {self._wavelengths.min()} to {self._wavelengths.max()}"
@@ -45,43 +56,109 @@ class Dispersion:
     def as_s_m_m(self) -> NDArray:
         return self._values
 
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
     def get_wl(self) -> WavelengthArray:
         return self._wavelengths
 
+    def clear_cache(self):
+        # Fitted splines and wavelength bounds are derived from the data, so
+        # they must be rebuilt whenever the arrays are modified in place.
+        self._splines = {}
+        wl_min, wl_max = _grid_limits(self._wavelengths.as_m, self._dtype)
+        self._limits = {
+            "m": (wl_min, wl_max),
+            "um": (wl_min * 1e6, wl_max * 1e6),
+            "nm": (wl_min * 1e9, wl_max * 1e9),
+        }
+
+    def _spline(
+        self,
+        quantity: Literal["s/m^2", "ps/nm.km", "beta2"],
+        unit: Literal["nm", "m"],
+    ):
+        key = (quantity, unit)
+        spline = self._splines.get(key)
+        if instrument.enabled:
+            hit = "hits" if spline is not None else "misses"
+            instrument.count(f"fiber.spline_cache.{hit}")
+        if spline is None:
+            if unit == "m":
+                x = self._wavelengths.as_m
+            else:
+                x = self._wavelengths.as_nm
+
+            if quantity == "s/m^2":
+                y = self.as_s_m_m
+            elif quantity == "ps/nm.km":
+                y = self.as_ps_nm_km
+            else:
+                y = -self._wavelengths.as_m**2 / (2 * PI * C_MS) * self.as_s_m_m
+
+            spline = make_splrep(x, y)
+            self._splines[key] = spline
+        return instrument.timed("fiber.spline_eval", spline)
+
     def check_wavelength_limit(self, wavelength: float, unit: Literal["nm", "m", "um"]):
-        min = 0
-        max = 0
-
-        if unit == "m":
-            min = self._wavelengths.as_m.min()
-            max = self._wavelengths.as_m.max()
-        elif unit == "um":
-            min = self._wavelengths.as_um.min()
-            max = self._wavelengths.as_um.max()
-        else:
-            min = self._wavelengths.as_nm.min()
-            max = self._wavelengths.as_nm.max()
+        if unit not in ("m", "um"):
+            unit = "nm"
+        min, max = self._limits[unit]
 
-        if wavelength > max or wavelength < min:
+        if isinstance(wavelength, np.ndarray):
+            out_of_range = wavelength.size > 0 and (
+                wavelength.max() > max or wavelength.min() < min
+            )
+        else:
+            out_of_range = wavelength > max or wavelength < min
+        if out_of_range:
             raise ValueError(f"values of disersion available between {min} and {max}")
 
     def fn(self, wavelength: float) -> float:
         self.check_wavelength_limit(wavelength, "m")
         c_info("Dispersion unit: s/m^2")
-        spline = make_splrep(self._wavelengths.as_m, self.as_s_m_m)
-        return float(spline(wavelength))
+        return float(self._spline("s/m^2", "m")(wavelength))
 
     def fn_s_m_m(self, wavelength_nm: float) -> float:
         self.check_wavelength_limit(wavelength_nm, "nm")
         c_info("Dispersion unit: s/m^2")
-        spline = make_splrep(self._wavelengths.as_nm, self.as_s_m_m)
-        return float(spline(wavelength_nm))
+        return float(self._spline("s/m^2", "nm")(wavelength_nm))
 
     def fn_ps_nm_km(self, wavelength_nm: float) -> float:
         self.check_wavelength_limit(wavelength_nm, "nm")
         c_info("Dispersion unit: ps/nm.km")
-        spline = make_splrep(self._wavelengths.as_nm, self.as_ps_nm_km)
-        return float(spline(wavelength_nm))
+        return float(self._spline("ps/nm.km", "nm")(wavelength_nm))
+
+    def fn_array(
+        self,
+        wavelengths: WavelengthArray,
+        unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    ) -> NDArray:
+        if not isinstance(wavelengths, (WavelengthArray, LazyArray)):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        if unit not in ("ps/nm.km", "s/m^2"):
+            raise ValueError(f"Unsupported unit: {unit} use 'ps/nm.km' or 's/m^2'")
+        if isinstance(wavelengths, LazyArray):
+            # Evaluated chunk by chunk when the result is computed
+            return wavelengths.to_wl().map(lambda wl: self.fn_array(wl, unit))
+        wl = wavelengths.as_m
+        self.check_wavelength_limit(wl, "m")
+        return self._spline(unit, "m")(wl).astype(self._dtype, copy=False)
+
+    @staticmethod
+    def _check_smooth_fit(dispersion: NDArray, ignore_fit_error: bool):
+        smooth_fit = np.all(np.diff(dispersion * 1e6) < 50)
+        if not smooth_fit:
+            warnings.warn(
+                "Bad fitting of neff values. Consider building Disperison in other ways..."
+            )
+            if not ignore_fit_error:
+                raise ChildProcessError(
+                    "Can't perform numerical differentiation with small error..."
+                )
 
     @classmethod
     def from_neff(
@@ -90,6 +167,8 @@ class Dispersion:
         wavelengths: WavelengthArray,
         central_wavelength_nm: float,
         ignore_fit_error: bool = False,
+        method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+        dtype=None,
     ) -> Self:
         # D = -lambda / C_MS * (d^2 neff/ d lambda^2)
 
@@ -99,28 +178,15 @@ class Dispersion:
             raise TypeError(
                 f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
             )
-        wl = wavelengths.to_equally_spaced()
-        interp = make_splrep(wavelengths.as_m, neff)(wl)
-
-        spline = make_splrep(wl, interp)
-        diff_2 = spline.derivative(2)
+        dispersion, _ = dispersion_from_neff(neff, wavelengths, method=method)
 
-        dispersion: NDArray = -wavelengths.as_m / C_MS * diff_2(wavelengths.as_m)
-
-        smooth_fit = np.all(np.diff(dispersion * 1e6) < 50)
-        if not smooth_fit:
-            warnings.warn(
-                "Bad fitting of neff values. Consider building Disperison in other ways..."
-            )
-            if not ignore_fit_error:
-                raise ChildProcessError(
-                    "Can't perform numerical differentiation with small error..."
-                )
+        cls._check_smooth_fit(dispersion, ignore_fit_error)
         return cls(
             wavelengths=wavelengths,
             values=dispersion,
             unit="s/m^2",
             central_wavelength=Wavelength(central_wavelength_nm, "nm"),
+            dtype=dtype,
         )
 
     @classmethod
@@ -130,6 +196,8 @@ class Dispersion:
         wavelengths: WavelengthArray,
         central_wavelength_nm: float,
         ignore_fit_error: bool = False,
+        method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+        dtype=None,
     ) -> Self:
         # -(2*PI*C_MS) / lambda^2 * (d^2 beta/ d omega^2)
 
@@ -140,44 +208,75 @@ class Dispersion:
                 f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
             )
 
-        omega = wavelengths.to_omega().to_equally_spaced()
-        interp = make_splrep(wavelengths.to_omega().as_rad_s[::-1], beta[::-1])(omega)
+        if method == "spline" or (
+            method == "auto" and not is_uniform(wavelengths.as_m)
+        ):
+            omegas = wavelengths.to_omega().as_rad_s
+            omega = wavelengths.to_omega().to_equally_spaced()
+            interp = make_splrep(omegas[::-1], beta[::-1])(omega)
 
-        spline = make_splrep(omega[::-1], interp[::-1])
-        diff_2 = spline.derivative(2)
+            spline = make_splrep(omega[::-1], interp[::-1])
+            diff_2 = spline.derivative(2)
 
-        dispersion: NDArray = (
-            -(2 * PI * C_MS)
-            / wavelengths.as_m**2
-            * diff_2(wavelengths.to_omega().as_rad_s)
+            dispersion: NDArray = (
+                -(2 * PI * C_MS) / wavelengths.as_m**2 * diff_2(omegas)
+            )
+        else:
+            # beta = 2 pi neff / lambda, so the uniform wavelength grid can be
+            # differentiated directly instead of resampling in omega.
+            neff = np.asarray(beta) * wavelengths.as_m / (2 * PI)
+            dispersion, _ = dispersion_from_neff(neff, wavelengths, method=method)
+
+        cls._check_smooth_fit(dispersion, ignore_fit_error)
+        return cls(
+            wavelengths=wavelengths,
+            values=dispersion,
+            unit="s/m^2",
+            central_wavelength=Wavelength(central_wavelength_nm, "nm"),
+            dtype=dtype,
         )
 
-        smooth_fit = np.all(np.diff(dispersion * 1e6) < 50)
-        if not smooth_fit:
-            warnings.warn(
-                "Bad fitting of neff values. Consider building Disperison in other ways..."
-            )
-            if not ignore_fit_error:
-                raise ChildProcessError(
-                    "Can't perform numerical differentiation with small error..."
-                )
+    @classmethod
+    def from_sellmeier(
+        cls,
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wavelengths: WavelengthArray,
+        central_wavelength_nm: float,
+        form: Literal["standard", "alt"] = "standard",
+        dtype=None,
+    ) -> Self:
+        if len(A) != len(B):
+            raise ValueError("Length of A and B should be same")
+        _, _, d2n = sellmeier_derivatives(A0, A, B, wavelengths, form=form)
+        dispersion = -wavelengths.as_m / C_MS * d2n[0]
         return cls(
             wavelengths=wavelengths,
             values=dispersion,
             unit="s/m^2",
             central_wavelength=Wavelength(central_wavelength_nm, "nm"),
+            dtype=dtype,
         )
 
     def get_beta2(self, wavelength_nm: float):
-        min = self._wavelengths.as_nm.min()
-        max = self._wavelengths.as_nm.max()
+        min, max = self._limits["nm"]
         if wavelength_nm > max or wavelength_nm < min:
             raise ValueError(
                 f"values of disersion available between {min} and {max} nm."
             )
-        beta2 = -self._wavelengths.as_m**2 / (2 * PI * C_MS) * self.as_s_m_m
-        spline = make_splrep(self._wavelengths.as_nm, beta2)
-        return float(spline(wavelength_nm))
+        return float(self._spline("beta2", "nm")(wavelength_nm))
+
+    def get_beta2_array(self, wavelengths: WavelengthArray) -> NDArray:
+        if isinstance(wavelengths, LazyArray):
+            return wavelengths.to_wl().map(self.get_beta2_array)
+        if not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        wl = wavelengths.as_m
+        self.check_wavelength_limit(wl, "m")
+        return self._spline("beta2", "m")(wl).astype(self._dtype, copy=False)
 
 
 class PropagationConstant:
@@ -188,7 +287,87 @@ class PropagationConstant:
             self._wavelengths = x_values
         elif isinstance(x_values, AngularFrequencyArray):
             self._omegas = x_values
+        else:
+            raise TypeError(
+                f"x_values should be a WavelengthArray or AngularFrequencyArray : got {type(x_values)}"
+            )
         self._values = values
+        self.clear_cache()
+
+    @property
+    def values(self) -> NDArray:
+        return self._values
+
+    @property
+    def omegas(self) -> AngularFrequencyArray:
+        if hasattr(self, "_omegas"):
+            return self._omegas
+        return self._wavelengths.to_omega()
+
+    def clear_cache(self):
+        self._splines = {}
+        omegas = self.omegas.as_rad_s
+        # beta(omega) is fitted in a normalised variable x = (omega - center) / scale
+        # so that high-degree splines stay well conditioned.
+        self._omega_center = float(omegas.min() + omegas.max()) / 2
+        self._omega_scale = float(omegas.max() - omegas.min()) / 2
+        self._limits = (float(omegas.min()), float(omegas.max()))
+
+    def _beta_spline(self, degree: int):
+        spline = self._splines.get(degree)
+        if instrument.enabled:
+            hit = "hits" if spline is not None else "misses"
+            instrument.count(f"fiber.spline_cache.{hit}")
+        if spline is None:
+            omegas = self.omegas.as_rad_s
+            order = np.argsort(omegas)
+            x = (omegas[order] - self._omega_center) / self._omega_scale
+            spline = make_interp_spline(x, np.asarray(self._values)[order], k=degree)
+            self._splines[degree] = spline
+        return spline
+
+    def taylor_coefficients(
+        self, center_omegas: float | NDArray, order: int = 6
+    ) -> NDArray:
+        if order < 0:
+            raise ValueError("order should be a non-negative integer")
+        centers = np.asarray(center_omegas, dtype=float)
+        lower, upper = self._limits
+        if centers.size > 0 and (centers.min() < lower or centers.max() > upper):
+            raise ValueError(
+                f"values of propagation constant available between {lower} and {upper} rad/s"
+            )
+
+        # An interpolating spline of degree order + 1 keeps beta_order non-zero;
+        # odd degrees are used as they interpolate more smoothly.
+        degree = max(3, order + 1 + order % 2)
+        spline = self._beta_spline(degree)
+
+        x = (centers.reshape(-1) - self._omega_center) / self._omega_scale
+        coefficients = np.empty((x.size, order + 1))
+        for m in range(order + 1):
+            coefficients[:, m] = spline(x, nu=m) / self._omega_scale**m
+        return coefficients.reshape(centers.shape + (order + 1,))
+
+    def dispersion_operator(
+        self,
+        delta_omegas: NDArray,
+        center_omegas: float | NDArray,
+        order: int = 6,
+        include_beta1: bool = False,
+    ) -> NDArray:
+        coefficients = self.taylor_coefficients(center_omegas, order=order)
+        delta = np.asarray(delta_omegas, dtype=float)
+        lowest = 1 if include_beta1 else 2
+
+        # Horner evaluation of sum_m beta_m / m! * delta^m for m >= lowest
+        shape = coefficients.shape[:-1] + (1,) * delta.ndim
+        operator = np.zeros(coefficients.shape[:-1] + delta.shape)
+        for m in range(order, lowest - 1, -1):
+            operator *= delta
+            operator += coefficients[..., m].reshape(shape) / math.factorial(m)
+        operator *= delta**lowest
+        return operator
 
     @classmethod
     def beta2_from_neff(
@@ -201,9 +380,14 @@ class PropagationConstant:
             omegas = x_values.to_omega()
         elif isinstance(x_values, AngularFrequencyArray):
             omegas = x_values
+        else:
+            raise TypeError(
+                f"x_values should be a WavelengthArray or AngularFrequencyArray : got {type(x_values)}"
+            )
 
-        beta2 = neff * omegas / C_MS
-        return beta2
+        # beta = neff * omega / c, differentiated twice along its spline
+        beta = cls(np.asarray(neff) * omegas.as_rad_s / C_MS, omegas)
+        return beta.taylor_coefficients(omegas.as_rad_s, order=2)[:, 2]
 
     @classmethod
     def from_neff_omega(cls, neff: NDArray, omega: AngularFrequencyArray) -> Self:
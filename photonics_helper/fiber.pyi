@@ -1,7 +1,9 @@
 from photonics_helper.base import AngularFrequencyArray, Wavelength, WavelengthArray
+from photonics_helper.lazy import LazyArray
 
+import numpy as np
 from numpy.typing import NDArray
-from typing import Literal, Self
+from typing import List, Literal, Self
 
 class Dispersion:
     """
@@ -23,6 +25,7 @@ class Dispersion:
         values: NDArray,
         unit: Literal["ps/nm.km", "s/m^2"],
         central_wavelength: Wavelength,
+        dtype=None,
     ) -> None:
         """
         Initialize a Dispersion object.
@@ -32,6 +35,9 @@ class Dispersion:
             values: Dispersion values in the specified unit
             unit: Unit of the dispersion values ("ps/nm.km" or "s/m^2")
             central_wavelength: Central wavelength for the dispersion curve
+            dtype: Storage type, float32/float64 or 'single'/'double'.
+                Defaults to the dtype of wavelengths. Array queries return
+                this dtype; splines are still fitted in float64.
         """
         ...
 
@@ -39,6 +45,11 @@ class Dispersion:
         """Return string representation showing wavelength range."""
         ...
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating point type of the stored values."""
+        ...
+
     @property
     def as_ps_nm_km(self) -> NDArray:
         """Get dispersion values in ps/nm.km units."""
@@ -53,14 +64,24 @@ class Dispersion:
         """Get the wavelength array for this dispersion data."""
         ...
 
+    def clear_cache(self) -> None:
+        """
+        Drop the fitted splines and recompute the wavelength bounds.
+
+        Splines for D (s/m^2 and ps/nm.km) and β₂ are fitted once on first
+        use and reused by every later query. Call this after modifying the
+        wavelength or dispersion arrays in place.
+        """
+        ...
+
     def check_wavelength_limit(
-        self, wavelength: float, unit: Literal["nm", "m", "um"]
+        self, wavelength: float | NDArray, unit: Literal["nm", "m", "um"]
     ) -> None:
         """
         Check if a wavelength is within the valid range of the dispersion data.
 
         Args:
-            wavelength: Wavelength value to check
+            wavelength: Wavelength value, or array of values, to check
             unit: Unit of the wavelength ("nm", "m", or "um")
 
         Raises:
@@ -113,6 +134,32 @@ class Dispersion:
         """
         ...
 
+    def fn_array(
+        self,
+        wavelengths: WavelengthArray | LazyArray,
+        unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    ) -> NDArray | LazyArray:
+        """
+        Get interpolated dispersion values for a whole wavelength array.
+
+        The bounds are checked once for the array and nothing is printed,
+        so this is the method to use for dense wavelength grids. For a
+        LazyArray the result is a LazyArray too. It is evaluated, and the
+        bounds are checked, chunk by chunk when it is computed.
+
+        Args:
+            wavelengths: Wavelengths at which to evaluate the dispersion
+            unit: Unit of the returned values ("ps/nm.km" or "s/m^2")
+
+        Returns:
+            Array of dispersion values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            ValueError: If any wavelength is outside valid range or unit is unknown
+        """
+        ...
+
     @classmethod
     def from_neff(
         cls,
@@ -120,6 +167,8 @@ class Dispersion:
         wavelengths: WavelengthArray,
         central_wavelength_nm: float,
         ignore_fit_error: bool = False,
+        method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+        dtype=None,
     ) -> Self:
         """
         Create Dispersion object from effective refractive index data.
@@ -132,6 +181,12 @@ class Dispersion:
             wavelengths: Corresponding wavelength array
             central_wavelength_nm: Central wavelength in nanometers
             ignore_fit_error: Gives output ignoring bad curve fitting (Default: false)
+            method: How d²neff/dλ² is computed, see
+                derivatives.dispersion_from_neff. 'auto' uses finite
+                difference stencils on equally spaced wavelengths and the
+                spline refit otherwise.
+            dtype: Storage type of the result, see __init__. The derivative
+                itself is always computed in float64.
 
         Returns:
             Dispersion object calculated from neff data
@@ -150,6 +205,8 @@ class Dispersion:
         wavelengths: WavelengthArray,
         central_wavelength_nm: float,
         ignore_fit_error: bool = False,
+        method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+        dtype=None,
     ) -> Self:
         """
         Create Dispersion object from propagation constant data.
@@ -157,11 +214,18 @@ class Dispersion:
         Calculates dispersion using the formula:
         D = -(2πc)/λ² * (d²β/dω²)
 
+        On equally spaced wavelengths (method 'auto', 'finite_difference' or
+        'savgol') β is turned into neff = βλ/(2π) and differentiated in
+        wavelength directly, without resampling in ω.
+
         Args:
             beta: Array of propagation constant values
             wavelengths: Corresponding wavelength array
             central_wavelength_nm: Central wavelength in nanometers
             ignore_fit_error: Gives output ignoring bad curve fitting (Default: false)
+            method: How the second derivative is computed ('auto',
+                'finite_difference', 'savgol' or 'spline')
+            dtype: Storage type of the result, see __init__
 
         Returns:
             Dispersion object calculated from beta data
@@ -173,6 +237,41 @@ class Dispersion:
         """
         ...
 
+    @classmethod
+    def from_sellmeier(
+        cls,
+        A0: int | float,
+        A: List[float],
+        B: List[float],
+        wavelengths: WavelengthArray,
+        central_wavelength_nm: float,
+        form: Literal["standard", "alt"] = "standard",
+        dtype=None,
+    ) -> Self:
+        """
+        Create Dispersion object of a bulk material from Sellmeier coefficients.
+
+        Uses the exact analytic d²n/dλ² of the Sellmeier equation, so no
+        fitting or numerical differentiation is involved.
+
+        Args:
+            A0: Offset coefficient
+            A: List of amplitude coefficients
+            B: List of wavelength coefficients in micrometers
+            wavelengths: Wavelengths at which to evaluate the dispersion
+            central_wavelength_nm: Central wavelength in nanometers
+            form: Sellmeier form ('standard' or 'alt'), see sellmeier_table
+            dtype: Storage type of the result, see __init__
+
+        Returns:
+            Dispersion object of the material
+
+        Raises:
+            ValueError: If A and B lists have different lengths
+            TypeError: If wavelengths is not a WavelengthArray
+        """
+        ...
+
     def get_beta2(self, wavelength_nm: float) -> float:
         """
         Get the second-order dispersion parameter β₂ at a specific wavelength.
@@ -190,6 +289,24 @@ class Dispersion:
         """
         ...
 
+    def get_beta2_array(
+        self, wavelengths: WavelengthArray | LazyArray
+    ) -> NDArray | LazyArray:
+        """
+        Get β₂ for a whole wavelength array, lazily for a LazyArray.
+
+        Args:
+            wavelengths: Wavelengths at which to evaluate β₂
+
+        Returns:
+            Array of β₂ values in s²/m with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            ValueError: If any wavelength is outside valid range
+        """
+        ...
+
 class PropagationConstant:
     """
     Represents propagation constant characteristics of optical fibers.
@@ -213,6 +330,79 @@ class PropagationConstant:
         Args:
             values: Array of propagation constant values
             x_values: Either wavelength or angular frequency array
+
+        Raises:
+            TypeError: If x_values is neither a WavelengthArray nor an
+                AngularFrequencyArray
+        """
+        ...
+
+    @property
+    def values(self) -> NDArray:
+        """Propagation constant values in 1/m."""
+        ...
+
+    @property
+    def omegas(self) -> AngularFrequencyArray:
+        """Angular frequencies of the samples, converted from wavelengths if needed."""
+        ...
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached β(ω) splines.
+
+        Call this after modifying the stored values in place.
+        """
+        ...
+
+    def taylor_coefficients(
+        self, center_omegas: float | NDArray, order: int = 6
+    ) -> NDArray:
+        """
+        Taylor coefficients β₀..β_order of β(ω) around one or more centers.
+
+        β(ω) is fitted once with an interpolating spline of degree order + 1
+        (rounded up to odd) in a normalised frequency variable and the
+        derivatives are read off at every center in one vectorized call.
+        Splines are cached per degree, so repeated calls only evaluate.
+
+        Args:
+            center_omegas: Center angular frequency (or array of them) in rad/s
+            order: Highest dispersion order to return
+
+        Returns:
+            Array of shape center_omegas.shape + (order + 1,) holding
+            β_m = dᵐβ/dωᵐ in sᵐ/m
+
+        Raises:
+            ValueError: If order is negative or a center lies outside the data
+        """
+        ...
+
+    def dispersion_operator(
+        self,
+        delta_omegas: NDArray,
+        center_omegas: float | NDArray,
+        order: int = 6,
+        include_beta1: bool = False,
+    ) -> NDArray:
+        """
+        Linear dispersion operator Σ βₘ/m! Δωᵐ built from the Taylor coefficients.
+
+        The sum starts at m = 2 (or m = 1 when include_beta1 is True) and is
+        evaluated with Horner's scheme, ready for use in a split-step solver.
+
+        Args:
+            delta_omegas: Frequency offsets from the center in rad/s
+            center_omegas: Center angular frequency (or array of them) in rad/s
+            order: Highest dispersion order kept in the expansion
+            include_beta1: Keep the group-delay term β₁Δω
+
+        Returns:
+            Array of shape center_omegas.shape + delta_omegas.shape in 1/m
+
+        Raises:
+            ValueError: If order is negative or a center lies outside the data
         """
         ...
 
@@ -223,17 +413,20 @@ class PropagationConstant:
         """
         Calculate β₂ parameter from effective refractive index.
 
-        Uses the relationship: β = neff * ω / c
+        Uses the relationship: β = neff * ω / c, and β₂ = d²β/dω² from its
+        interpolating spline.
 
         Args:
             neff: Array of effective refractive index values
             x_values: Wavelength or angular frequency array
 
         Returns:
-            Array of β₂ values
+            Array of β₂ values in s²/m at every point of x_values
 
         Raises:
             ValueError: If neff and x_values have different lengths
+            TypeError: If x_values is not a WavelengthArray or
+                AngularFrequencyArray
         """
         ...
 
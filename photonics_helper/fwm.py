@@ -0,0 +1,208 @@
+from .base import (
+    C_MS,
+    PI,
+    AngularFrequencyArray,
+    FrequencyArray,
+    WavelengthArray,
+)
+from .fiber import Dispersion, PropagationConstant
+from ._interp import make_interp_spline
+
+from typing import Literal, Tuple
+from numpy.typing import NDArray
+
+import math
+import numpy as np
+
+# Grid points per chunk when none is given
+DEFAULT_CHUNK_SIZE = 2**18
+
+
+def _as_omega(values: AngularFrequencyArray | FrequencyArray | WavelengthArray):
+    if isinstance(values, AngularFrequencyArray):
+        return np.asarray(values.as_rad_s, dtype=float)
+    if isinstance(values, (FrequencyArray, WavelengthArray)):
+        return np.asarray(values.to_omega().as_rad_s, dtype=float)
+    raise TypeError(
+        f"frequencies cannot process the type: {type(values)}, required AngularFrequencyArray, FrequencyArray or WavelengthArray"
+    )
+
+
+def _blocks(shape: Tuple[int, ...], chunk_size: int | None) -> list:
+    # Row blocks along the first axis holding about chunk_size grid points;
+    # a 0-d grid is one Ellipsis block, which indexes as a writable view
+    if len(shape) == 0:
+        return [...]
+    if chunk_size is None:
+        rows = max(1, shape[0])
+    elif chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer")
+    else:
+        rows = max(1, chunk_size // max(1, math.prod(shape[1:])))
+    return [slice(i, i + rows) for i in range(0, shape[0], rows)]
+
+
+class PhaseMatching:
+    def __init__(
+        self,
+        source: PropagationConstant | Dispersion,
+        method: Literal["spline", "taylor"] = "spline",
+        order: int = 4,
+    ):
+        if method not in ("spline", "taylor"):
+            raise ValueError(f"Unsupported method: {method} use 'spline' or 'taylor'")
+        if order < 2:
+            raise ValueError("order should be at least 2")
+        self._source = source
+        self._method = method
+        self._order = order
+
+        # beta(omega) as one spline in x = (omega - center) / scale
+        if isinstance(source, PropagationConstant):
+            degree = 5 if method == "spline" else max(5, order + 1 + order % 2)
+            self._spline = source._beta_spline(degree)
+            self._center = source._omega_center
+            self._scale = source._omega_scale
+            self._limits = source._limits
+        elif isinstance(source, Dispersion):
+            # Only beta2 is known; its double antiderivative equals beta up
+            # to the constant and linear terms, which cancel in delta beta.
+            wl = source.get_wl().as_m.astype(float)
+            omegas = 2 * PI * C_MS / wl
+            beta2 = -(wl**2) / (2 * PI * C_MS) * np.asarray(source.as_s_m_m, float)
+            ascending = np.argsort(omegas)
+            self._limits = (float(omegas.min()), float(omegas.max()))
+            self._center = sum(self._limits) / 2
+            self._scale = (self._limits[1] - self._limits[0]) / 2
+            x = (omegas[ascending] - self._center) / self._scale
+            spline = make_interp_spline(x, beta2[ascending] * self._scale**2, k=3)
+            self._spline = spline.antiderivative(2)
+            # beta is a quintic here, so beta_6 and above would silently be 0
+            if method == "taylor" and order > self._spline.k:
+                raise ValueError(
+                    f"order should be at most {self._spline.k} for a Dispersion source"
+                )
+        else:
+            raise TypeError(
+                f"source cannot process the type: {type(source)}, required PropagationConstant or Dispersion"
+            )
+
+    def __repr__(self):
+        lower, upper = self._limits
+        return f"PhaseMatching: {self._method}, from omega: {lower} to {upper} rad/s"
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def order(self) -> int:
+        return self._order
+
+    @property
+    def limits(self) -> Tuple[float, float]:
+        return self._limits
+
+    def _check(self, omegas: NDArray, name: str):
+        lower, upper = self._limits
+        if omegas.size > 0 and (omegas.min() < lower or omegas.max() > upper):
+            raise ValueError(
+                f"{name} frequencies should be between {lower} and {upper} rad/s"
+            )
+
+    def _beta(self, omegas: NDArray) -> NDArray:
+        return self._spline((omegas - self._center) / self._scale)
+
+    def beta(
+        self, omegas: AngularFrequencyArray | FrequencyArray | WavelengthArray
+    ) -> NDArray:
+        omegas = _as_omega(omegas)
+        self._check(omegas, "beta")
+        return self._beta(omegas)
+
+    def _even_coefficients(self, pumps: NDArray) -> NDArray:
+        # 2 beta_2k / (2k)! at every pump, for 2k = 2, 4, ..., order
+        x = (pumps - self._center) / self._scale
+        powers = range(2, self._order + 1, 2)
+        return np.stack(
+            [
+                2 * self._spline(x, nu=k) / self._scale**k / math.factorial(k)
+                for k in powers
+            ],
+            axis=-1,
+        )
+
+    def delta_beta(
+        self,
+        pump: AngularFrequencyArray | FrequencyArray | WavelengthArray,
+        signal: AngularFrequencyArray | FrequencyArray | WavelengthArray,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+        out: NDArray | None = None,
+    ) -> NDArray:
+        pump_omegas = _as_omega(pump)
+        signal_omegas = _as_omega(signal)
+        shape = np.broadcast_shapes(pump_omegas.shape, signal_omegas.shape)
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape:
+            raise ValueError(f"out should have shape {shape}, got {out.shape}")
+        self._check(pump_omegas, "pump")
+        self._check(signal_omegas, "signal")
+
+        # Pump and signal terms are evaluated once on their own grids and
+        # broadcast; only the idler 2 omega_p - omega_s spans the full map.
+        if self._method == "spline":
+            pump_term = np.broadcast_to(2 * self._beta(pump_omegas), shape)
+            signal_term = np.broadcast_to(self._beta(signal_omegas), shape)
+        else:
+            coefficients = self._even_coefficients(pump_omegas)
+            coefficients = np.broadcast_to(
+                coefficients, shape + coefficients.shape[-1:]
+            )
+        pump_omegas = np.broadcast_to(pump_omegas, shape)
+        signal_omegas = np.broadcast_to(signal_omegas, shape)
+
+        for block in _blocks(shape, chunk_size):
+            pumps = pump_omegas[block]
+            if self._method == "spline":
+                idlers = 2 * pumps - signal_omegas[block]
+                self._check(idlers, "idler")
+                target = out[block]
+                np.subtract(signal_term[block], pump_term[block], out=target)
+                target += self._beta(idlers)
+            else:
+                # beta(p + d) + beta(p - d) - 2 beta(p): odd orders cancel
+                delta2 = (signal_omegas[block] - pumps) ** 2
+                block_coefficients = coefficients[block]
+                target = np.zeros(delta2.shape)
+                for k in range(block_coefficients.shape[-1] - 1, -1, -1):
+                    target *= delta2
+                    target += block_coefficients[..., k]
+                target *= delta2
+                out[block] = target
+        return out
+
+    def gain(
+        self,
+        pump: AngularFrequencyArray | FrequencyArray | WavelengthArray,
+        signal: AngularFrequencyArray | FrequencyArray | WavelengthArray,
+        gamma: float,
+        power: float,
+        length: float,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+        out: NDArray | None = None,
+    ) -> NDArray:
+        out = self.delta_beta(pump, signal, chunk_size=chunk_size, out=out)
+        gamma_power = gamma * power
+        for block in _blocks(out.shape, chunk_size):
+            part = out[block]
+            # g^2 = (gamma P)^2 - (kappa / 2)^2 with kappa = delta beta + 2 gamma P
+            g2 = gamma_power**2 - ((part + 2 * gamma_power) / 2) ** 2
+            g = np.sqrt(np.abs(g2))
+            gl = g * length
+            with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+                # sinh(gL)/g, or sin(|g|L)/|g| beyond the gain band
+                growth = np.where(g2 >= 0, np.sinh(gl), np.sin(gl)) / g
+            growth = np.where(g == 0, length, growth)
+            out[block] = 1 + (gamma_power * growth) ** 2
+        return out
@@ -0,0 +1,141 @@
+from typing import Literal, Tuple
+from numpy.typing import NDArray
+
+from .base import AngularFrequencyArray, FrequencyArray, WavelengthArray
+from .fiber import Dispersion, PropagationConstant
+
+DEFAULT_CHUNK_SIZE: int
+"""Grid points evaluated per chunk by delta_beta and gain (2**18)."""
+
+Frequencies = AngularFrequencyArray | FrequencyArray | WavelengthArray
+
+class PhaseMatching:
+    """Degenerate four-wave-mixing phase mismatch and parametric gain maps.
+
+    For pump ω_p, signal ω_s and idler ω_i = 2ω_p - ω_s, computes
+    Δβ = β(ω_s) + β(ω_i) - 2β(ω_p) over any broadcastable pump and signal
+    grids (for example pumps[:, None] and signals[None, :]) in one
+    vectorized pass, chunked along the first axis for very large maps.
+
+    β(ω) is a single cached spline fitted once. A PropagationConstant
+    reuses its own β(ω) spline. A Dispersion only defines β₂, so its β₂(ω)
+    spline is integrated twice. That gives β up to constant and linear
+    terms, which cancel in Δβ.
+    """
+
+    def __init__(
+        self,
+        source: PropagationConstant | Dispersion,
+        method: Literal["spline", "taylor"] = "spline",
+        order: int = 4,
+    ) -> None:
+        """
+        Initialize a PhaseMatching calculator.
+
+        Args:
+            source: Fiber or waveguide data providing β(ω) or β₂(ω)
+            method: "spline" evaluates β at signal, idler and pump exactly on
+                the fit. "taylor" uses the even-order expansion about each
+                pump, Δβ = 2Σ β_2k(ω_p)·Δω^2k/(2k)!, which also extends
+                beyond the fitted range.
+            order: Highest Taylor order, used by method="taylor". For a
+                PropagationConstant the rounding of tabulated β (about 1e-10
+                relative) dominates β₄ and above on fine grids, so order=2 is
+                the reliable choice there; a Dispersion source takes β₄
+                from its β₂ fit directly. The cubic β₂ fit of a Dispersion
+                makes β a quintic, so order can be at most 5 there.
+
+        Raises:
+            ValueError: If the method is not supported, order < 2, or
+                order > 5 with method="taylor" for a Dispersion source
+            TypeError: If source is not a PropagationConstant or Dispersion
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+    @property
+    def method(self) -> str:
+        """Evaluation method, "spline" or "taylor"."""
+        ...
+
+    @property
+    def order(self) -> int:
+        """Highest Taylor order."""
+        ...
+
+    @property
+    def limits(self) -> Tuple[float, float]:
+        """Angular frequency range of the fit in rad/s."""
+        ...
+
+    def beta(self, omegas: Frequencies) -> NDArray:
+        """β(ω) in 1/m from the cached fit.
+
+        For a Dispersion source it is defined only up to constant and
+        linear terms.
+
+        Raises:
+            ValueError: If a frequency is outside limits
+        """
+        ...
+
+    def delta_beta(
+        self,
+        pump: Frequencies,
+        signal: Frequencies,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+        out: NDArray | None = None,
+    ) -> NDArray:
+        """
+        Phase mismatch Δβ = β(ω_s) + β(ω_i) - 2β(ω_p) in 1/m.
+
+        β at the pump and signal grids is evaluated once on those grids and
+        broadcast. Only the idler term spans the full map.
+
+        Args:
+            pump: Pump frequencies, broadcastable with signal
+            signal: Signal frequencies
+            chunk_size: Approximate grid points per chunk, None for a single
+                pass
+            out: Optional preallocated array with the broadcast shape
+
+        Returns:
+            Δβ with the broadcast shape of pump and signal
+
+        Raises:
+            TypeError: If pump or signal is not a frequency or wavelength array
+            ValueError: If pump, signal or idler (spline method) frequencies
+                are outside limits, or out has the wrong shape
+        """
+        ...
+
+    def gain(
+        self,
+        pump: Frequencies,
+        signal: Frequencies,
+        gamma: float,
+        power: float,
+        length: float,
+        chunk_size: int | None = DEFAULT_CHUNK_SIZE,
+        out: NDArray | None = None,
+    ) -> NDArray:
+        """
+        Signal power gain of a single-pump fiber optical parametric amplifier.
+
+        G = 1 + (γP·sinh(gL)/g)² with g² = (γP)² - (κ/2)² and κ = Δβ + 2γP,
+        continued as sin(|g|L)/|g| outside the gain band. Pump depletion and
+        loss are neglected.
+
+        Args:
+            pump: Pump frequencies, broadcastable with signal
+            signal: Signal frequencies
+            gamma: Nonlinear coefficient γ in 1/(W·m)
+            power: Pump power in W
+            length: Fiber length in m
+            chunk_size: Approximate grid points per chunk
+            out: Optional preallocated array with the broadcast shape
+
+        Returns:
+            Linear signal gain with the broadcast shape of pump and signal
+        """
+        ...
@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+import os
+import threading
+import time
+
+# Hot paths check this flag before doing any bookkeeping, so the disabled
+# cost is one module attribute lookup per call.
+enabled: bool = os.environ.get("PHOTONICS_HELPER_INSTRUMENT", "") not in ("", "0")
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+# name: [calls, items, seconds]
+_timers: Dict[str, list] = {}
+
+
+def enable(flag: bool = True) -> None:
+    global enabled
+    enabled = bool(flag)
+
+
+def disable() -> None:
+    enable(False)
+
+
+def is_enabled() -> bool:
+    return enabled
+
+
+def count(name: str, value: int = 1) -> None:
+    if not enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def add_time(name: str, seconds: float, items: int = 1) -> None:
+    if not enabled:
+        return
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            _timers[name] = [1, items, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += items
+            timer[2] += seconds
+
+
+@contextmanager
+def timer(name: str, items: int = 1) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, time.perf_counter() - start, items)
+
+
+class _Timed:
+    # Stand-in for a fitted spline that times each evaluation
+    __slots__ = ("_name", "_function")
+
+    def __init__(self, name: str, function: Callable) -> None:
+        self._name = name
+        self._function = function
+
+    def __call__(self, x, *args, **kwargs):
+        start = time.perf_counter()
+        result = self._function(x, *args, **kwargs)
+        add_time(self._name, time.perf_counter() - start, getattr(x, "size", 1))
+        return result
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._function, attribute)
+
+
+def timed(name: str, function: Callable) -> Callable:
+    if not enabled:
+        return function
+    return _Timed(name, function)
+
+
+def snapshot() -> Dict[str, Dict]:
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {
+                name: {"calls": calls, "items": items, "seconds": seconds}
+                for name, (calls, items, seconds) in _timers.items()
+            },
+        }
+
+
+def flat_snapshot() -> Dict[str, float]:
+    # One level of "name.field" keys, as most metrics exporters expect
+    data = snapshot()
+    flat: Dict[str, float] = dict(data["counters"])
+    for name, fields in data["timers"].items():
+        for field, value in fields.items():
+            flat[f"{name}.{field}"] = value
+    return flat
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+
+@contextmanager
+def instrumented(reset_first: bool = True) -> Iterator[None]:
+    previous = enabled
+    if reset_first:
+        reset()
+    enable(True)
+    try:
+        yield
+    finally:
+        enable(previous)
@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+enabled: bool
+"""Whether hot paths record counters and timers.
+
+Off by default; set PHOTONICS_HELPER_INSTRUMENT=1 to start enabled. While
+off, each instrumented call site costs a single attribute check.
+"""
+
+def enable(flag: bool = True) -> None:
+    """Turn instrumentation on (or off with flag=False)."""
+    ...
+
+def disable() -> None:
+    """Turn instrumentation off; collected data is kept until reset()."""
+    ...
+
+def is_enabled() -> bool:
+    """Whether instrumentation is currently on."""
+    ...
+
+def count(name: str, value: int = 1) -> None:
+    """Add value to the counter name (no-op while disabled)."""
+    ...
+
+def add_time(name: str, seconds: float, items: int = 1) -> None:
+    """Record one timed call of name that processed items values."""
+    ...
+
+@contextmanager
+def timer(name: str, items: int = 1) -> Iterator[None]:
+    """Time the enclosed block under name (no-op while disabled)."""
+    ...
+
+def timed(name: str, function: Callable) -> Callable:
+    """Wrap function so every call is timed under name.
+
+    Returns function unchanged while disabled. Attribute access (for
+    example spline.derivative) is forwarded to the wrapped function.
+    """
+    ...
+
+def snapshot() -> Dict[str, Dict]:
+    """Copy of the collected data.
+
+    Returns:
+        {"counters": {name: value}, "timers": {name: {"calls", "items",
+        "seconds"}}}. Names in use:
+
+        - spline.fit: spline fits in fiber, materials and derivatives
+        - fiber.spline_eval, materials.spline_eval: spline evaluations
+        - fiber.spline_cache.hits/misses, materials.spline_cache.hits/misses
+        - cache.hits/misses: MaterialCache lookups
+        - base.scalar_conversions, base.array_conversions,
+          base.array_elements, base.array_allocations
+        - convert.conversions, convert.elements
+        - server.batches, server.requests, server.values: coalesced
+          LookupServer batches; server.evaluate times them
+    """
+    ...
+
+def flat_snapshot() -> Dict[str, float]:
+    """snapshot() flattened to "name" and "name.field" keys for metrics exporters."""
+    ...
+
+def reset() -> None:
+    """Clear all counters and timers."""
+    ...
+
+@contextmanager
+def instrumented(reset_first: bool = True) -> Iterator[None]:
+    """Enable instrumentation for the enclosed block, then restore the previous state.
+
+    Args:
+        reset_first: Clear collected data on entry
+    """
+    ...
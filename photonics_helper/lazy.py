@@ -0,0 +1,259 @@
+from .base import WavelengthArray, resolve_dtype
+from .convert import ConversionPlan, _DOMAINS, _domain, plan_conversion
+
+from os import PathLike
+from typing import Callable, Iterator, Self, Tuple
+from numpy.typing import NDArray
+
+import math
+import os
+import numpy as np
+
+# Values per chunk (8 MiB of float64); a few chunks per worker are in flight
+DEFAULT_CHUNK_SIZE = 2**20
+
+# WavelengthArray, FrequencyArray, AngularFrequencyArray, WavenumberArray
+_BASE_TYPES = tuple(array for _, array, *_ in _DOMAINS.values())
+
+
+class _Linspace:
+    # Read-only array-like holding np.linspace(start, stop, points); slices
+    # are computed on demand, so the full grid never exists in memory.
+    ndim = 1
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, start: float, stop: float, points: int) -> None:
+        self.start = float(start)
+        self.stop = float(stop)
+        self.shape = (points,)
+        self._step = (self.stop - self.start) / (points - 1)
+
+    def __getitem__(self, part):
+        if isinstance(part, tuple):
+            part = part[0]
+        points = self.shape[0]
+        first, last, stride = part.indices(points)
+        values = self.start + np.arange(first, last, stride) * self._step
+        # Same values as np.linspace, whose last point is exactly stop
+        if values.size and last == points and (points - 1 - first) % stride == 0:
+            values[-1] = self.stop
+        return values
+
+
+def _base_unit(array_type: type) -> str:
+    return _DOMAINS[_domain(array_type)][2]
+
+
+def _blocks(shape: Tuple[int, ...], chunk_size: int) -> list:
+    # Row blocks along the first axis holding about chunk_size values
+    if len(shape) == 0:
+        return [()]
+    rows = max(1, chunk_size // max(1, math.prod(shape[1:])))
+    return [slice(i, i + rows) for i in range(0, shape[0], rows)]
+
+
+class LazyArray:
+    def __init__(
+        self,
+        source: NDArray | str | PathLike,
+        unit: str | None = None,
+        array_type: type = WavelengthArray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype=None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be a positive integer")
+        if isinstance(source, (str, PathLike)):
+            source = np.load(source, mmap_mode="r")
+        elif isinstance(source, np.ndarray) and type(source) in _BASE_TYPES:
+            # An eager array already knows its domain and holds base units
+            if unit is not None and unit != _base_unit(type(source)):
+                raise ValueError(
+                    f"{type(source).__name__} holds values in "
+                    f"'{_base_unit(type(source))}', got unit '{unit}'"
+                )
+            array_type = type(source)
+            source = source.view(np.ndarray)
+        elif not (hasattr(source, "shape") and hasattr(source, "__getitem__")):
+            source = np.asarray(source)
+        if unit is None:
+            unit = _base_unit(array_type)
+        # Validates the domain and the unit
+        plan = plan_conversion(array_type, unit, array_type, _base_unit(array_type))
+
+        self._source = source
+        self._origin = (array_type, unit)
+        self._array_type = array_type
+        self._plan = None if plan.kind == "scale" and plan.factor == 1.0 else plan
+        self._maps: Tuple[Callable, ...] = ()
+        self._chunk_size = chunk_size
+        self._dtype = resolve_dtype(dtype)
+
+    @classmethod
+    def linspace(
+        cls,
+        start: float,
+        stop: float,
+        points: int,
+        unit: str | None = None,
+        array_type: type = WavelengthArray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype=None,
+    ) -> Self:
+        if points < 2:
+            raise ValueError("points should be at least 2")
+        return cls(_Linspace(start, stop, points), unit, array_type, chunk_size, dtype)
+
+    def _derive(
+        self,
+        array_type: type | None,
+        plan: ConversionPlan | None,
+        maps: Tuple[Callable, ...],
+    ) -> "LazyArray":
+        lazy = object.__new__(LazyArray)
+        lazy.__dict__.update(self.__dict__)
+        lazy._array_type = array_type
+        lazy._plan = plan
+        lazy._maps = maps
+        return lazy
+
+    def __repr__(self) -> str:
+        kind = self._array_type.__name__ if self._array_type else "values"
+        steps = len(self._maps) + (self._plan is not None)
+        return (
+            f"LazyArray: {kind} {self.shape}, {len(_blocks(self.shape, self._chunk_size))} "
+            f"chunks, {steps} pending operations"
+        )
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return tuple(self._source.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def array_type(self) -> type | None:
+        return self._array_type
+
+    def _converted(self, target: type, unit: str | None = None) -> "LazyArray":
+        if self._array_type is None:
+            raise TypeError("values without a unit cannot be converted")
+        target_unit = unit if unit is not None else _base_unit(target)
+        result_type = target if unit is None else None
+        # Values with a unit have no maps (map() drops the unit), so the whole
+        # chain from the source values fuses into one kernel
+        origin_type, origin_unit = self._origin
+        plan = plan_conversion(origin_type, origin_unit, target, target_unit)
+        if plan.kind == "scale" and plan.factor == 1.0:
+            plan = None
+        return self._derive(result_type, plan, ())
+
+    def to_wl(self) -> "LazyArray":
+        return self._converted(_DOMAINS["wavelength"][1])
+
+    def to_freq(self) -> "LazyArray":
+        return self._converted(_DOMAINS["frequency"][1])
+
+    def to_omega(self) -> "LazyArray":
+        return self._converted(_DOMAINS["angular frequency"][1])
+
+    def to_wn(self) -> "LazyArray":
+        return self._converted(_DOMAINS["wavenumber"][1])
+
+    def as_unit(self, unit: str) -> "LazyArray":
+        if self._array_type is None:
+            raise TypeError("values without a unit cannot be converted")
+        return self._converted(self._array_type, unit)
+
+    def map(self, function: Callable[[NDArray], NDArray]) -> "LazyArray":
+        # The result has no unit; unit-aware chunks are passed as *Array views
+        array_type = self._array_type
+        if array_type is not None:
+            call = function
+
+            def function(values):
+                return call(array_type.from_base(values))
+
+        return self._derive(None, self._plan, self._maps + (function,))
+
+    def _apply(self, values: NDArray) -> NDArray:
+        values = np.asarray(values)
+        if self._plan is not None:
+            values = self._plan(values.astype(np.float64, copy=False))
+        for function in self._maps:
+            values = function(values)
+        return np.asarray(values).astype(self._dtype, copy=False)
+
+    def _evaluate(self, block) -> NDArray:
+        return self._apply(self._source[block])
+
+    def chunks(self) -> Iterator[Tuple[slice, NDArray]]:
+        for block in _blocks(self.shape, self._chunk_size):
+            yield block, self._evaluate(block)
+
+    def compute(
+        self,
+        out: NDArray | str | PathLike | None = None,
+        workers: int | None = None,
+    ) -> NDArray:
+        shape = self.shape
+        if isinstance(out, (str, PathLike)):
+            out = np.lib.format.open_memmap(
+                out, mode="w+", dtype=self._dtype, shape=shape
+            )
+        elif out is None:
+            out = np.empty(shape, dtype=self._dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out should have shape {shape}, got {out.shape}")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise ValueError("workers should be a positive integer")
+
+        def run(block):
+            out[block] = self._evaluate(block)
+
+        blocks = _blocks(shape, self._chunk_size)
+        if workers == 1 or len(blocks) == 1:
+            for block in blocks:
+                run(block)
+        else:
+            # numpy ufuncs and spline evaluation release the GIL, so threads
+            # run the chunks in parallel without copying the graph
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(blocks))) as pool:
+                for _ in pool.map(run, blocks):
+                    pass
+        if isinstance(out, np.memmap):
+            out.flush()
+        if self._array_type is not None:
+            return self._array_type.from_base(out)
+        return out
+
+    def to_dask(self):
+        try:
+            import dask.array as da
+        except ImportError:
+            raise ImportError(
+                "to_dask requires dask, install it or use compute()"
+            ) from None
+        source = self._source
+        if not isinstance(source, da.Array):
+            rows = _blocks(self.shape, self._chunk_size)[0]
+            chunks = (rows.stop - rows.start,) + self.shape[1:] if self.shape else ()
+            source = da.from_array(source, chunks=chunks)
+        return source.map_blocks(self._apply, dtype=self._dtype)
@@ -0,0 +1,189 @@
+from os import PathLike
+from typing import Any, Callable, Iterator, Self, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE: int
+"""Values per chunk when none is given (2**20, 8 MiB of float64)."""
+
+class LazyArray:
+    """Unit-aware lazy array evaluated in chunks, for sweeps larger than RAM.
+
+    Wraps any sliceable array-like source without reading it, for example
+    a NumPy array, a memory-mapped .npy file, an on-demand linspace, or a
+    dask, zarr or h5py array. Conversions (to_freq, to_omega, to_wn, to_wl,
+    as_unit) and evaluations (Dispersion.fn_array, get_beta2_array,
+    RefractiveIndex.n_array, k_array, nk_array, or any map) only record an
+    operation. A chain of conversions collapses into one ConversionPlan
+    kernel, so wl.to_freq().to_omega() costs a single multiply or divide
+    per value.
+
+    Nothing runs until compute() is called. It then evaluates the graph on
+    blocks of about chunk_size values along the first axis, in parallel
+    threads (NumPy kernels and spline evaluation release the GIL), and
+    writes into an array, a preallocated out= or a new .npy file. chunks()
+    evaluates the same blocks one at a time in bounded memory, and to_dask()
+    hands the graph to dask when it is installed.
+
+    Example:
+        >>> wl = LazyArray.linspace(1400, 1700, 10**9, "nm")
+        >>> D = dispersion.fn_array(wl, "ps/nm.km")
+        >>> D.compute("dispersion.npy")
+    """
+
+    def __init__(
+        self,
+        source: NDArray | str | PathLike | Any,
+        unit: str | None = None,
+        array_type: type = ...,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype=None,
+    ) -> None:
+        """
+        Initialize a LazyArray over source.
+
+        Args:
+            source: Sliceable array-like with a shape, or the path of a .npy
+                file, which is memory-mapped read-only. A WavelengthArray
+                (or another *Array) brings its own domain and base unit.
+            unit: Unit of the source values, the base unit of array_type by
+                default
+            array_type: Domain of the values, WavelengthArray,
+                FrequencyArray, AngularFrequencyArray or WavenumberArray
+            chunk_size: Approximate values per chunk
+            dtype: Result float32/float64 or 'single'/'double'; None follows
+                the global precision policy
+
+        Raises:
+            ValueError: If the unit is not supported or chunk_size < 1
+            TypeError: If array_type is not one of the *Array classes
+        """
+        ...
+
+    @classmethod
+    def linspace(
+        cls,
+        start: float,
+        stop: float,
+        points: int,
+        unit: str | None = None,
+        array_type: type = ...,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dtype=None,
+    ) -> Self:
+        """np.linspace(start, stop, points) whose chunks are generated on demand.
+
+        Raises:
+            ValueError: If points < 2, see also __init__
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the result."""
+        ...
+
+    @property
+    def size(self) -> int:
+        """Number of values of the result."""
+        ...
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Float type of the result."""
+        ...
+
+    @property
+    def chunk_size(self) -> int:
+        """Approximate values per chunk."""
+        ...
+
+    @property
+    def array_type(self) -> type | None:
+        """Domain of the result in its base unit, None for values without a unit."""
+        ...
+
+    def to_wl(self) -> LazyArray:
+        """Lazy conversion to wavelength in m.
+
+        Raises:
+            TypeError: If the values have no unit
+        """
+        ...
+
+    def to_freq(self) -> LazyArray:
+        """Lazy conversion to frequency in Hz, see to_wl."""
+        ...
+
+    def to_omega(self) -> LazyArray:
+        """Lazy conversion to angular frequency in rad/s, see to_wl."""
+        ...
+
+    def to_wn(self) -> LazyArray:
+        """Lazy conversion to wavenumber in 1/m, see to_wl."""
+        ...
+
+    def as_unit(self, unit: str) -> LazyArray:
+        """Lazy plain values in another unit of the same domain.
+
+        Raises:
+            TypeError: If the values have no unit
+            ValueError: If the unit is not supported
+        """
+        ...
+
+    def map(self, function: Callable[[NDArray], NDArray]) -> LazyArray:
+        """Apply an elementwise function to every chunk when computed.
+
+        Args:
+            function: Called with each chunk, as an array_type view when the
+                values have a unit. It should return an array of the same
+                shape
+
+        Returns:
+            LazyArray of values without a unit
+        """
+        ...
+
+    def chunks(self) -> Iterator[Tuple[slice, NDArray]]:
+        """Evaluate the blocks one after another.
+
+        Yields:
+            (block, values) with the slice of the first axis each block covers
+        """
+        ...
+
+    def compute(
+        self,
+        out: NDArray | str | PathLike | None = None,
+        workers: int | None = None,
+    ) -> NDArray:
+        """
+        Evaluate the graph chunk by chunk.
+
+        Args:
+            out: Preallocated array, or the path of a new .npy file to
+                write the result to in bounded memory
+            workers: Threads evaluating chunks, one per CPU by default
+
+        Returns:
+            An array_type in its base unit, or a plain array for values
+            without a unit (out itself when given)
+
+        Raises:
+            ValueError: If out has the wrong shape or workers < 1, or a
+                Dispersion wavelength is out of range
+            AttributeError: If a RefractiveIndex wavelength is out of range
+        """
+        ...
+
+    def to_dask(self) -> Any:
+        """The same graph as a dask array, chunked like this one.
+
+        Raises:
+            ImportError: If dask is not installed
+        """
+        ...
@@ -0,0 +1,206 @@
+from .base import WavelengthArray
+from .materials import RefractiveIndex
+
+from os import PathLike
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+SUPPORTED_SUFFIXES = (".yml", ".yaml", ".csv")
+
+# Columns after the wavelength of each supported "tabulated <columns>" block
+_TABLE_COLUMNS = ("n", "k", "nk")
+
+
+def _parse_table(lines: List[str]) -> NDArray:
+    rows = [line.replace(",", " ").split() for line in lines if line.strip()]
+    try:
+        return np.array(rows, dtype=float)
+    except ValueError:
+        raise ValueError(
+            "tabulated data must be a rectangular table of numbers"
+        ) from None
+
+
+def _read_yaml(text: str) -> Dict[str, NDArray]:
+    # Minimal reader for the refractiveindex.info layout:
+    #   DATA:
+    #     - type: tabulated nk
+    #       data: |
+    #           <wavelength_um> <n> <k>
+    blocks: Dict[str, NDArray] = {}
+    lines = text.splitlines()
+    kind = None
+    i = 0
+    while i < len(lines):
+        stripped = lines[i].strip()
+        if stripped.startswith("- type:"):
+            kind = stripped.split(":", 1)[1].strip().strip("'\"")
+        elif stripped.startswith("data:") and kind is not None:
+            indent = len(lines[i]) - len(lines[i].lstrip())
+            body = []
+            i += 1
+            while i < len(lines):
+                line = lines[i]
+                if line.strip() and len(line) - len(line.lstrip()) <= indent:
+                    break
+                body.append(line)
+                i += 1
+            parts = kind.split()
+            if (
+                len(parts) != 2
+                or parts[0] != "tabulated"
+                or parts[1] not in _TABLE_COLUMNS
+            ):
+                raise ValueError(f"unsupported data type: '{kind}'")
+            blocks[parts[1]] = _parse_table(body)
+            kind = None
+            continue
+        i += 1
+    return blocks
+
+
+def _read_csv(text: str) -> Dict[str, NDArray]:
+    # refractiveindex.info CSV exports hold either one "wl,n,k" table or a
+    # "wl,n" table followed by a "wl,k" table, each with its own header.
+    blocks: Dict[str, NDArray] = {}
+    header = None
+    body: List[str] = []
+    for line in text.splitlines() + [""]:
+        stripped = line.strip()
+        starts_header = stripped[:1].isalpha()
+        if (starts_header or not stripped) and header is not None and body:
+            columns = "".join(c.strip() for c in header.split(",")[1:])
+            blocks[columns] = _parse_table(body)
+            header, body = None, []
+        if starts_header:
+            header = stripped
+        elif stripped:
+            if header is None:
+                header = "wl,n,k"
+            body.append(stripped)
+    return blocks
+
+
+def _read_arrays(path: str) -> Tuple[NDArray, NDArray, NDArray]:
+    path = Path(path)
+    text = path.read_text()
+    # Name the file, as iter_library reads many and one bad file stops it
+    try:
+        if path.suffix.lower() == ".csv":
+            blocks = _read_csv(text)
+        else:
+            blocks = _read_yaml(text)
+    except ValueError as error:
+        raise ValueError(f"{path}: {error}") from None
+
+    if "nk" in blocks:
+        table = blocks["nk"]
+        if table.ndim != 2 or table.shape[1] < 2:
+            raise ValueError(f"{path}: nk table needs wavelength and n columns")
+        wl, n = table[:, 0], table[:, 1]
+        k = table[:, 2] if table.shape[1] > 2 else np.zeros_like(n)
+    elif "n" in blocks:
+        wl, n = blocks["n"][:, 0], blocks["n"][:, 1]
+        if "k" in blocks:
+            # k is often measured on another grid; bring it onto the n grid,
+            # kept to where both were measured instead of extrapolating k
+            wl_k, k = blocks["k"][:, 0], blocks["k"][:, 1]
+            inside = (wl >= wl_k.min()) & (wl <= wl_k.max())
+            if np.count_nonzero(inside) < 2:
+                raise ValueError(f"{path}: n and k tables do not overlap")
+            wl, n = wl[inside], n[inside]
+            k = np.interp(wl, wl_k, k)
+        else:
+            k = np.zeros_like(n)
+    else:
+        raise ValueError(f"{path}: no tabulated n or nk data found")
+
+    order = np.argsort(wl, kind="stable")
+    return wl[order], n[order], k[order]
+
+
+def read_nk_file(path: str | PathLike) -> RefractiveIndex:
+    wl_um, n, k = _read_arrays(str(path))
+    return RefractiveIndex(n=n, k=k, wl=WavelengthArray(wl_um, "um"))
+
+
+def _collect(
+    source: str | PathLike | Iterable[str | PathLike],
+) -> List[Tuple[str, Path]]:
+    if isinstance(source, (str, PathLike)) and Path(source).is_dir():
+        root = Path(source)
+        paths = sorted(
+            p for p in root.rglob("*") if p.suffix.lower() in SUPPORTED_SUFFIXES
+        )
+        return [(p.relative_to(root).with_suffix("").as_posix(), p) for p in paths]
+    if isinstance(source, (str, PathLike)):
+        source = [source]
+    return [(Path(p).stem, Path(p)) for p in source]
+
+
+def iter_library(
+    source: str | PathLike | Iterable[str | PathLike],
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[Tuple[str, RefractiveIndex]]:
+    entries = _collect(source)
+    names = [name for name, _ in entries]
+    paths = [str(path) for _, path in entries]
+
+    if workers == 1 or len(paths) <= 1:
+        results = map(_read_arrays, paths)
+        for name, (wl_um, n, k) in zip(names, results):
+            yield name, RefractiveIndex(n=n, k=k, wl=WavelengthArray(wl_um, "um"))
+        return
+
+    # Imported here: multiprocessing is slow to load and only needed for pools
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_read_arrays, paths, chunksize=chunksize)
+        for name, (wl_um, n, k) in zip(names, results):
+            yield name, RefractiveIndex(n=n, k=k, wl=WavelengthArray(wl_um, "um"))
+
+
+def compile_library(
+    source: str | PathLike | Iterable[str | PathLike],
+    destination: str | PathLike,
+    workers: int | None = None,
+) -> int:
+    names, wls, ns, ks = [], [], [], []
+    for name, index in iter_library(source, workers=workers):
+        names.append(name)
+        wls.append(np.asarray(index.wl))
+        ns.append(np.asarray(index.n))
+        ks.append(np.asarray(index.k))
+
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum([wl.size for wl in wls], out=offsets[1:])
+    # Uncompressed on purpose: loading is then a plain read of each array.
+    np.savez(
+        destination,
+        names=np.array(names, dtype=np.str_),
+        offsets=offsets,
+        wl=np.concatenate(wls) if wls else np.empty(0),
+        n=np.concatenate(ns) if ns else np.empty(0),
+        k=np.concatenate(ks) if ks else np.empty(0),
+    )
+    return len(names)
+
+
+def load_library(path: str | PathLike) -> Dict[str, RefractiveIndex]:
+    with np.load(path) as data:
+        names = data["names"]
+        offsets = data["offsets"]
+        wl, n, k = data["wl"], data["n"], data["k"]
+
+    library = {}
+    for i, name in enumerate(names):
+        part = slice(offsets[i], offsets[i + 1])
+        library[str(name)] = RefractiveIndex(
+            n=n[part], k=k[part], wl=WavelengthArray.from_base(wl[part])
+        )
+    return library
@@ -0,0 +1,90 @@
+from os import PathLike
+from typing import Dict, Iterable, Iterator, Tuple
+
+from .materials import RefractiveIndex
+
+SUPPORTED_SUFFIXES: Tuple[str, ...]
+
+def read_nk_file(path: str | PathLike) -> RefractiveIndex:
+    """Read one tabulated n,k file in refractiveindex.info style.
+
+    YAML files (.yml/.yaml) may hold a 'tabulated nk' block, or a
+    'tabulated n' block with an optional 'tabulated k' block. CSV files may
+    hold one 'wl,n,k' table or a 'wl,n' table followed by a 'wl,k' table.
+    Wavelengths are in micrometers. A k table on another grid is linearly
+    interpolated onto the n grid, which is cut to the range the k table
+    covers rather than extending k past its data. A missing k is taken as
+    zero.
+
+    Args:
+        path: File to read
+
+    Returns:
+        RefractiveIndex sorted by wavelength
+
+    Raises:
+        ValueError: If the file holds no tabulated n data, uses a data type
+            other than 'tabulated n', 'tabulated k' or 'tabulated nk', the
+            table is not numeric, or the n and k tables share fewer than two
+            wavelengths. The message starts with the file path
+    """
+    ...
+
+def iter_library(
+    source: str | PathLike | Iterable[str | PathLike],
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[Tuple[str, RefractiveIndex]]:
+    """Stream RefractiveIndex objects from many n,k files.
+
+    Files are parsed in a process pool and yielded in a stable order as
+    they become available, so a library never has to be held in memory at
+    once.
+
+    Args:
+        source: A directory (searched recursively for .yml, .yaml and .csv
+            files), a single file or an iterable of files
+        workers: Number of worker processes; 1 parses in this process and
+            None uses one per CPU
+        chunksize: Files handed to a worker at a time
+
+    Yields:
+        (name, RefractiveIndex) pairs. For a directory the name is the path
+        relative to it without suffix (e.g. 'main/SiO2/Malitson'),
+        otherwise the file stem.
+
+    Raises:
+        ValueError: If a file cannot be parsed
+    """
+    ...
+
+def compile_library(
+    source: str | PathLike | Iterable[str | PathLike],
+    destination: str | PathLike,
+    workers: int | None = None,
+) -> int:
+    """Convert a library of n,k files once into a compact binary .npz file.
+
+    All tables are concatenated into a handful of arrays, so load_library
+    does a few plain reads instead of parsing thousands of text files.
+
+    Args:
+        source: Same as for iter_library
+        destination: Output .npz path
+        workers: Same as for iter_library
+
+    Returns:
+        Number of materials written
+    """
+    ...
+
+def load_library(path: str | PathLike) -> Dict[str, RefractiveIndex]:
+    """Load a library written by compile_library.
+
+    Args:
+        path: The .npz file
+
+    Returns:
+        Mapping of material name to RefractiveIndex
+    """
+    ...
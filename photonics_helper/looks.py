@@ -1,11 +1,43 @@
-from rich.console import Console
+_console = None
 
-console = Console()
+_verbose = False
+
+
+def __getattr__(name: str):
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def install_traceback(**kwargs):
+    from rich.traceback import install
+
+    return install(**kwargs)
+
+
+def set_verbose(enabled: bool = True):
+    global _verbose
+    _verbose = enabled
+
+
+def is_verbose() -> bool:
+    return _verbose
 
 
 def c_error(msg: str):
-    console.print(f"[bold red]:x: {msg}[/bold red]")
+    get_console().print(f"[bold red]:x: {msg}[/bold red]")
 
 
 def c_info(msg: str):
-    console.print(f"[bold blue]{msg}[/bold blue]")
+    if not _verbose:
+        return
+    get_console().print(f"[bold blue]{msg}[/bold blue]")
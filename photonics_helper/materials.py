@@ -1,21 +1,36 @@
-from .base import WavelengthArray
-
-from typing import List, Self, Tuple
+from .base import (
+    C_MS,
+    PI,
+    Wavelength,
+    WavelengthArray,
+    _grid_limits,
+    complex_dtype,
+    resolve_dtype,
+)
+from .lazy import LazyArray
+from .sellmeier import sellmeier_derivatives, sellmeier_table
+from ._interp import make_splrep
+from . import instrument
+
+from typing import List, Literal, Self, Tuple
 from numpy.typing import NDArray
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.interpolate import make_splrep
-from rich.traceback import install
-
-install()
 
 
 class RefractiveIndex:
-    def __init__(self, n: NDArray, k: NDArray, wl: WavelengthArray) -> None:
-        self._n = n
-        self._k = k
-        self._wl = wl
+    def __init__(self, n: NDArray, k: NDArray, wl: WavelengthArray, dtype=None) -> None:
+        # Without an explicit dtype the precision of the wavelengths is kept
+        if dtype is None and np.asarray(wl).dtype in (np.float32, np.float64):
+            dtype = np.asarray(wl).dtype
+        self._dtype = resolve_dtype(dtype)
+        self._n = np.asanyarray(n, dtype=self._dtype)
+        self._k = np.asanyarray(k, dtype=self._dtype)
+        self._wl = wl.astype(self._dtype, copy=False)
+        # (A0, A, B, form) when built from Sellmeier coefficients, so that
+        # derivatives can use the closed form instead of a spline
+        self._sellmeier = None
+        self.clear_cache()
 
     @property
     def n(self) -> NDArray:
@@ -33,35 +48,151 @@ class RefractiveIndex:
     def nk(self) -> NDArray:
         return self._n + self._k
 
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def n_complex(self) -> NDArray:
+        values = np.empty(self._n.shape, dtype=complex_dtype(self._dtype))
+        values.real = self._n
+        values.imag = self._k
+        return values
+
     @classmethod
     def from_complex(cls, nk: NDArray, wl: WavelengthArray) -> Self:
         return cls(n=np.real(nk), k=np.imag(nk), wl=wl)
 
-    def n_func(self, wavelength: float):
-        if wavelength < min(self._wl) and wavelength > max(self._wl):
+    def clear_cache(self):
+        self._splines = {}
+        self._limits = _grid_limits(self._wl, self._dtype)
+
+    def _spline(self, quantity: Literal["n", "k", "nk"]):
+        spline = self._splines.get(quantity)
+        if instrument.enabled:
+            hit = "hits" if spline is not None else "misses"
+            instrument.count(f"materials.spline_cache.{hit}")
+        if spline is None:
+            if quantity == "n":
+                values = self._n
+            elif quantity == "k":
+                values = self._k
+            else:
+                values = self.nk
+            spline = make_splrep(np.asarray(self._wl), values)
+            self._splines[quantity] = spline
+        return instrument.timed("materials.spline_eval", spline)
+
+    def check_wavelength_limit(self, wavelength: float | NDArray):
+        min, max = self._limits
+        if isinstance(wavelength, np.ndarray):
+            out_of_range = wavelength.size > 0 and (
+                wavelength.min() < min or wavelength.max() > max
+            )
+        else:
+            out_of_range = wavelength < min or wavelength > max
+        if out_of_range:
             raise AttributeError(
-                "Index can be found only in between ({min(self._wl)}) and ({max(self._wl)})"
+                f"Index can be found only in between ({min}) and ({max})"
             )
-        fn = make_splrep(self._n, self._wl)
-        return fn(wavelength)
+
+    def n_func(self, wavelength: float):
+        self.check_wavelength_limit(wavelength)
+        return float(self._spline("n")(wavelength))
 
     def k_func(self, wavelength: float):
-        if wavelength < min(self._wl) and wavelength > max(self._wl):
-            raise AttributeError(
-                "Index can be found only in between ({min(self._wl)}) and ({max(self._wl)})"
-            )
-        fn = make_splrep(self._k, self._wl)
-        return fn(wavelength)
+        self.check_wavelength_limit(wavelength)
+        return float(self._spline("k")(wavelength))
 
     def nk_func(self, wavelength: float):
-        if wavelength < min(self._wl) and wavelength > max(self._wl):
-            raise AttributeError(
-                "Index can be found only in between ({min(self._wl)}) and ({max(self._wl)})"
+        self.check_wavelength_limit(wavelength)
+        return float(self._spline("nk")(wavelength))
+
+    def _eval_array(
+        self, quantity: Literal["n", "k", "nk"], wavelengths: WavelengthArray
+    ):
+        if isinstance(wavelengths, LazyArray):
+            # Evaluated chunk by chunk when the result is computed
+            return wavelengths.to_wl().map(lambda wl: self._eval_array(quantity, wl))
+        if not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
             )
-        fn = make_splrep(self.nk, self._wl)
-        return fn(wavelength)
+        wl = wavelengths.as_m
+        self.check_wavelength_limit(wl)
+        return self._spline(quantity)(wl).astype(self._dtype, copy=False)
+
+    def _derivative_spline(self, order: int):
+        key = ("n", order)
+        spline = self._splines.get(key)
+        if spline is None:
+            # Derivatives of the cached n spline, no additional fit
+            spline = self._spline("n").derivative(order)
+            self._splines[key] = spline
+        return instrument.timed("materials.spline_eval", spline)
+
+    def _n_derivatives(
+        self, wavelengths: WavelengthArray | None, order: int
+    ) -> Tuple[NDArray, List[NDArray]]:
+        # n and its derivatives up to order (per meter) at wavelengths in m
+        if wavelengths is None:
+            wavelengths = self._wl
+        elif not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        wl = wavelengths.as_m
+        self.check_wavelength_limit(wl)
+        if self._sellmeier is not None:
+            A0, A, B, form = self._sellmeier
+            n, dn, d2n = sellmeier_derivatives(A0, A, B, wavelengths, form=form)
+            derivatives = [n[0], dn[0], d2n[0]][: order + 1]
+            return wl, [d.reshape(wl.shape) for d in derivatives]
+        derivatives = [self._spline("n")(wl)]
+        derivatives += [self._derivative_spline(i)(wl) for i in range(1, order + 1)]
+        return wl, derivatives
+
+    def group_index(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        wl, (n, dn) = self._n_derivatives(wavelengths, 1)
+        # n_g = n - lambda * dn/dlambda
+        return (n - wl * dn).astype(self._dtype, copy=False)
+
+    def group_velocity(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        return (C_MS / self.group_index(wavelengths)).astype(self._dtype, copy=False)
+
+    def group_delay(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        # beta1 = 1 / v_g = n_g / c, in s/m
+        return (self.group_index(wavelengths) / C_MS).astype(self._dtype, copy=False)
+
+    def gvd(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        wl, (_, _, d2n) = self._n_derivatives(wavelengths, 2)
+        # beta2 = lambda^3 / (2 pi c^2) * d2n/dlambda2, in s^2/m
+        return (wl**3 / (2 * PI * C_MS**2) * d2n).astype(self._dtype, copy=False)
+
+    def walk_off(
+        self,
+        reference: Wavelength,
+        wavelengths: WavelengthArray | None = None,
+    ) -> NDArray:
+        if not isinstance(reference, Wavelength):
+            raise TypeError(
+                f"reference cannot process the type: {type(reference)}, required Wavelength"
+            )
+        delay = self.group_delay(wavelengths)
+        reference_delay = self.group_delay(WavelengthArray.from_base([reference]))
+        return delay - reference_delay[0]
+
+    def n_array(self, wavelengths: WavelengthArray) -> NDArray:
+        return self._eval_array("n", wavelengths)
+
+    def k_array(self, wavelengths: WavelengthArray) -> NDArray:
+        return self._eval_array("k", wavelengths)
+
+    def nk_array(self, wavelengths: WavelengthArray) -> NDArray:
+        return self._eval_array("nk", wavelengths)
 
     def plot(self, include_k: bool = True):
+        import matplotlib.pyplot as plt
 
         plt.plot(self._wl, self.n, label="n")
         plt.xlabel("wavelength [m]")
@@ -82,21 +213,18 @@ class RefractiveIndex:
         B: List[float],
         wl_from_to_in_um: Tuple[float, float],
         n_points=200,
+        dtype=None,
     ) -> Self:
         if len(A) != len(B):
             raise ValueError("Length of A and B should be same")
-        else:
-            n = []
-            wl = np.linspace(wl_from_to_in_um[0], wl_from_to_in_um[1], n_points)
-            wls = WavelengthArray(wl, "um")
-            for wl in wls.as_um:
-                sum = 0.0
-                for i in range(len(A)):
-                    sum += A[i] * wl**2 / (wl**2 - B[i] ** 2)
-                n.append(np.sqrt(A0 + sum))
-            k = np.zeros(len(wls))
-
-        return cls(n=np.array(n), k=k, wl=wls)
+        wl = np.linspace(wl_from_to_in_um[0], wl_from_to_in_um[1], n_points)
+        wls = WavelengthArray(wl, "um", dtype=dtype)
+        n = sellmeier_table(A0, A, B, wls, form="standard")[0]
+        k = np.zeros(len(wls), dtype=wls.dtype)
+
+        index = cls(n=n, k=k, wl=wls)
+        index._sellmeier = (A0, A, B, "standard")
+        return index
 
     @classmethod
     def from_alt_sellmeier(
@@ -106,18 +234,15 @@ class RefractiveIndex:
         B: List[float],
         wl_from_to_in_um: Tuple[float, float],
         n_points=200,
+        dtype=None,
     ) -> Self:
         if len(A) != len(B):
             raise ValueError("Length of A and B should be same")
-        else:
-            n = []
-            wl = np.linspace(wl_from_to_in_um[0], wl_from_to_in_um[1], n_points)
-            wls = WavelengthArray(wl, "m")
-            for wl in wls.as_um:
-                sum = 0.0
-                for i in range(len(A)):
-                    sum += A[i] / (wl**2 - B[i] ** 2)
-                n.append(np.sqrt(A0 + sum))
-            k = np.zeros(len(wls))
-
-        return cls(n=np.array(n), k=k, wl=wls)
+        wl = np.linspace(wl_from_to_in_um[0], wl_from_to_in_um[1], n_points)
+        wls = WavelengthArray(wl, "m", dtype=dtype)
+        n = sellmeier_table(A0, A, B, wls, form="alt")[0]
+        k = np.zeros(len(wls), dtype=wls.dtype)
+
+        index = cls(n=n, k=k, wl=wls)
+        index._sellmeier = (A0, A, B, "alt")
+        return index
@@ -1,23 +1,39 @@
 from __future__ import annotations
 
+import numpy as np
 from numpy.typing import NDArray
 from typing import List, Self, Tuple
 
-from .base import WavelengthArray
+from .base import Wavelength, WavelengthArray
+from .lazy import LazyArray
 
 class RefractiveIndex:
     """Represents refractive index data with real (n) and imaginary (k) components."""
 
-    def __init__(self, n: NDArray, k: NDArray, wl: WavelengthArray) -> None:
+    def __init__(
+        self, n: NDArray, k: NDArray, wl: WavelengthArray, dtype=None
+    ) -> None:
         """Initialize refractive index data.
 
         Args:
             n: Array of real refractive index values
             k: Array of extinction coefficient values
             wl: Array of wavelengths at which n,k are defined
+            dtype: Storage type, float32/float64 or 'single'/'double'.
+                Defaults to the dtype of wl.
         """
         ...
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating point type of n, k and wl."""
+        ...
+
+    @property
+    def n_complex(self) -> NDArray:
+        """Complex index n + ik, complex64 for float32 storage."""
+        ...
+
     @property
     def n(self) -> NDArray:
         """Real part of the refractive index."""
@@ -51,11 +67,30 @@ class RefractiveIndex:
         """
         ...
 
+    def clear_cache(self) -> None:
+        """Drop the fitted splines and recompute the wavelength bounds.
+
+        Splines are fitted once per quantity on first use. Call this after
+        modifying n, k or the wavelength array in place.
+        """
+        ...
+
+    def check_wavelength_limit(self, wavelength: float | NDArray) -> None:
+        """Check that a wavelength, or array of wavelengths, is in range.
+
+        Args:
+            wavelength: Wavelength(s) in meters
+
+        Raises:
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
     def n_func(self, wavelength: float) -> float:
         """Interpolate real refractive index at a specific wavelength.
 
         Args:
-            wavelength: Target wavelength
+            wavelength: Target wavelength in meters
 
         Returns:
             Interpolated n value
@@ -69,7 +104,7 @@ class RefractiveIndex:
         """Interpolate extinction coefficient at a specific wavelength.
 
         Args:
-            wavelength: Target wavelength
+            wavelength: Target wavelength in meters
 
         Returns:
             Interpolated k value
@@ -80,19 +115,139 @@ class RefractiveIndex:
         ...
 
     def nk_func(self, wavelength: float) -> float:
-        """Interpolate complex refractive index at a specific wavelength.
+        """Interpolate the nk property at a specific wavelength.
 
         Args:
-            wavelength: Target wavelength
+            wavelength: Target wavelength in meters
 
         Returns:
-            Interpolated complex n+ik value
+            Interpolated nk value
         
         Raises:
             AttributeError: If wavelength is outside valid range
         """
         ...
 
+    def group_index(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        """Group index n_g = n - λ·dn/dλ over a wavelength array.
+
+        Indices built with from_sellmeier or from_alt_sellmeier use the
+        closed-form Sellmeier derivatives; others differentiate the cached
+        n spline, so no fit is repeated per call or per wavelength.
+
+        Args:
+            wavelengths: Target wavelengths, defaults to wl
+
+        Returns:
+            Array of n_g values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
+    def group_velocity(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        """Group velocity v_g = c/n_g in m/s, see group_index."""
+        ...
+
+    def group_delay(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        """Group delay per length β₁ = n_g/c in s/m, see group_index."""
+        ...
+
+    def gvd(self, wavelengths: WavelengthArray | None = None) -> NDArray:
+        """Group velocity dispersion β₂ = λ³/(2πc²)·d²n/dλ² in s²/m.
+
+        Args:
+            wavelengths: Target wavelengths, defaults to wl
+
+        Returns:
+            Array of β₂ values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
+    def walk_off(
+        self,
+        reference: Wavelength,
+        wavelengths: WavelengthArray | None = None,
+    ) -> NDArray:
+        """Walk-off β₁(λ) - β₁(reference) in s/m relative to a reference wavelength.
+
+        Multiply by a length to get the delay between a pulse at each
+        wavelength and one at the reference, for example pump and signal.
+
+        Args:
+            reference: Wavelength of the reference pulse
+            wavelengths: Target wavelengths, defaults to wl
+
+        Raises:
+            TypeError: If reference is not a Wavelength or wavelengths is not
+                a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
+    def n_array(
+        self, wavelengths: WavelengthArray | LazyArray
+    ) -> NDArray | LazyArray:
+        """Interpolate real refractive index over a wavelength array.
+
+        A LazyArray gives a LazyArray, evaluated chunk by chunk on compute().
+
+        Args:
+            wavelengths: Target wavelengths
+
+        Returns:
+            Array of n values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
+    def k_array(
+        self, wavelengths: WavelengthArray | LazyArray
+    ) -> NDArray | LazyArray:
+        """Interpolate extinction coefficient over a wavelength array.
+
+        A LazyArray gives a LazyArray, evaluated chunk by chunk on compute().
+
+        Args:
+            wavelengths: Target wavelengths
+
+        Returns:
+            Array of k values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
+    def nk_array(
+        self, wavelengths: WavelengthArray | LazyArray
+    ) -> NDArray | LazyArray:
+        """Interpolate the nk property over a wavelength array.
+
+        A LazyArray gives a LazyArray, evaluated chunk by chunk on compute().
+
+        Args:
+            wavelengths: Target wavelengths
+
+        Returns:
+            Array of nk values with the shape of wavelengths
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            AttributeError: If any wavelength is outside valid range
+        """
+        ...
+
     def plot(self, include_k: bool = True) -> None:
         """Plot refractive index data.
 
@@ -109,6 +264,7 @@ class RefractiveIndex:
         B: List[float],
         wl_from_to_in_um: Tuple[float, float],
         n_points: int = 200,
+        dtype=None,
     ) -> Self:
         """Create RefractiveIndex using Sellmeier equation.
 
@@ -118,6 +274,8 @@ class RefractiveIndex:
             B: List of wavelength coefficients
             wl_from_to_in_um: Tuple of (min, max) wavelength in micrometers
             n_points: Number of points to generate
+            dtype: Storage and computation type; None follows the precision
+                policy
 
         Returns:
             New RefractiveIndex instance
@@ -135,6 +293,7 @@ class RefractiveIndex:
         B: List[float],
         wl_from_to_in_um: Tuple[float, float],
         n_points: int = 200,
+        dtype=None,
     ) -> Self:
         """Create RefractiveIndex using alternative Sellmeier equation.
 
@@ -144,6 +303,8 @@ class RefractiveIndex:
             B: List of wavelength coefficients
             wl_from_to_in_um: Tuple of (min, max) wavelength in micrometers
             n_points: Number of points to generate
+            dtype: Storage and computation type; None follows the precision
+                policy
 
         Returns:
             New RefractiveIndex instance
@@ -0,0 +1,190 @@
+from .base import C_MS, PI, Wavelength, WavelengthArray
+from .derivatives import (
+    dispersion_from_neff,
+    is_uniform,
+    savgol_derivative,
+    uniform_derivative,
+)
+from .fiber import Dispersion, PropagationConstant
+from ._interp import make_splrep
+
+from typing import Dict, List, Literal, Self, Sequence, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+Method = Literal["auto", "finite_difference", "savgol", "spline"]
+
+
+def _first_derivative(
+    y: NDArray, wavelengths: WavelengthArray, method: Method, accuracy: int
+) -> NDArray:
+    wl = wavelengths.as_m
+    uniform = is_uniform(wl)
+    if method == "auto":
+        method = "finite_difference" if uniform else "spline"
+    if method == "spline":
+        return np.apply_along_axis(
+            lambda row: make_splrep(wl, row).derivative(1)(wl), -1, y
+        )
+    if method in ("finite_difference", "savgol"):
+        if not uniform:
+            raise ValueError(f"method '{method}' needs equally spaced wavelengths")
+        dx = wl[1] - wl[0]
+        if method == "finite_difference":
+            return uniform_derivative(y, dx, deriv=1, accuracy=accuracy)
+        return savgol_derivative(y, dx, deriv=1)
+    raise ValueError(
+        f"Unsupported method: {method} use 'auto', 'finite_difference', 'savgol' or 'spline'"
+    )
+
+
+class ModeSet:
+    def __init__(
+        self,
+        neff: NDArray,
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ):
+        if not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        # One contiguous (modes x wavelengths) block
+        neff = np.ascontiguousarray(np.atleast_2d(neff), dtype=float)
+        if neff.ndim != 2 or neff.shape[1] != wavelengths.size:
+            raise ValueError("neff should have shape (modes, len(wavelengths))")
+        if names is None:
+            names = [f"mode_{i}" for i in range(neff.shape[0])]
+        elif len(names) != neff.shape[0]:
+            raise ValueError("names needs one entry per mode")
+
+        self._neff = neff
+        self._wavelengths = wavelengths
+        self._names = list(names)
+        self.clear_cache()
+
+    def __repr__(self):
+        return (
+            f"ModeSet: {len(self)} modes, from wl: {self._wavelengths.min()} "
+            f"to {self._wavelengths.max()}"
+        )
+
+    def __len__(self) -> int:
+        return self._neff.shape[0]
+
+    def clear_cache(self):
+        self._derivatives: Dict[Tuple, NDArray] = {}
+
+    @property
+    def neff(self) -> NDArray:
+        return self._neff
+
+    @property
+    def wavelengths(self) -> WavelengthArray:
+        return self._wavelengths
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    @property
+    def beta(self) -> NDArray:
+        return 2 * PI * self._neff / self._wavelengths.as_m
+
+    def index(self, mode: int | str) -> int:
+        if isinstance(mode, str):
+            return self._names.index(mode)
+        return int(mode)
+
+    @classmethod
+    def from_propagation_constant(
+        cls,
+        beta: NDArray,
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ) -> Self:
+        if not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        neff = np.asarray(beta, dtype=float) * wavelengths.as_m / (2 * PI)
+        return cls(neff, wavelengths, names=names)
+
+    @classmethod
+    def stack(
+        cls,
+        neffs: Sequence[NDArray],
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ) -> Self:
+        return cls(np.stack(neffs), wavelengths, names=names)
+
+    def _dispersion_and_beta2(
+        self, method: Method, accuracy: int
+    ) -> Tuple[NDArray, NDArray]:
+        key = ("d2", method, accuracy)
+        if key not in self._derivatives:
+            self._derivatives[key] = dispersion_from_neff(
+                self._neff, self._wavelengths, method=method, accuracy=accuracy
+            )
+        return self._derivatives[key]
+
+    def dispersion(
+        self,
+        unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> NDArray:
+        if unit not in ("ps/nm.km", "s/m^2"):
+            raise ValueError(f"Unsupported unit: {unit} use 'ps/nm.km' or 's/m^2'")
+        dispersion, _ = self._dispersion_and_beta2(method, accuracy)
+        if unit == "ps/nm.km":
+            return dispersion * 1e6
+        return dispersion
+
+    def beta2(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        return self._dispersion_and_beta2(method, accuracy)[1]
+
+    def group_index(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        key = ("d1", method, accuracy)
+        if key not in self._derivatives:
+            self._derivatives[key] = _first_derivative(
+                self._neff, self._wavelengths, method, accuracy
+            )
+        # n_g = neff - lambda * dneff/dlambda
+        return self._neff - self._wavelengths.as_m * self._derivatives[key]
+
+    def group_delay(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        # beta1 = 1 / v_g = n_g / c, in s/m
+        return self.group_index(method, accuracy) / C_MS
+
+    def walk_off(
+        self,
+        reference: int | str | None = None,
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> NDArray:
+        delay = self.group_delay(method, accuracy)
+        if reference is None:
+            # Every pair at once: (modes, modes, wavelengths)
+            return delay[:, None, :] - delay[None, :, :]
+        return delay - delay[self.index(reference)]
+
+    def to_dispersion(
+        self,
+        mode: int | str,
+        central_wavelength_nm: float,
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> Dispersion:
+        dispersion, _ = self._dispersion_and_beta2(method, accuracy)
+        return Dispersion(
+            wavelengths=self._wavelengths,
+            values=dispersion[self.index(mode)],
+            unit="s/m^2",
+            central_wavelength=Wavelength(central_wavelength_nm, "nm"),
+        )
+
+    def to_propagation_constant(self, mode: int | str) -> PropagationConstant:
+        return PropagationConstant(self.beta[self.index(mode)], self._wavelengths)
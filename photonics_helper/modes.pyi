@@ -0,0 +1,176 @@
+from typing import List, Literal, Self, Sequence
+from numpy.typing import NDArray
+
+from .base import WavelengthArray
+from .fiber import Dispersion, PropagationConstant
+
+Method = Literal["auto", "finite_difference", "savgol", "spline"]
+
+class ModeSet:
+    """Effective indices of many modes on one shared wavelength grid.
+
+    The data is stored as a single contiguous (modes × wavelengths) array, so
+    dispersion, β₂, group index and walk-off are computed for all modes in
+    one vectorized pass along the wavelength axis instead of one Dispersion
+    object per mode. Derivatives are cached per method.
+    """
+
+    def __init__(
+        self,
+        neff: NDArray,
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Initialize a ModeSet.
+
+        Args:
+            neff: Effective indices with shape (modes, len(wavelengths)); a 1D
+                array is treated as a single mode
+            wavelengths: Wavelength grid shared by all modes
+            names: Optional mode labels, defaults to mode_0, mode_1, ...
+
+        Raises:
+            TypeError: If wavelengths is not a WavelengthArray
+            ValueError: If neff or names do not match the number of modes
+                and wavelengths
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+    def __len__(self) -> int: ...
+    def clear_cache(self) -> None:
+        """Drop cached derivatives; call after modifying neff in place."""
+        ...
+
+    @property
+    def neff(self) -> NDArray:
+        """Effective indices, shape (modes, wavelengths)."""
+        ...
+
+    @property
+    def wavelengths(self) -> WavelengthArray:
+        """Shared wavelength grid."""
+        ...
+
+    @property
+    def names(self) -> List[str]:
+        """Mode labels."""
+        ...
+
+    @property
+    def beta(self) -> NDArray:
+        """Propagation constants 2π·neff/λ in 1/m, shape (modes, wavelengths)."""
+        ...
+
+    def index(self, mode: int | str) -> int:
+        """Row of a mode given by position or name."""
+        ...
+
+    @classmethod
+    def from_propagation_constant(
+        cls,
+        beta: NDArray,
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ) -> Self:
+        """
+        Create a ModeSet from propagation constants.
+
+        Args:
+            beta: Propagation constants in 1/m, shape (modes, wavelengths)
+            wavelengths: Wavelength grid shared by all modes
+            names: Optional mode labels
+
+        Returns:
+            ModeSet object
+        """
+        ...
+
+    @classmethod
+    def stack(
+        cls,
+        neffs: Sequence[NDArray],
+        wavelengths: WavelengthArray,
+        names: Sequence[str] | None = None,
+    ) -> Self:
+        """Create a ModeSet from one neff curve per mode."""
+        ...
+
+    def dispersion(
+        self,
+        unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> NDArray:
+        """
+        Dispersion parameter D of every mode.
+
+        Args:
+            unit: Output unit
+            method: Differentiation method, see dispersion_from_neff
+            accuracy: Finite difference accuracy order
+
+        Returns:
+            D with shape (modes, wavelengths)
+
+        Raises:
+            ValueError: If the unit or method is not supported
+        """
+        ...
+
+    def beta2(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        """β₂ of every mode in s²/m, shape (modes, wavelengths)."""
+        ...
+
+    def group_index(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        """
+        Group index n_g = neff - λ·dneff/dλ of every mode.
+
+        Args:
+            method: Differentiation method; "auto" uses finite differences on
+                uniform grids and splines otherwise
+            accuracy: Finite difference accuracy order
+
+        Returns:
+            Group index with shape (modes, wavelengths)
+        """
+        ...
+
+    def group_delay(self, method: Method = "auto", accuracy: int = 4) -> NDArray:
+        """Group delay per length β₁ = n_g/c in s/m, shape (modes, wavelengths)."""
+        ...
+
+    def walk_off(
+        self,
+        reference: int | str | None = None,
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> NDArray:
+        """
+        Differential group delay between modes, in s/m.
+
+        Args:
+            reference: Mode to compare against; None returns every pair
+            method: Differentiation method
+            accuracy: Finite difference accuracy order
+
+        Returns:
+            β₁ - β₁(reference) with shape (modes, wavelengths), or the pairwise
+            β₁[i] - β₁[j] with shape (modes, modes, wavelengths)
+        """
+        ...
+
+    def to_dispersion(
+        self,
+        mode: int | str,
+        central_wavelength_nm: float,
+        method: Method = "auto",
+        accuracy: int = 4,
+    ) -> Dispersion:
+        """Dispersion object of one mode, see dispersion for method and accuracy."""
+        ...
+
+    def to_propagation_constant(self, mode: int | str) -> PropagationConstant:
+        """PropagationConstant object of one mode."""
+        ...
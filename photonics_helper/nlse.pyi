@@ -0,0 +1,221 @@
+from typing import Sequence, Self
+from numpy.typing import NDArray
+
+from .fiber import Dispersion, PropagationConstant
+
+class SplitStepSolver:
+    """Symmetric split-step Fourier solver for the nonlinear Schrödinger equation.
+
+    Solves ∂A/∂z = i D(i∂T) A - α/2 A + iγ|A|²A for a complex envelope A(T)
+    in √W, where D(Δω) = Σ βₘ/m! Δωᵐ is the dispersion operator. The
+    envelope follows E = A exp(-iω₀t).
+
+    The linear operator is built once per solver, the FFT is planned once
+    (pyfftw when installed, scipy.fft otherwise) and all work buffers are
+    allocated up front, so the step loop itself does not allocate arrays.
+    Consecutive half linear steps are merged, so each step costs one forward
+    and one backward FFT.
+
+    Attributes:
+        gamma: Nonlinear coefficient in 1/(W·m)
+        alpha: Power attenuation in 1/m
+        steps: Number of steps taken by the last propagate call
+    """
+
+    gamma: float
+    alpha: float
+    steps: int
+
+    def __init__(
+        self,
+        times: NDArray,
+        operator: NDArray,
+        gamma: float = 0.0,
+        alpha: float = 0.0,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Initialize a solver from a precomputed dispersion operator.
+
+        Args:
+            times: Equally spaced time grid in seconds
+            operator: D(Δω) in 1/m on the delta_omegas grid (FFT order)
+            gamma: Nonlinear coefficient in 1/(W·m)
+            alpha: Power attenuation in 1/m
+            workers: Number of FFT threads, None for the backend default
+
+        Raises:
+            ValueError: If times is not equally spaced or operator has
+                another length
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+    @property
+    def times(self) -> NDArray:
+        """Time grid in seconds."""
+        ...
+
+    @property
+    def delta_omegas(self) -> NDArray:
+        """Angular frequency offsets Δω of the FFT bins in rad/s (FFT order)."""
+        ...
+
+    @staticmethod
+    def frequency_grid(points: int, dt: float) -> NDArray:
+        """
+        Angular frequency offsets of the FFT bins for a time grid.
+
+        Args:
+            points: Number of time samples
+            dt: Time step in seconds
+
+        Returns:
+            Δω in rad/s in FFT order
+        """
+        ...
+
+    @classmethod
+    def from_betas(
+        cls,
+        times: NDArray,
+        betas: Sequence[float],
+        gamma: float = 0.0,
+        alpha: float = 0.0,
+        workers: int | None = None,
+    ) -> Self:
+        """
+        Create a solver from Taylor coefficients.
+
+        Args:
+            times: Equally spaced time grid in seconds
+            betas: β₂, β₃, ... in sᵐ/m
+            gamma: Nonlinear coefficient in 1/(W·m)
+            alpha: Power attenuation in 1/m
+            workers: Number of FFT threads
+
+        Returns:
+            SplitStepSolver object
+        """
+        ...
+
+    @classmethod
+    def from_propagation_constant(
+        cls,
+        beta: PropagationConstant,
+        times: NDArray,
+        center_omega: float,
+        gamma: float = 0.0,
+        alpha: float = 0.0,
+        order: int = 6,
+        workers: int | None = None,
+    ) -> Self:
+        """
+        Create a solver from a PropagationConstant expanded around center_omega.
+
+        Args:
+            beta: Propagation constant of the fiber
+            times: Equally spaced time grid in seconds
+            center_omega: Carrier angular frequency in rad/s
+            gamma: Nonlinear coefficient in 1/(W·m)
+            alpha: Power attenuation in 1/m
+            order: Highest dispersion order kept
+            workers: Number of FFT threads
+
+        Returns:
+            SplitStepSolver object
+
+        Raises:
+            ValueError: If center_omega lies outside the data of beta
+        """
+        ...
+
+    @classmethod
+    def from_dispersion(
+        cls,
+        dispersion: Dispersion,
+        times: NDArray,
+        wavelength_nm: float,
+        gamma: float = 0.0,
+        alpha: float = 0.0,
+        workers: int | None = None,
+    ) -> Self:
+        """
+        Create a solver using β₂ of a Dispersion object at one wavelength.
+
+        Args:
+            dispersion: Dispersion of the fiber
+            times: Equally spaced time grid in seconds
+            wavelength_nm: Carrier wavelength in nanometers
+            gamma: Nonlinear coefficient in 1/(W·m)
+            alpha: Power attenuation in 1/m
+            workers: Number of FFT threads
+
+        Returns:
+            SplitStepSolver object
+
+        Raises:
+            ValueError: If the wavelength is outside the dispersion data
+        """
+        ...
+
+    def propagate(
+        self,
+        field: NDArray,
+        length: float,
+        max_phase: float = 1e-2,
+        max_step: float | None = None,
+    ) -> NDArray:
+        """
+        Propagate an envelope over a fiber length.
+
+        The step size is chosen so that the peak nonlinear phase γP·h stays
+        below max_phase. Steps are rounded onto a fixed geometric ladder so
+        the exponentiated linear operator is only recomputed when the step
+        changes.
+
+        Args:
+            field: Complex envelope in √W on the times grid
+            length: Fiber length in meters
+            max_phase: Largest nonlinear phase per step in radians
+            max_step: Largest step in meters, defaults to length
+
+        Returns:
+            Envelope at the fiber output (a new array)
+
+        Raises:
+            ValueError: If field has another length, length is negative or
+                max_phase is not positive
+        """
+        ...
+
+def gaussian_pulse(
+    times: NDArray, fwhm: float, peak_power: float = 1.0, chirp: float = 0.0
+) -> NDArray:
+    """
+    Gaussian envelope √P₀ exp(-(1 + iC) T²/(2T₀²)).
+
+    Args:
+        times: Time grid in seconds
+        fwhm: Intensity full width at half maximum in seconds
+        peak_power: Peak power in W
+        chirp: Chirp parameter C
+
+    Returns:
+        Complex envelope in √W
+    """
+    ...
+
+def sech_pulse(times: NDArray, fwhm: float, peak_power: float = 1.0) -> NDArray:
+    """
+    Hyperbolic secant envelope √P₀ sech(T/T₀).
+
+    Args:
+        times: Time grid in seconds
+        fwhm: Intensity full width at half maximum in seconds
+        peak_power: Peak power in W
+
+    Returns:
+        Envelope in √W
+    """
+    ...
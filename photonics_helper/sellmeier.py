@@ -0,0 +1,158 @@
+from .base import WavelengthArray
+
+from typing import Literal, Sequence, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+
+def _as_table(values: Sequence | NDArray) -> NDArray | list:
+    # A (materials, terms) table, or a list of rows when they are ragged
+    try:
+        return np.atleast_2d(np.asarray(values, dtype=float))
+    except ValueError:
+        return [np.asarray(row, dtype=float).reshape(-1) for row in values]
+
+
+def _as_coefficient_tables(
+    A: Sequence | NDArray, B: Sequence | NDArray
+) -> Tuple[NDArray, NDArray]:
+    # Ragged rows (materials with fewer terms) are padded with zero terms,
+    # which contribute nothing to either Sellmeier form. Each A row must
+    # have as many terms as its B row, or a missing term would read as zero.
+    A, B = _as_table(A), _as_table(B)
+    if isinstance(A, np.ndarray) and isinstance(B, np.ndarray):
+        if A.shape != B.shape:
+            raise ValueError("Length of A and B should be same")
+        return A, B
+    A_rows, B_rows = list(A), list(B)
+    if [row.size for row in A_rows] != [row.size for row in B_rows]:
+        raise ValueError("Length of A and B should be same")
+    width = max((row.size for row in A_rows), default=0)
+    tables = np.zeros((2, len(A_rows), width))
+    for i, (a, b) in enumerate(zip(A_rows, B_rows)):
+        tables[0, i, : a.size] = a
+        tables[1, i, : b.size] = b
+    return tables[0], tables[1]
+
+
+def sellmeier_table(
+    A0: float | Sequence[float] | NDArray,
+    A: Sequence | NDArray,
+    B: Sequence | NDArray,
+    wavelengths: WavelengthArray,
+    form: Literal["standard", "alt"] = "standard",
+    chunk_size: int | None = None,
+    out: NDArray | None = None,
+) -> NDArray:
+    if form not in ("standard", "alt"):
+        raise ValueError(f"Unsupported form: {form} use 'standard' or 'alt'")
+    if not isinstance(wavelengths, WavelengthArray):
+        raise TypeError(
+            f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+        )
+
+    A, B = _as_coefficient_tables(A, B)
+    n_materials, n_terms = A.shape
+
+    A0 = np.asarray(A0, dtype=float).reshape(-1)
+    if A0.size == 1:
+        A0 = np.broadcast_to(A0, (n_materials,))
+    elif A0.size != n_materials:
+        raise ValueError("A0 needs one value per material")
+
+    wl_um = wavelengths.as_um.reshape(-1)
+    n_wl = wl_um.size
+    if chunk_size is None or chunk_size >= n_wl:
+        chunk_size = max(n_wl, 1)
+    elif chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer")
+
+    # Computed in the precision of the wavelengths (float32 or float64)
+    dtype = wl_um.dtype
+    if out is None:
+        out = np.empty((n_materials, n_wl), dtype=dtype)
+    elif out.shape != (n_materials, n_wl):
+        raise ValueError(
+            f"out should have shape {(n_materials, n_wl)}, got {out.shape}"
+        )
+
+    A = A.astype(dtype, copy=False)[:, :, None]
+    B2 = (B**2).astype(dtype, copy=False)[:, :, None]
+    A0 = A0.astype(dtype, copy=False)[:, None]
+    terms = np.empty((n_materials, n_terms, chunk_size), dtype=dtype)
+
+    for start in range(0, n_wl, chunk_size):
+        stop = min(start + chunk_size, n_wl)
+        wl2 = wl_um[start:stop] ** 2
+        block = terms[:, :, : stop - start]
+
+        np.subtract(wl2, B2, out=block)
+        if form == "standard":
+            np.divide(wl2, block, out=block)
+            np.multiply(A, block, out=block)
+        else:
+            np.divide(A, block, out=block)
+
+        chunk = out[:, start:stop]
+        np.sum(block, axis=1, out=chunk)
+        np.add(chunk, A0, out=chunk)
+        np.sqrt(chunk, out=chunk)
+
+    return out
+
+
+def sellmeier_derivatives(
+    A0: float | Sequence[float] | NDArray,
+    A: Sequence | NDArray,
+    B: Sequence | NDArray,
+    wavelengths: WavelengthArray,
+    form: Literal["standard", "alt"] = "standard",
+) -> Tuple[NDArray, NDArray, NDArray]:
+    if form not in ("standard", "alt"):
+        raise ValueError(f"Unsupported form: {form} use 'standard' or 'alt'")
+    if not isinstance(wavelengths, WavelengthArray):
+        raise TypeError(
+            f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+        )
+
+    A, B = _as_coefficient_tables(A, B)
+    A0 = np.asarray(A0, dtype=float).reshape(-1)
+    if A0.size not in (1, A.shape[0]):
+        raise ValueError("A0 needs one value per material")
+
+    # f = n^2 and its first two derivatives in micrometers, summed term by
+    # term. Both forms reduce to c/den with den = wl^2 - B^2: the standard
+    # term A wl^2/den equals A + A B^2/den, so c = A B^2 there and c = A in
+    # the alternative form.
+    wl = wavelengths.as_um.reshape(1, -1)
+    wl2 = wl**2
+    shape = (A.shape[0], wl.size)
+    f = np.empty(shape)
+    f[:] = A0[:, None]
+    if form == "standard":
+        f += A.sum(axis=1)[:, None]
+    f1 = np.zeros(shape)
+    f2 = np.zeros(shape)
+    inv = np.empty(shape)
+    term = np.empty(shape)
+    tmp = np.empty(shape)
+    for a, b2 in zip(A.T[:, :, None], (B**2).T[:, :, None]):
+        c = a * b2 if form == "standard" else a
+        np.subtract(wl2, b2, out=inv)
+        np.reciprocal(inv, out=inv)
+        np.multiply(c, inv, out=term)  # c/den
+        f += term
+        term *= inv  # c/den^2
+        np.multiply(wl, term, out=tmp)
+        tmp *= 2
+        f1 -= tmp
+        term *= inv  # c/den^3
+        np.multiply(6 * wl2 + 2 * b2, term, out=tmp)
+        f2 += tmp
+
+    n = np.sqrt(f)
+    dn = f1 / (2 * n)
+    d2n = f2 / (2 * n) - f1**2 / (4 * n**3)
+    # per micrometer -> per meter
+    return n, dn * 1e6, d2n * 1e12
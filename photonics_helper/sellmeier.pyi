@@ -0,0 +1,75 @@
+from numpy.typing import NDArray
+from typing import Literal, Sequence, Tuple
+
+from .base import WavelengthArray
+
+def sellmeier_table(
+    A0: float | Sequence[float] | NDArray,
+    A: Sequence | NDArray,
+    B: Sequence | NDArray,
+    wavelengths: WavelengthArray,
+    form: Literal["standard", "alt"] = "standard",
+    chunk_size: int | None = None,
+    out: NDArray | None = None,
+) -> NDArray:
+    """Evaluate Sellmeier equations for many materials over one wavelength grid.
+
+    Coefficients follow the micrometer convention of
+    RefractiveIndex.from_sellmeier. Each row of A and B describes one
+    material; rows with fewer terms are padded with zero terms, but every
+    row of A must have as many terms as the matching row of B.
+
+    standard: n² = A0 + Σ Aᵢ λ² / (λ² - Bᵢ²)
+    alt:      n² = A0 + Σ Aᵢ / (λ² - Bᵢ²)
+
+    Args:
+        A0: Offset coefficient, one per material or shared by all
+        A: Amplitude coefficients, shape (materials, terms) or (terms,)
+        B: Wavelength coefficients in micrometers, same shape as A
+        wavelengths: Wavelength grid
+        form: Which Sellmeier form to evaluate ('standard' or 'alt')
+        chunk_size: Number of wavelengths evaluated per pass. Peak scratch
+            memory is materials × terms × chunk_size floats. None evaluates
+            the whole grid in one pass.
+        out: Optional preallocated (materials, wavelengths) output array
+
+    Returns:
+        Refractive index table of shape (materials, wavelengths), computed
+        and stored in the dtype of wavelengths (float32 or float64)
+
+    Raises:
+        ValueError: If a row of A and B differ in length, A0 does not match
+            the number of materials, form is unknown or out has the wrong shape
+        TypeError: If wavelengths is not a WavelengthArray
+    """
+    ...
+
+def sellmeier_derivatives(
+    A0: float | Sequence[float] | NDArray,
+    A: Sequence | NDArray,
+    B: Sequence | NDArray,
+    wavelengths: WavelengthArray,
+    form: Literal["standard", "alt"] = "standard",
+) -> Tuple[NDArray, NDArray, NDArray]:
+    """Evaluate n and its exact first and second wavelength derivatives.
+
+    Takes the same coefficients as sellmeier_table and differentiates the
+    Sellmeier equation analytically.
+
+    Args:
+        A0: Offset coefficient, one per material or shared by all
+        A: Amplitude coefficients, shape (materials, terms) or (terms,)
+        B: Wavelength coefficients in micrometers, same shape as A
+        wavelengths: Wavelength grid
+        form: Which Sellmeier form to evaluate ('standard' or 'alt')
+
+    Returns:
+        (n, dn/dλ, d²n/dλ²), each of shape (materials, wavelengths), with
+        the derivatives per meter and per square meter
+
+    Raises:
+        ValueError: If a row of A and B differ in length, A0 does not match
+            the number of materials or form is unknown
+        TypeError: If wavelengths is not a WavelengthArray
+    """
+    ...
@@ -0,0 +1,442 @@
+from .base import UNIT_FACTORS, WavelengthArray, _unit_factor
+from .convert import _DOMAINS, plan_conversion
+from .fiber import Dispersion
+from .materials import RefractiveIndex
+from . import instrument
+
+from os import PathLike
+from typing import Any, Dict, List, Mapping, Tuple
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+import numpy as np
+
+# Seconds a batch stays open for concurrent requests to join it
+DEFAULT_WINDOW = 0.002
+
+# Values per batch; a full batch is evaluated without waiting for the window
+DEFAULT_MAX_BATCH = 2**14
+
+# Lines may carry vector requests, so allow more than asyncio's 64 KiB default
+_LINE_LIMIT = 2**24
+
+_DISPERSION_QUANTITIES = ("ps/nm.km", "s/m^2", "beta2")
+_INDEX_QUANTITIES = ("n", "k", "nk")
+
+# Exceptions re-raised by the client under their own type
+_ERRORS = {
+    error.__name__: error
+    for error in (ValueError, TypeError, AttributeError, KeyError, LookupError)
+}
+
+
+def _encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+class LookupServer:
+    def __init__(
+        self,
+        objects: Mapping[str, Dispersion | RefractiveIndex] | None = None,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        if window < 0:
+            raise ValueError("window should be non-negative")
+        if max_batch < 1:
+            raise ValueError("max_batch should be a positive integer")
+        self._objects: Dict[str, Dispersion | RefractiveIndex] = {}
+        self._window = window
+        self._max_batch = max_batch
+        # key: [timer handle, [(values, future)], values queued]
+        self._pending: Dict[Tuple, list] = {}
+        self._server: asyncio.AbstractServer | None = None
+        self._address: str | Tuple[str, int] | None = None
+        for name, obj in (objects or {}).items():
+            self.add(name, obj)
+
+    def __repr__(self) -> str:
+        return f"LookupServer: {len(self._objects)} objects at {self._address}"
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._objects)
+
+    @property
+    def address(self) -> str | Tuple[str, int] | None:
+        return self._address
+
+    def add(self, name: str, obj: Dispersion | RefractiveIndex) -> None:
+        # Fit every spline up front so that no request pays for a fit
+        if isinstance(obj, Dispersion):
+            for quantity in _DISPERSION_QUANTITIES:
+                obj._spline(quantity, "m")
+        elif isinstance(obj, RefractiveIndex):
+            for quantity in _INDEX_QUANTITIES:
+                obj._spline(quantity)
+        else:
+            raise TypeError(
+                f"objects cannot process the type: {type(obj)}, required Dispersion or RefractiveIndex"
+            )
+        self._objects[name] = obj
+
+    def _lookup(self, name: str, cls: type) -> Dispersion | RefractiveIndex:
+        obj = self._objects.get(name)
+        if not isinstance(obj, cls):
+            raise KeyError(f"no {cls.__name__} named {name!r}")
+        return obj
+
+    def _key(self, request: dict) -> Tuple:
+        # Requests with equal keys are evaluated by one vectorized call
+        op = request.get("op")
+        if op == "dispersion":
+            quantity = request.get("quantity", "ps/nm.km")
+            if quantity not in _DISPERSION_QUANTITIES:
+                raise ValueError(
+                    f"Unsupported quantity: {quantity} use one of {_DISPERSION_QUANTITIES}"
+                )
+            self._lookup(request["name"], Dispersion)
+            unit = request.get("unit", "nm")
+            _unit_factor(UNIT_FACTORS["wavelength"], unit)
+            return (op, request["name"], unit, quantity)
+        if op == "index":
+            quantity = request.get("quantity", "n")
+            if quantity not in _INDEX_QUANTITIES:
+                raise ValueError(
+                    f"Unsupported quantity: {quantity} use one of {_INDEX_QUANTITIES}"
+                )
+            self._lookup(request["name"], RefractiveIndex)
+            unit = request.get("unit", "nm")
+            _unit_factor(UNIT_FACTORS["wavelength"], unit)
+            return (op, request["name"], unit, quantity)
+        if op == "convert":
+            key = (
+                op,
+                request["source"],
+                request["source_unit"],
+                request["target"],
+                request["target_unit"],
+            )
+            for domain in (key[1], key[3]):
+                if domain not in _DOMAINS:
+                    raise ValueError(
+                        f"Unsupported domain: {domain} use one of {list(_DOMAINS)}"
+                    )
+            # Validates the units
+            self._plan(key)
+            return key
+        raise ValueError(
+            f"Unsupported op: {op} use 'dispersion', 'index', 'convert' or 'names'"
+        )
+
+    @staticmethod
+    def _plan(key: Tuple):
+        _, source, source_unit, target, target_unit = key
+        return plan_conversion(
+            _DOMAINS[source][1], source_unit, _DOMAINS[target][1], target_unit
+        )
+
+    def _evaluate(self, key: Tuple, values: np.ndarray) -> np.ndarray:
+        op = key[0]
+        if op == "convert":
+            return self._plan(key)(values)
+
+        _, name, unit, quantity = key
+        wavelengths = WavelengthArray(values, unit)
+        if op == "dispersion":
+            dispersion = self._objects[name]
+            if quantity == "beta2":
+                return dispersion.get_beta2_array(wavelengths)
+            return dispersion.fn_array(wavelengths, quantity)
+
+        index = self._objects[name]
+        if quantity == "n":
+            return index.n_array(wavelengths)
+        if quantity == "k":
+            return index.k_array(wavelengths)
+        return index.nk_array(wavelengths)
+
+    async def evaluate(self, request: dict) -> float | list | List[str]:
+        if request.get("op") == "names":
+            return self.names
+        key = self._key(request)
+        value = request["wavelength" if key[0] != "convert" else "value"]
+        values = np.asarray(value, dtype=float)
+        if values.ndim > 1:
+            raise ValueError("values should be a number or a flat list")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.get(key)
+        if pending is None:
+            handle = loop.call_later(self._window, self._flush, key)
+            pending = self._pending[key] = [handle, [], 0]
+        pending[1].append((values, future))
+        pending[2] += values.size
+        if pending[2] >= self._max_batch:
+            pending[0].cancel()
+            self._flush(key)
+
+        result = await future
+        return float(result[0]) if values.ndim == 0 else result.tolist()
+
+    def _flush(self, key: Tuple) -> None:
+        _, entries, size = self._pending.pop(key)
+        if instrument.enabled:
+            instrument.count("server.batches")
+            instrument.count("server.requests", len(entries))
+            instrument.count("server.values", size)
+        self._run(key, entries, size)
+
+    def _run(self, key: Tuple, entries: list, size: int) -> None:
+        values = np.concatenate([v.reshape(-1) for v, _ in entries])
+        try:
+            with instrument.timer("server.evaluate", size):
+                results = self._evaluate(key, values)
+        except Exception as error:
+            if len(entries) == 1:
+                if not entries[0][1].done():
+                    entries[0][1].set_exception(error)
+                return
+            # One bad value (say, out of range) fails the whole batch; retry
+            # every request on its own so that only the bad ones fail.
+            for entry in entries:
+                self._run(key, [entry], entry[0].size)
+            return
+
+        bounds = np.cumsum([v.size for v, _ in entries])[:-1]
+        for (_, future), result in zip(entries, np.split(results, bounds)):
+            if not future.done():
+                future.set_result(result)
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            message = {"id": request_id, "result": await self.evaluate(request)}
+        except Exception as error:
+            message = {
+                "id": request_id,
+                "error": str(error),
+                "type": type(error).__name__,
+            }
+        writer.write(_encode(message))
+        await writer.drain()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Every line is answered by its own task, so requests pipelined on one
+        # connection join the same batch; replies carry the request id.
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(
+        self,
+        path: str | PathLike | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> str | Tuple[str, int]:
+        if self._server is not None:
+            raise RuntimeError("server is already running")
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path, limit=_LINE_LIMIT
+            )
+            self._address = str(path)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, host, port, limit=_LINE_LIMIT
+            )
+            self._address = self._server.sockets[0].getsockname()[:2]
+        return self._address
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("server is not running, call start() first")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LookupServer":
+        if self._server is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+class LookupClient:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    def __repr__(self) -> str:
+        return f"LookupClient: {len(self._waiting)} requests in flight"
+
+    @classmethod
+    async def connect(
+        cls,
+        path: str | PathLike | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ) -> "LookupClient":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=_LINE_LIMIT)
+        elif port is not None:
+            reader, writer = await asyncio.open_connection(
+                host, port, limit=_LINE_LIMIT
+            )
+        else:
+            raise ValueError("either path or port is required")
+        return cls(reader, writer)
+
+    async def _receive(self) -> None:
+        try:
+            while line := await self._reader.readline():
+                message = json.loads(line)
+                future = self._waiting.pop(message["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in message:
+                    error = _ERRORS.get(message["type"], RuntimeError)
+                    future.set_exception(error(message["error"]))
+                else:
+                    future.set_result(message["result"])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("server closed the connection")
+                    )
+            self._waiting.clear()
+
+    async def request(self, op: str, **params: Any) -> Any:
+        if self._receiver.done():
+            raise ConnectionError("server closed the connection")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(_encode({"id": request_id, "op": op, **params}))
+        await self._writer.drain()
+        return await future
+
+    async def names(self) -> List[str]:
+        return await self.request("names")
+
+    async def dispersion(
+        self,
+        name: str,
+        wavelength: float | List[float],
+        unit: str = "nm",
+        quantity: str = "ps/nm.km",
+    ) -> float | List[float]:
+        return await self.request(
+            "dispersion", name=name, wavelength=wavelength, unit=unit, quantity=quantity
+        )
+
+    async def index(
+        self,
+        name: str,
+        wavelength: float | List[float],
+        unit: str = "nm",
+        quantity: str = "n",
+    ) -> float | List[float]:
+        return await self.request(
+            "index", name=name, wavelength=wavelength, unit=unit, quantity=quantity
+        )
+
+    async def convert(
+        self,
+        value: float | List[float],
+        source: str,
+        source_unit: str,
+        target: str,
+        target_unit: str,
+    ) -> float | List[float]:
+        return await self.request(
+            "convert",
+            value=value,
+            source=source,
+            source_unit=source_unit,
+            target=target,
+            target_unit=target_unit,
+        )
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._receiver
+
+    async def __aenter__(self) -> "LookupClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+def main(argv=None) -> int:
+    from .library import load_library
+
+    parser = argparse.ArgumentParser(
+        description="Serve refractive index lookups from compiled libraries"
+    )
+    parser.add_argument("library", nargs="+", help=".npz files from compile_library")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args(argv)
+
+    server = LookupServer(window=args.window, max_batch=args.max_batch)
+    for path in args.library:
+        for name, index in load_library(path).items():
+            server.add(name, index)
+
+    async def run():
+        address = await server.start(args.socket, args.host, args.port)
+        print(f"serving {len(server.names)} materials on {address}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
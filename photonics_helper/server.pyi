@@ -0,0 +1,234 @@
+import asyncio
+from os import PathLike
+from typing import Any, List, Literal, Mapping, Tuple
+
+from .fiber import Dispersion
+from .materials import RefractiveIndex
+
+DEFAULT_WINDOW: float
+"""Seconds a batch stays open for concurrent requests to join it (2 ms)."""
+
+DEFAULT_MAX_BATCH: int
+"""Values after which a batch is evaluated without waiting (2**14)."""
+
+class LookupServer:
+    """Local asyncio server for dispersion, index and unit-conversion lookups.
+
+    Keeps Dispersion and RefractiveIndex objects in memory with their
+    splines already fitted, so client processes do not import their own
+    material tables. Concurrent requests for the same quantity (the same
+    object, unit and quantity, or the same conversion) are coalesced.
+    The first one opens a batch, and every request arriving within window
+    seconds joins it. The batch is then evaluated by a single vectorized
+    call, so a thousand single-point lookups cost about one array lookup.
+    If a batch fails, for example because one wavelength is out of range,
+    its requests are retried one by one so that only the bad ones fail.
+
+    The server listens on a Unix socket or on localhost TCP. The protocol is
+    newline-delimited JSON, and replies carry the id of their request, so
+    one connection can pipeline many requests:
+
+        {"id": 1, "op": "dispersion", "name": "smf28", "wavelength": 1550}
+        {"id": 1, "result": 16.9}
+
+    Ops are "dispersion" (name, wavelength, unit, quantity "ps/nm.km",
+    "s/m^2" or "beta2"), "index" (name, wavelength, unit, quantity "n", "k"
+    or "nk"), "convert" (value, source, source_unit, target, target_unit,
+    with domains "wavelength", "frequency", "angular frequency" or
+    "wavenumber") and "names". A wavelength or value may be a number or a
+    flat list. Errors are returned as {"id", "error", "type"}.
+
+    The module is not imported by photonics_helper itself. Run
+    ``python -m photonics_helper.server library.npz --socket PATH`` to serve
+    a library written by compile_library.
+
+    Example:
+        >>> async with LookupServer({"smf28": dispersion}) as server:
+        ...     host, port = server.address
+        ...     async with await LookupClient.connect(port=port) as client:
+        ...         await client.dispersion("smf28", 1550)
+    """
+
+    def __init__(
+        self,
+        objects: Mapping[str, Dispersion | RefractiveIndex] | None = None,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """
+        Initialize a LookupServer.
+
+        Args:
+            objects: Objects to serve by name
+            window: Seconds a batch waits for more requests. 0 still
+                coalesces requests that arrive in the same event loop pass
+            max_batch: Values after which a batch is evaluated at once
+
+        Raises:
+            ValueError: If window is negative or max_batch < 1
+            TypeError: If an object is not a Dispersion or RefractiveIndex
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+    @property
+    def names(self) -> List[str]:
+        """Sorted names of the served objects."""
+        ...
+
+    @property
+    def address(self) -> str | Tuple[str, int] | None:
+        """Socket path or (host, port) while running, else None."""
+        ...
+
+    def add(self, name: str, obj: Dispersion | RefractiveIndex) -> None:
+        """Serve obj under name, fitting all of its splines now.
+
+        Raises:
+            TypeError: If obj is not a Dispersion or RefractiveIndex
+        """
+        ...
+
+    async def evaluate(self, request: dict) -> float | list | List[str]:
+        """Answer one request in-process, batched with concurrent ones.
+
+        Args:
+            request: A request as described in the class docstring, without id
+
+        Returns:
+            A float for a scalar request, a list for a list request
+
+        Raises:
+            ValueError: If the op, quantity, unit or domain is not supported,
+                or a value is out of range
+            KeyError: If no object of the right type has that name
+            AttributeError: If a wavelength is outside the range of a
+                RefractiveIndex
+        """
+        ...
+
+    async def start(
+        self,
+        path: str | PathLike | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> str | Tuple[str, int]:
+        """
+        Start listening.
+
+        Args:
+            path: Unix socket path. When None, listen on TCP instead
+            host: TCP host
+            port: TCP port, 0 picks a free one
+
+        Returns:
+            The address, see address
+
+        Raises:
+            RuntimeError: If the server is already running
+        """
+        ...
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled.
+
+        Raises:
+            RuntimeError: If start has not been called
+        """
+        ...
+
+    async def close(self) -> None:
+        """Stop listening and wait until the listener is closed."""
+        ...
+
+    async def __aenter__(self) -> LookupServer:
+        """Start on a free localhost TCP port unless already started."""
+        ...
+
+    async def __aexit__(self, *exc) -> None: ...
+
+def main(argv: List[str] | None = None) -> int:
+    """Command line entry point serving compiled n,k libraries."""
+    ...
+
+class LookupClient:
+    """Asyncio client of LookupServer.
+
+    Requests are pipelined over one connection. Issue them concurrently,
+    for example with asyncio.gather, so the server can batch them. Errors
+    raised by the server are re-raised as ValueError, TypeError,
+    AttributeError or KeyError, other errors as RuntimeError.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    @classmethod
+    async def connect(
+        cls,
+        path: str | PathLike | None = None,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+    ) -> LookupClient:
+        """
+        Connect to a server on a Unix socket path or a TCP port.
+
+        Raises:
+            ValueError: If neither path nor port is given
+        """
+        ...
+
+    async def request(self, op: str, **params: Any) -> Any:
+        """Send one raw request and wait for its result.
+
+        Raises:
+            ConnectionError: If the connection is closed
+        """
+        ...
+
+    async def names(self) -> List[str]:
+        """Names of the objects the server holds."""
+        ...
+
+    async def dispersion(
+        self,
+        name: str,
+        wavelength: float | List[float],
+        unit: Literal["nm", "um", "m"] = "nm",
+        quantity: Literal["ps/nm.km", "s/m^2", "beta2"] = "ps/nm.km",
+    ) -> float | List[float]:
+        """Dispersion, or β₂ in s²/m, of a served Dispersion."""
+        ...
+
+    async def index(
+        self,
+        name: str,
+        wavelength: float | List[float],
+        unit: Literal["nm", "um", "m"] = "nm",
+        quantity: Literal["n", "k", "nk"] = "n",
+    ) -> float | List[float]:
+        """n, k or nk of a served RefractiveIndex."""
+        ...
+
+    async def convert(
+        self,
+        value: float | List[float],
+        source: str,
+        source_unit: str,
+        target: str,
+        target_unit: str,
+    ) -> float | List[float]:
+        """Convert between domains and units, as plan_conversion does.
+
+        Example:
+            >>> await client.convert(1550, "wavelength", "nm", "frequency", "THz")
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close the connection. Requests still waiting fail with ConnectionError."""
+        ...
+
+    async def __aenter__(self) -> LookupClient: ...
+    async def __aexit__(self, *exc) -> None: ...
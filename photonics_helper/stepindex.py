@@ -0,0 +1,250 @@
+from .base import PI, WavelengthArray
+from .fiber import Dispersion, PropagationConstant
+from .materials import RefractiveIndex
+from .modes import ModeSet
+
+from typing import Literal, Sequence, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+Medium = RefractiveIndex | float
+
+# Smallest cladding parameter w used in the characteristic equation; the
+# bound only matters at cutoff, where K_l(w) diverges.
+_MIN_W = 1e-12
+
+# Wavelengths solved from a full bracket scan before warm-starting the rest
+_COARSE_POINTS = 64
+
+
+def _index(medium: Medium, wavelengths: WavelengthArray) -> NDArray:
+    if isinstance(medium, RefractiveIndex):
+        return np.asarray(medium.n_array(wavelengths), dtype=float).reshape(-1)
+    if isinstance(medium, (int, float, np.number)):
+        return np.full(wavelengths.size, float(medium))
+    raise TypeError(
+        f"medium cannot process the type: {type(medium)}, required RefractiveIndex or a number"
+    )
+
+
+def _characteristic(l: int, s: NDArray, V: NDArray) -> NDArray:
+    # LP_lm eigenvalue equation in s = u/V, written without poles:
+    # u J_{l-1}(u) + w K_{l-1}(w)/K_l(w) J_l(u) = 0 with u^2 + w^2 = V^2
+    from scipy.special import jv, kve
+
+    u = s * V
+    w = np.maximum(V * np.sqrt(np.maximum(1 - s * s, 0)), _MIN_W)
+    # K_{-1} = K_1; the exponential scaling of kve cancels in the ratio
+    ratio = kve(abs(l - 1), w) / kve(l, w)
+    ratio = np.where(np.isfinite(ratio), ratio, 0.0)
+    return u * jv(l - 1, u) + w * ratio * jv(l, u)
+
+
+def _scan(l: int, m: int, V: NDArray) -> Tuple[NDArray, NDArray]:
+    # Bracket the m-th root of every row from sign changes on a grid of s;
+    # rows with fewer than m roots (mode cut off) get nan brackets.
+    samples = 16 * int(np.ceil(V.max() / PI)) + 32
+    s = np.arange(1, samples + 1) / samples
+    values = _characteristic(l, s[None, :], V[:, None])
+    changes = np.signbit(values[:, :-1]) != np.signbit(values[:, 1:])
+    counts = np.cumsum(changes, axis=1)
+    found = counts[:, -1] >= m
+    k = np.argmax(counts >= m, axis=1)
+    lower = np.where(found, s[k], np.nan)
+    upper = np.where(found, s[np.minimum(k + 1, samples - 1)], np.nan)
+    return lower, upper
+
+
+def _illinois(
+    l: int,
+    V: NDArray,
+    lower: NDArray,
+    upper: NDArray,
+    tol: float,
+    f_lower: NDArray | None = None,
+    f_upper: NDArray | None = None,
+    max_iterations: int = 100,
+) -> NDArray:
+    # Batched false position with the Illinois modification; every row keeps
+    # a sign-changing bracket and converges superlinearly.
+    a, b = lower.copy(), upper.copy()
+    fa = _characteristic(l, a, V) if f_lower is None else f_lower.copy()
+    fb = _characteristic(l, b, V) if f_upper is None else f_upper.copy()
+    root = b.copy()
+    active = np.flatnonzero(fb != 0)
+    root[fa == 0] = a[fa == 0]
+    active = active[fa[active] != 0]
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        ai, bi, fai, fbi = a[active], b[active], fa[active], fb[active]
+        c = bi - fbi * (bi - ai) / (fbi - fai)
+        fc = _characteristic(l, c, V[active])
+        crossed = np.signbit(fc) != np.signbit(fbi)
+        # The root moved past b: b becomes the new a. Otherwise halve fa so
+        # that the stale endpoint cannot stall the iteration.
+        a[active] = np.where(crossed, bi, ai)
+        fa[active] = np.where(crossed, fbi, fai / 2)
+        b[active], fb[active] = c, fc
+        root[active] = c
+        done = (np.abs(c - bi) <= tol) | (fc == 0)
+        active = active[~done]
+    return root
+
+
+class StepIndexFiber:
+    def __init__(self, core: Medium, cladding: Medium, radius: float):
+        if radius <= 0:
+            raise ValueError("radius should be positive")
+        self._core = core
+        self._cladding = cladding
+        self._radius = float(radius)
+
+    def __repr__(self):
+        return f"StepIndexFiber: core radius {self._radius} m"
+
+    @property
+    def core(self) -> Medium:
+        return self._core
+
+    @property
+    def cladding(self) -> Medium:
+        return self._cladding
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    def _indices(self, wavelengths: WavelengthArray) -> Tuple[NDArray, NDArray]:
+        if not isinstance(wavelengths, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+            )
+        n_core = _index(self._core, wavelengths)
+        n_cladding = _index(self._cladding, wavelengths)
+        if np.any(n_core <= n_cladding):
+            raise ValueError("core index should be larger than the cladding index")
+        return n_core, n_cladding
+
+    def v_number(self, wavelengths: WavelengthArray) -> NDArray:
+        n_core, n_cladding = self._indices(wavelengths)
+        wl = np.asarray(wavelengths.as_m, dtype=float).reshape(-1)
+        return 2 * PI * self._radius / wl * np.sqrt(n_core**2 - n_cladding**2)
+
+    def normalized_u(
+        self,
+        wavelengths: WavelengthArray,
+        l: int = 0,
+        m: int = 1,
+        tol: float = 1e-15,
+    ) -> NDArray:
+        if l < 0 or m < 1:
+            raise ValueError("LP modes need l >= 0 and m >= 1")
+        V = self.v_number(wavelengths)
+        s = np.full(V.size, np.nan)
+
+        # Warm start: bracket about _COARSE_POINTS wavelengths (evenly in V
+        # order) by a full scan, then bracket the rest tightly around the
+        # root interpolated from those neighbours. Rows whose narrow bracket
+        # does not hold a sign change fall back to the full scan.
+        order = np.argsort(V)
+        stride = max(1, V.size // _COARSE_POINTS)
+        coarse = order[np.unique(np.r_[np.arange(0, V.size, stride), V.size - 1])]
+        lower, upper = _scan(l, m, V[coarse])
+        guided = ~np.isnan(lower)
+        s[coarse[guided]] = _illinois(
+            l, V[coarse[guided]], lower[guided], upper[guided], tol
+        )
+
+        rest = np.setdiff1d(order, coarse)
+        if rest.size:
+            position = np.searchsorted(V[coarse], V[rest])
+            below = coarse[np.clip(position - 1, 0, coarse.size - 1)]
+            above = coarse[np.clip(position, 0, coarse.size - 1)]
+            guess = np.where(
+                V[above] > V[below],
+                s[below]
+                + (s[above] - s[below])
+                * (V[rest] - V[below])
+                / np.where(V[above] > V[below], V[above] - V[below], 1),
+                s[below],
+            )
+            width = 2 * np.abs(s[above] - s[below]) + 1e-9
+            lower = np.clip(guess - width, 0, 1)
+            upper = np.clip(guess + width, 0, 1)
+            fl = _characteristic(l, lower, V[rest])
+            fu = _characteristic(l, upper, V[rest])
+            # Roots of one l are about pi/V apart in s; wider brackets could
+            # hold the neighbouring mode
+            warm = (
+                ~np.isnan(guess)
+                & (np.signbit(fl) != np.signbit(fu))
+                & (2 * width < PI / V[rest] / 2)
+            )
+            s[rest[warm]] = _illinois(
+                l, V[rest[warm]], lower[warm], upper[warm], tol, fl[warm], fu[warm]
+            )
+            # A mode is guided only above its cutoff V, so rows between two
+            # cut-off neighbours are cut off as well
+            cut_off = np.isnan(s[below]) & np.isnan(s[above])
+            cold = rest[~warm & ~cut_off]
+            if cold.size:
+                lower, upper = _scan(l, m, V[cold])
+                guided = ~np.isnan(lower)
+                s[cold[guided]] = _illinois(
+                    l, V[cold[guided]], lower[guided], upper[guided], tol
+                )
+        return s
+
+    def neff(
+        self,
+        wavelengths: WavelengthArray,
+        l: int = 0,
+        m: int = 1,
+        tol: float = 1e-15,
+    ) -> NDArray:
+        n_core, n_cladding = self._indices(wavelengths)
+        s = self.normalized_u(wavelengths, l, m, tol)
+        # b = w^2/V^2 = 1 - s^2 and neff^2 = n_cl^2 + b (n_co^2 - n_cl^2)
+        b = 1 - s * s
+        neff = np.sqrt(n_cladding**2 + b * (n_core**2 - n_cladding**2))
+        return neff.reshape(wavelengths.shape)
+
+    def _guided_neff(self, wavelengths: WavelengthArray, l: int, m: int) -> NDArray:
+        neff = self.neff(wavelengths, l, m)
+        if np.any(np.isnan(neff)):
+            raise ValueError(f"LP{l}{m} is cut off within the wavelength range")
+        return neff
+
+    def dispersion(
+        self,
+        wavelengths: WavelengthArray,
+        central_wavelength_nm: float,
+        l: int = 0,
+        m: int = 1,
+        ignore_fit_error: bool = False,
+        method: Literal["auto", "finite_difference", "savgol", "spline"] = "auto",
+    ) -> Dispersion:
+        return Dispersion.from_neff(
+            self._guided_neff(wavelengths, l, m),
+            wavelengths,
+            central_wavelength_nm,
+            ignore_fit_error=ignore_fit_error,
+            method=method,
+        )
+
+    def propagation_constant(
+        self, wavelengths: WavelengthArray, l: int = 0, m: int = 1
+    ) -> PropagationConstant:
+        beta = 2 * PI * self._guided_neff(wavelengths, l, m) / wavelengths.as_m
+        return PropagationConstant(beta, wavelengths)
+
+    def mode_set(
+        self,
+        wavelengths: WavelengthArray,
+        modes: Sequence[Tuple[int, int]] = ((0, 1),),
+    ) -> ModeSet:
+        neffs = [self._guided_neff(wavelengths, l, m) for l, m in modes]
+        names = [f"LP{l}{m}" for l, m in modes]
+        return ModeSet.stack(neffs, wavelengths, names=names)
@@ -0,0 +1,115 @@
+from .base import UNIT_FACTORS, WavelengthArray, resolve_dtype
+from .fiber import Dispersion
+from .materials import RefractiveIndex
+
+from typing import Iterable, Iterator, Literal, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 2**16
+
+Chunk = Tuple[
+    WavelengthArray, NDArray | None, NDArray | None, NDArray | None, NDArray | None
+]
+
+
+def wavelength_chunks(
+    start: float,
+    stop: float,
+    points: int,
+    unit: Literal["nm", "um", "m"] = "nm",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype=None,
+) -> Iterator[WavelengthArray]:
+    if points < 2:
+        raise ValueError("points should be at least 2")
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer")
+    factor = UNIT_FACTORS["wavelength"].get(unit)
+    if factor is None:
+        raise ValueError(f"Unsupported unit: {unit} use 'nm', 'um' or 'm'")
+    start, stop = start * factor, stop * factor
+    step = (stop - start) / (points - 1)
+
+    size = min(chunk_size, points)
+    ramp = np.arange(size, dtype=np.float64)
+    scratch = np.empty(size, dtype=np.float64)
+    buffer = np.empty(size, dtype=resolve_dtype(dtype))
+    for offset in range(0, points, size):
+        m = min(size, points - offset)
+        # Same values as np.linspace(start, stop, points)[offset:offset + m]
+        np.multiply(ramp[:m], step, out=scratch[:m])
+        scratch[:m] += start + offset * step
+        if offset + m == points:
+            scratch[m - 1] = stop
+        buffer[:m] = scratch[:m]
+        yield WavelengthArray.from_base(buffer[:m])
+
+
+def _split(
+    wavelengths: Iterable[WavelengthArray], chunk_size: int
+) -> Iterator[WavelengthArray]:
+    for block in wavelengths:
+        if not isinstance(block, WavelengthArray):
+            raise TypeError(
+                f"wavelengths cannot process the type: {type(block)}, required WavelengthArray"
+            )
+        block = block.reshape(-1)
+        for offset in range(0, block.size, chunk_size):
+            yield block[offset : offset + chunk_size]
+
+
+def stream_spectrum(
+    wavelengths: Iterable[WavelengthArray],
+    dispersion: Dispersion | None = None,
+    index: RefractiveIndex | None = None,
+    unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Chunk]:
+    if dispersion is None and index is None:
+        raise ValueError("stream_spectrum needs a dispersion, an index or both")
+    if unit not in ("ps/nm.km", "s/m^2"):
+        raise ValueError(f"Unsupported unit: {unit} use 'ps/nm.km' or 's/m^2'")
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be a positive integer")
+
+    # One set of output buffers for the whole sweep; every chunk is a view
+    # into them, valid until the next chunk is produced.
+    buffers = {}
+    if dispersion is not None:
+        buffers["dispersion"] = np.empty(chunk_size, dtype=dispersion.dtype)
+        buffers["beta2"] = np.empty(chunk_size, dtype=dispersion.dtype)
+    if index is not None:
+        buffers["n"] = np.empty(chunk_size, dtype=index.dtype)
+        buffers["k"] = np.empty(chunk_size, dtype=index.dtype)
+
+    for wl in _split(wavelengths, chunk_size):
+        m = wl.size
+        d = beta2 = n = k = None
+        if dispersion is not None:
+            d = buffers["dispersion"][:m]
+            beta2 = buffers["beta2"][:m]
+            d[:] = dispersion.fn_array(wl, unit)
+            beta2[:] = dispersion.get_beta2_array(wl)
+        if index is not None:
+            n = buffers["n"][:m]
+            k = buffers["k"][:m]
+            n[:] = index.n_array(wl)
+            k[:] = index.k_array(wl)
+        yield wl, d, beta2, n, k
+
+
+def stream_range(
+    start: float,
+    stop: float,
+    points: int,
+    dispersion: Dispersion | None = None,
+    index: RefractiveIndex | None = None,
+    wavelength_unit: Literal["nm", "um", "m"] = "nm",
+    unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype=None,
+) -> Iterator[Chunk]:
+    chunks = wavelength_chunks(start, stop, points, wavelength_unit, chunk_size, dtype)
+    return stream_spectrum(chunks, dispersion, index, unit, chunk_size)
@@ -0,0 +1,101 @@
+from typing import Iterable, Iterator, Literal, Tuple
+from numpy.typing import NDArray
+
+from .base import WavelengthArray
+from .fiber import Dispersion
+from .materials import RefractiveIndex
+
+DEFAULT_CHUNK_SIZE: int
+"""Wavelengths per chunk when none is given (2**16)."""
+
+Chunk = Tuple[
+    WavelengthArray, NDArray | None, NDArray | None, NDArray | None, NDArray | None
+]
+"""(wavelengths, D, β₂, n, k) of one chunk; entries of a missing source are None."""
+
+def wavelength_chunks(
+    start: float,
+    stop: float,
+    points: int,
+    unit: Literal["nm", "um", "m"] = "nm",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype=None,
+) -> Iterator[WavelengthArray]:
+    """
+    Generate np.linspace(start, stop, points) in chunks without building it.
+
+    Every chunk is a view of one reused buffer, so it is only valid until
+    the next one is requested; copy it to keep it.
+
+    Args:
+        start: First wavelength
+        stop: Last wavelength, included
+        points: Total number of wavelengths
+        unit: Unit of start and stop
+        chunk_size: Wavelengths per chunk, the last chunk may be shorter
+        dtype: float32/float64 or 'single'/'double'; None follows the
+            global precision policy
+
+    Yields:
+        WavelengthArray chunks in meters
+
+    Raises:
+        ValueError: If points < 2, chunk_size < 1 or the unit is not supported
+    """
+    ...
+
+def stream_spectrum(
+    wavelengths: Iterable[WavelengthArray],
+    dispersion: Dispersion | None = None,
+    index: RefractiveIndex | None = None,
+    unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Chunk]:
+    """
+    Evaluate a Dispersion and/or RefractiveIndex over a stream of wavelengths.
+
+    Source blocks of any length are split into chunks of at most chunk_size
+    values. D, β₂, n and k are written into output buffers allocated once
+    for the whole sweep, so memory stays constant however long the stream
+    is. The yielded arrays are views of those buffers and are overwritten by
+    the next chunk: reduce or write them out before advancing, or copy them.
+
+    Args:
+        wavelengths: Iterable of WavelengthArray blocks, for example
+            wavelength_chunks() or arrays read from disk
+        dispersion: Source of D and β₂ (s²/m)
+        index: Source of n and k
+        unit: Unit of D
+        chunk_size: Maximum wavelengths per chunk
+
+    Yields:
+        (wavelengths, D, β₂, n, k) tuples
+
+    Raises:
+        ValueError: If neither source is given, the unit is not supported or
+            a chunk leaves the range of the Dispersion
+        AttributeError: If a chunk leaves the range of the RefractiveIndex
+        TypeError: If a block is not a WavelengthArray
+    """
+    ...
+
+def stream_range(
+    start: float,
+    stop: float,
+    points: int,
+    dispersion: Dispersion | None = None,
+    index: RefractiveIndex | None = None,
+    wavelength_unit: Literal["nm", "um", "m"] = "nm",
+    unit: Literal["ps/nm.km", "s/m^2"] = "s/m^2",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype=None,
+) -> Iterator[Chunk]:
+    """
+    stream_spectrum over an evenly spaced wavelength range.
+
+    Example:
+        >>> low = np.inf
+        >>> for wl, d, beta2, n, k in stream_range(1300, 1700, 10**9, dispersion):
+        ...     low = min(low, d.min())
+    """
+    ...
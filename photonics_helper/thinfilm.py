@@ -0,0 +1,266 @@
+from .base import PI, WavelengthArray, complex_dtype
+from .materials import RefractiveIndex
+
+from typing import Dict, List, Literal, Sequence, Tuple
+from numpy.typing import NDArray
+
+import numpy as np
+
+Medium = RefractiveIndex | complex | float
+
+# Cap on the imaginary phase of one layer; beyond it the layer is opaque and
+# exp(-i delta) would only overflow.
+_MAX_ATTENUATION = 35.0
+
+# Points per block of the solver
+_BLOCK_SIZE = 2**13
+
+
+def _complex_index(
+    medium: Medium, wavelengths: WavelengthArray, dtype: np.dtype
+) -> NDArray:
+    # Complex index n + ik on the (wavelengths, 1) grid
+    if isinstance(medium, RefractiveIndex):
+        values = np.empty(wavelengths.size, dtype=dtype)
+        values.real = medium.n_array(wavelengths)
+        values.imag = medium.k_array(wavelengths)
+    elif isinstance(medium, (int, float, complex, np.number)):
+        values = np.full(wavelengths.size, medium, dtype=dtype)
+    else:
+        raise TypeError(
+            f"layers cannot process the type: {type(medium)}, required RefractiveIndex or a number"
+        )
+    return values.reshape(-1, 1)
+
+
+def _forward_cos(n: NDArray, n_sin: NDArray) -> NDArray:
+    # cos(theta) in a medium of index n from Snell's invariant n0 sin(theta0),
+    # on the branch of the forward travelling (or decaying) wave
+    cos = np.sqrt(1 - (n_sin / n) ** 2)
+    n_cos = n * cos
+    forward = np.where(
+        np.abs(n_cos.imag) > 100 * np.finfo(n_cos.real.dtype).eps,
+        n_cos.imag > 0,
+        n_cos.real > 0,
+    )
+    return np.where(forward, cos, -cos)
+
+
+def _interface(
+    n_i: NDArray, cos_i: NDArray, n_j: NDArray, cos_j: NDArray, polarization: str
+) -> Tuple[NDArray, NDArray]:
+    # Fresnel coefficients r and 1/t from medium i into medium j
+    if polarization == "s":
+        den = n_i * cos_i + n_j * cos_j
+        return (n_i * cos_i - n_j * cos_j) / den, den / (2 * n_i * cos_i)
+    den = n_j * cos_i + n_i * cos_j
+    return (n_j * cos_i - n_i * cos_j) / den, den / (2 * n_i * cos_i)
+
+
+def _solve_block(
+    kz: List[NDArray],
+    thicknesses: NDArray,
+    interfaces: Dict[str, List[Tuple[NDArray, NDArray]]],
+    out: Dict[str, NDArray],
+) -> None:
+    # r and t only need the first column of the stack matrix
+    # M = I_01/t_01 · P_1 I_12/t_12 · ... · P_L I_L,L+1/t_L,L+1, so the vector
+    # M e_1 is built from the substrate side: each film applies
+    # v -> P_j I_j,j+1 v / t_j,j+1, a batched 2x2 product over the block.
+    shape = (thicknesses.shape[0], kz[0].size) if kz else out["r_s"].shape
+    dtype = out["r_s"].dtype
+    phase = np.empty(shape, dtype=dtype)
+    scratch = np.empty(shape, dtype=dtype)
+    vectors = {
+        polarization: (np.ones(shape, dtype=dtype), np.zeros(shape, dtype=dtype))
+        for polarization in ("s", "p")
+    }
+
+    for j in range(len(kz) - 1, -1, -1):
+        # exp(-i delta) with delta = kz d; the decay of opaque films is capped
+        np.multiply(thicknesses[:, j : j + 1], kz[j], out=phase)
+        phase *= -1j
+        np.minimum(phase.real, _MAX_ATTENUATION, out=phase.real)
+        np.exp(phase, out=phase)
+        for polarization, (v0, v1) in vectors.items():
+            r, inv_t = interfaces[polarization][j + 1]
+            # (v0, v1) -> (v0 + r v1, r v0 + v1)
+            np.multiply(v1, r, out=scratch)
+            scratch += v0
+            v0 *= r
+            v1 += v0
+            # -> (exp(-i delta) u0, exp(i delta) u1) / t
+            np.multiply(scratch, phase, out=v0)
+            v0 *= inv_t
+            v1 /= phase
+            v1 *= inv_t
+
+    for polarization, (v0, v1) in vectors.items():
+        r, inv_t = interfaces[polarization][0]
+        m00 = (v0 + r * v1) * inv_t
+        m10 = (r * v0 + v1) * inv_t
+        np.divide(m10, m00, out=out[f"r_{polarization}"])
+        np.divide(1, m00, out=out[f"t_{polarization}"])
+
+
+class ThinFilmResult:
+    def __init__(self, coefficients: Dict[str, NDArray], power: Dict[str, NDArray]):
+        self._coefficients = coefficients
+        self._power = power
+
+    def __repr__(self):
+        return f"ThinFilmResult: shape {self._power['R_s'].shape}"
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._power["R_s"].shape
+
+    @property
+    def r_s(self) -> NDArray:
+        return self._coefficients["r_s"]
+
+    @property
+    def r_p(self) -> NDArray:
+        return self._coefficients["r_p"]
+
+    @property
+    def t_s(self) -> NDArray:
+        return self._coefficients["t_s"]
+
+    @property
+    def t_p(self) -> NDArray:
+        return self._coefficients["t_p"]
+
+    @property
+    def R_s(self) -> NDArray:
+        return self._power["R_s"]
+
+    @property
+    def R_p(self) -> NDArray:
+        return self._power["R_p"]
+
+    @property
+    def T_s(self) -> NDArray:
+        return self._power["T_s"]
+
+    @property
+    def T_p(self) -> NDArray:
+        return self._power["T_p"]
+
+    @property
+    def A_s(self) -> NDArray:
+        return 1 - self._power["R_s"] - self._power["T_s"]
+
+    @property
+    def A_p(self) -> NDArray:
+        return 1 - self._power["R_p"] - self._power["T_p"]
+
+    def R(self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"):
+        return self._select("R", polarization)
+
+    def T(self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"):
+        return self._select("T", polarization)
+
+    def A(self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"):
+        return 1 - self.R(polarization) - self.T(polarization)
+
+    def _select(self, quantity: str, polarization: str) -> NDArray:
+        if polarization in ("s", "p"):
+            return self._power[f"{quantity}_{polarization}"]
+        if polarization == "unpolarized":
+            return (self._power[f"{quantity}_s"] + self._power[f"{quantity}_p"]) / 2
+        raise ValueError(
+            f"Unsupported polarization: {polarization} use 's', 'p' or 'unpolarized'"
+        )
+
+
+def transfer_matrix(
+    layers: Sequence[Medium],
+    thicknesses: Sequence[float] | NDArray,
+    wavelengths: WavelengthArray,
+    angles: float | Sequence[float] | NDArray = 0.0,
+    ambient: Medium = 1.0,
+    substrate: Medium = 1.0,
+) -> ThinFilmResult:
+    if not isinstance(wavelengths, WavelengthArray):
+        raise TypeError(
+            f"wavelengths cannot process the type: {type(wavelengths)}, required WavelengthArray"
+        )
+    thicknesses = np.asarray(thicknesses, dtype=float)
+    single_stack = thicknesses.ndim == 1
+    thicknesses = np.atleast_2d(thicknesses)
+    if thicknesses.ndim != 2 or thicknesses.shape[1] != len(layers):
+        raise ValueError(
+            "thicknesses should have shape (len(layers),) or (stacks, len(layers))"
+        )
+    angles = np.asarray(angles, dtype=float)
+    scalar_angle = angles.ndim == 0
+    angles = angles.reshape(-1)
+    if np.any(np.abs(angles) >= PI / 2):
+        raise ValueError("angles of incidence should be within (-pi/2, pi/2) radians")
+
+    wl = np.asarray(wavelengths.as_m).reshape(-1)
+    # Computed in the precision of the wavelengths (complex64 or complex128)
+    dtype = complex_dtype(wl.dtype)
+    thicknesses = thicknesses.astype(wl.dtype)
+    media = [
+        _complex_index(m, wavelengths, dtype) for m in (ambient, *layers, substrate)
+    ]
+
+    # Media, angles and interfaces live on the flattened (wavelength, angle)
+    # grid; only the film phases depend on the stack.
+    n_sin = media[0] * np.sin(angles).astype(wl.dtype).reshape(1, -1)
+    cos = [_forward_cos(n, n_sin).reshape(-1) for n in media]
+    media = [np.broadcast_to(n, (wl.size, angles.size)).reshape(-1) for n in media]
+    k0 = np.repeat(2 * PI / wl, angles.size)
+    kz = [k0 * media[j] * cos[j] for j in range(1, len(media) - 1)]
+    interfaces = {
+        polarization: [
+            _interface(media[j], cos[j], media[j + 1], cos[j + 1], polarization)
+            for j in range(len(media) - 1)
+        ]
+        for polarization in ("s", "p")
+    }
+
+    stacks, points = thicknesses.shape[0], k0.size
+    coefficients = {
+        name: np.empty((stacks, points), dtype=dtype)
+        for name in ("r_s", "r_p", "t_s", "t_p")
+    }
+    # Blocks of about _BLOCK_SIZE points keep the working set in cache
+    width = min(points, _BLOCK_SIZE)
+    height = max(1, _BLOCK_SIZE // width)
+    for top in range(0, stacks, height):
+        rows = slice(top, top + height)
+        for left in range(0, points, width):
+            columns = slice(left, left + width)
+            _solve_block(
+                [k[columns] for k in kz],
+                thicknesses[rows],
+                {
+                    polarization: [(r[columns], t[columns]) for r, t in pairs]
+                    for polarization, pairs in interfaces.items()
+                },
+                {name: values[rows, columns] for name, values in coefficients.items()},
+            )
+
+    n_in, cos_in, n_out, cos_out = media[0], cos[0], media[-1], cos[-1]
+    ratios = {
+        "s": (n_out * cos_out).real / (n_in * cos_in).real,
+        "p": (n_out * np.conj(cos_out)).real / (n_in * np.conj(cos_in)).real,
+    }
+    power = {}
+    for polarization, ratio in ratios.items():
+        power[f"R_{polarization}"] = np.abs(coefficients[f"r_{polarization}"]) ** 2
+        power[f"T_{polarization}"] = (
+            np.abs(coefficients[f"t_{polarization}"]) ** 2 * ratio
+        )
+
+    shape = (stacks, wl.size, angles.size)
+    if scalar_angle:
+        shape = shape[:-1]
+    if single_stack:
+        shape = shape[1:]
+    coefficients = {name: v.reshape(shape) for name, v in coefficients.items()}
+    power = {name: v.reshape(shape) for name, v in power.items()}
+    return ThinFilmResult(coefficients, power)
@@ -0,0 +1,144 @@
+from typing import Literal, Sequence, Tuple
+from numpy.typing import NDArray
+
+from .base import WavelengthArray
+from .materials import RefractiveIndex
+
+Medium = RefractiveIndex | complex | float
+"""A RefractiveIndex, or a constant (complex) index such as 1.0 for air."""
+
+class ThinFilmResult:
+    """Reflection and transmission of one or more stacks, from transfer_matrix.
+
+    Arrays have the shape (stacks, wavelengths, angles), without the stacks
+    axis for a single stack and without the angles axis for a scalar angle.
+    """
+
+    def __init__(self, coefficients: dict, power: dict) -> None: ...
+    def __repr__(self) -> str: ...
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of every result array."""
+        ...
+
+    @property
+    def r_s(self) -> NDArray:
+        """Complex amplitude reflection coefficient, s polarization."""
+        ...
+
+    @property
+    def r_p(self) -> NDArray:
+        """Complex amplitude reflection coefficient, p polarization."""
+        ...
+
+    @property
+    def t_s(self) -> NDArray:
+        """Complex amplitude transmission coefficient, s polarization."""
+        ...
+
+    @property
+    def t_p(self) -> NDArray:
+        """Complex amplitude transmission coefficient, p polarization."""
+        ...
+
+    @property
+    def R_s(self) -> NDArray:
+        """Reflectance, s polarization."""
+        ...
+
+    @property
+    def R_p(self) -> NDArray:
+        """Reflectance, p polarization."""
+        ...
+
+    @property
+    def T_s(self) -> NDArray:
+        """Transmittance into the substrate, s polarization."""
+        ...
+
+    @property
+    def T_p(self) -> NDArray:
+        """Transmittance into the substrate, p polarization."""
+        ...
+
+    @property
+    def A_s(self) -> NDArray:
+        """Absorptance 1 - R - T, s polarization."""
+        ...
+
+    @property
+    def A_p(self) -> NDArray:
+        """Absorptance 1 - R - T, p polarization."""
+        ...
+
+    def R(
+        self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"
+    ) -> NDArray:
+        """Reflectance of one polarization, or the average of both.
+
+        Raises:
+            ValueError: If the polarization is not supported
+        """
+        ...
+
+    def T(
+        self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"
+    ) -> NDArray:
+        """Transmittance of one polarization, or the average of both."""
+        ...
+
+    def A(
+        self, polarization: Literal["s", "p", "unpolarized"] = "unpolarized"
+    ) -> NDArray:
+        """Absorptance of one polarization, or the average of both."""
+        ...
+
+def transfer_matrix(
+    layers: Sequence[Medium],
+    thicknesses: Sequence[float] | NDArray,
+    wavelengths: WavelengthArray,
+    angles: float | Sequence[float] | NDArray = 0.0,
+    ambient: Medium = 1.0,
+    substrate: Medium = 1.0,
+) -> ThinFilmResult:
+    """
+    Reflectance, transmittance and absorptance of thin-film stacks.
+
+    Solves the transfer-matrix model for both polarizations on the whole
+    (wavelength × angle) grid at once, and for many stacks that share the
+    same layer materials but differ in thickness, as in thickness
+    optimization. Layer indices are evaluated once per wavelength. The
+    2×2 products run as batched complex array operations on cache-sized
+    blocks, with no per-point loop. Only the first column of the stack matrix
+    is needed for r and t, so it is propagated as a vector from the
+    substrate side.
+
+    Complex indices use n + ik with k ≥ 0 for absorbing media. The ambient
+    medium should be lossless.
+
+    Args:
+        layers: Films from the ambient side to the substrate side
+        thicknesses: Film thicknesses in meters, shape (len(layers),) or
+            (stacks, len(layers))
+        wavelengths: Vacuum wavelengths
+        angles: Angles of incidence in the ambient medium, in radians
+        ambient: Incidence medium
+        substrate: Exit medium
+
+    Returns:
+        ThinFilmResult with arrays of shape (stacks, wavelengths, angles)
+
+    Raises:
+        TypeError: If wavelengths is not a WavelengthArray or a layer is
+            neither a RefractiveIndex nor a number
+        ValueError: If thicknesses does not match layers or an angle is not
+            within (-π/2, π/2)
+        AttributeError: If a wavelength is outside the range of a
+            RefractiveIndex
+
+    Example:
+        >>> wl = WavelengthArray(np.linspace(400, 800, 401), "nm")
+        >>> ar = transfer_matrix([1.38], [100e-9], wl, substrate=1.52)
+        >>> ar.R().min()
+    """
+    ...
@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from photonics_helper.batch import build_dispersions
+from photonics_helper.base import WavelengthArray
+from photonics_helper.fiber import Dispersion
+from photonics_helper.sellmeier import sellmeier_table
+
+
+@pytest.fixture
+def sweeps():
+    wl = WavelengthArray(np.linspace(1.4, 1.7, 300), "um")
+    neff = sellmeier_table(
+        1, [0.6961663, 0.4079426, 0.8974794], [0.0684043, 0.1162414, 9.896161], wl
+    )[0]
+    noisy = neff + np.random.default_rng(0).normal(0, 1e-4, neff.size)
+    items = [(neff * (1 + 1e-3 * i), wl) for i in range(12)]
+    items[3] = (noisy, wl)
+    items[8] = (neff, wl.as_m)
+    return items
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_dispersions(sweeps, workers):
+    batch = build_dispersions(sweeps, 1550, workers=workers, chunksize=3)
+    assert len(batch) == len(sweeps)
+    assert batch.failed == [3, 8]
+    assert isinstance(batch.errors[3], ChildProcessError)
+    assert isinstance(batch.errors[8], TypeError)
+    assert batch[3] is None
+
+    for i in batch.succeeded:
+        neff, wl = sweeps[i]
+        expected = Dispersion.from_neff(neff, wl, 1550)
+        assert batch[i].fn_ps_nm_km(1550) == pytest.approx(
+            expected.fn_ps_nm_km(1550), rel=1e-12
+        )
+
+
+def test_build_dispersions_ignore_fit_error(sweeps):
+    with pytest.warns(UserWarning):
+        Dispersion.from_neff(*sweeps[3], 1550, ignore_fit_error=True)
+    batch = build_dispersions(sweeps, 1550, ignore_fit_error=True, workers=1)
+    assert batch.failed == [8]
+
+
+def test_build_dispersions_checks(sweeps):
+    with pytest.raises(ValueError):
+        build_dispersions(sweeps, [1550, 1560])
+    with pytest.raises(ValueError):
+        build_dispersions(sweeps, 1550, chunksize=0)
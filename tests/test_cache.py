@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from photonics_helper.base import precision
+from photonics_helper.cache import MaterialCache
+from photonics_helper.materials import RefractiveIndex
+
+SILICA_A = [0.6961663, 0.4079426, 0.8974794]
+SILICA_B = [0.0684043, 0.1162414, 9.896161]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MaterialCache(tmp_path, max_bytes=10**6)
+
+
+def test_cache_roundtrip_without_fitting(cache, monkeypatch):
+    built = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+
+    def no_fit(*args, **kwargs):
+        raise AssertionError("spline fitted on a cache hit")
+
+    monkeypatch.setattr("photonics_helper.materials.make_splrep", no_fit)
+    loaded = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+
+    assert isinstance(loaded, RefractiveIndex)
+    assert isinstance(loaded.n, np.memmap)
+    np.testing.assert_array_equal(loaded.n, built.n)
+    np.testing.assert_array_equal(loaded.wl, built.wl)
+    assert pytest.approx(loaded.n_func(1.55e-6)) == built.n_func(1.55e-6)
+    assert pytest.approx(loaded.k_func(1.0e-6)) == 0.0
+
+
+def test_cache_hit_keeps_sellmeier_derivatives(cache):
+    fresh = RefractiveIndex.from_sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), 300)
+    cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+    loaded = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+
+    assert isinstance(loaded.n, np.memmap)
+    assert loaded._sellmeier == fresh._sellmeier
+    np.testing.assert_array_equal(loaded.gvd(), fresh.gvd())
+    np.testing.assert_array_equal(loaded.group_index(), fresh.group_index())
+
+
+def test_cache_follows_precision_policy(cache):
+    with precision("single"):
+        missed = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+        hit = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+    assert missed.dtype == hit.dtype == np.float32
+    assert hit.n.dtype == hit.wl.dtype == np.float32
+    np.testing.assert_array_equal(hit.n, missed.n)
+    np.testing.assert_array_equal(hit.wl, missed.wl)
+
+    # a double entry of the same material is a separate miss, then a hit
+    double = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+    again = cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=300)
+    assert double.dtype == again.dtype == np.float64
+    assert isinstance(again.n, np.memmap)
+    assert len(list(cache.directory.glob("photonics-*.npy"))) == 2
+
+
+def test_cache_key_depends_on_inputs():
+    key = MaterialCache.key("standard", 1, SILICA_A, SILICA_B, (0.5, 2.0), 200)
+    assert key == MaterialCache.key("standard", 1, SILICA_A, SILICA_B, (0.5, 2.0), 200)
+    assert key != MaterialCache.key("alt", 1, SILICA_A, SILICA_B, (0.5, 2.0), 200)
+    assert key != MaterialCache.key("standard", 1, SILICA_A, SILICA_B, (0.5, 2.0), 201)
+    assert key != MaterialCache.key(
+        "standard", 1, SILICA_A, SILICA_B, (0.5, 2.0), 200, "single"
+    )
+
+
+def test_cache_eviction(tmp_path):
+    # files that are not cache entries are never touched
+    other = tmp_path / "results.npy"
+    np.save(other, np.zeros(10_000))
+
+    cache = MaterialCache(tmp_path, max_bytes=30_000)
+    for n_points in (400, 401, 402):
+        cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=n_points)
+    assert cache.size() <= 30_000
+    assert len(list(tmp_path.glob("photonics-*.npy"))) == 1
+
+    cache.clear()
+    assert cache.size() == 0
+    assert other.exists()
+
+
+def test_cache_keeps_entry_just_written(tmp_path):
+    # an entry larger than max_bytes still survives its own put
+    cache = MaterialCache(tmp_path, max_bytes=1000)
+    cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=400)
+    key = MaterialCache.key("standard", 1, SILICA_A, SILICA_B, (0.5, 2.0), 400)
+    assert cache.get(key) is not None
+
+    cache.sellmeier(1, SILICA_A, SILICA_B, (0.5, 2.0), n_points=401)
+    assert cache.get(key) is None
@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+from photonics_helper.base import (
+    Wavelength,
+    Frequency,
+    AngularFrequency,
+    Wavenumber,
+    WavelengthArray,
+    FrequencyArray,
+    AngularFrequencyArray,
+    WavenumberArray,
+    C_MS,
+    PI,
+)
+from photonics_helper.convert import convert, plan_conversion
+
+
+def test_plan_wavelength_to_thz():
+    plan = plan_conversion(Wavelength, "nm", Frequency, "THz")
+    assert plan.kind == "reciprocal"
+    assert pytest.approx(plan(1550.0)) == C_MS / 1550e-9 * 1e-12
+    assert plan is plan_conversion(Wavelength, "nm", Frequency, "THz")
+
+
+def test_plan_matches_chained_conversion():
+    wl = np.linspace(1200, 1700, 11)
+    plan = plan_conversion(WavelengthArray, "nm", AngularFrequencyArray, "rad/ps")
+    chained = WavelengthArray(wl, "nm").to_freq().to_omega().as_rad_ps
+    np.testing.assert_allclose(plan(wl), chained, rtol=1e-14)
+
+    plan = plan_conversion(FrequencyArray, "GHz", WavenumberArray, "1/cm")
+    assert plan.kind == "scale"
+    chained = FrequencyArray(wl, "GHz").to_wn().as_1_cm
+    np.testing.assert_allclose(plan(wl), chained, rtol=1e-14)
+
+
+def test_plan_out_buffer():
+    wl = np.linspace(1200, 1700, 11)
+    out = np.empty_like(wl)
+    plan = plan_conversion(WavelengthArray, "nm", FrequencyArray, "Hz")
+    assert plan(wl, out=out) is out
+    np.testing.assert_allclose(out, C_MS / (wl * 1e-9))
+
+
+def test_plan_invalid():
+    with pytest.raises(ValueError):
+        plan_conversion(Wavelength, "cm", Frequency, "Hz")
+    with pytest.raises(TypeError):
+        plan_conversion(float, "m", Frequency, "Hz")
+
+
+def test_convert_objects():
+    omega = convert(Wavelength(1550, "nm"), AngularFrequency)
+    assert isinstance(omega, AngularFrequency)
+    assert pytest.approx(omega.as_rad_s) == 2 * PI * C_MS / 1.55e-6
+
+    wn = convert(WavelengthArray(np.array([1, 2]), "um"), Wavenumber)
+    assert isinstance(wn, WavenumberArray)
+    np.testing.assert_allclose(wn.as_1_m, [1e6, 5e5])
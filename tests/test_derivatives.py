@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from photonics_helper.base import WavelengthArray
+from photonics_helper.derivatives import (
+    dispersion_from_neff,
+    is_uniform,
+    stencil_weights,
+    uniform_derivative,
+)
+from photonics_helper.fiber import Dispersion
+from photonics_helper.sellmeier import sellmeier_derivatives, sellmeier_table
+
+SILICA_A = [0.6961663, 0.4079426, 0.8974794]
+SILICA_B = [0.0684043, 0.1162414, 9.896161]
+
+
+def test_stencil_weights():
+    np.testing.assert_allclose(stencil_weights([-1, 0, 1], 2), [1, -2, 1])
+    np.testing.assert_allclose(
+        stencil_weights([-2, -1, 0, 1, 2], 2), np.array([-1, 16, -30, 16, -1]) / 12
+    )
+
+
+def test_uniform_derivative_polynomial_exact():
+    x = np.linspace(-1, 2, 40)
+    y = np.stack([x**4, 3 * x**3 - x])
+    d2 = uniform_derivative(y, x[1] - x[0], deriv=2, accuracy=4, axis=1)
+    np.testing.assert_allclose(d2[0], 12 * x**2, atol=1e-8)
+    np.testing.assert_allclose(d2[1], 18 * x, atol=1e-8)
+
+
+def test_sellmeier_derivatives_match_finite_differences():
+    wl = WavelengthArray(np.linspace(1.2, 1.8, 601), "um")
+    n, dn, d2n = sellmeier_derivatives(1, SILICA_A, SILICA_B, wl)
+    np.testing.assert_allclose(n, sellmeier_table(1, SILICA_A, SILICA_B, wl))
+    dx = wl.as_m[1] - wl.as_m[0]
+    np.testing.assert_allclose(uniform_derivative(n, dx, 1), dn, rtol=1e-8)
+    np.testing.assert_allclose(
+        uniform_derivative(n, dx, 2), d2n, atol=1e-6 * abs(d2n).max()
+    )
+
+
+def test_dispersion_from_neff_methods():
+    wl = WavelengthArray(np.linspace(1.2, 1.8, 601), "um")
+    n = sellmeier_table(1, SILICA_A, SILICA_B, wl)[0]
+    i = np.argmin(abs(wl.as_nm - 1550))
+    for method in ("finite_difference", "savgol", "spline"):
+        D, beta2 = dispersion_from_neff(n, wl, method=method)
+        # fused silica: D ~ 21.9 ps/nm.km, beta2 ~ -27.9 ps^2/km
+        assert pytest.approx(D[i] * 1e6, rel=1e-3) == 21.91
+        assert pytest.approx(beta2[i] * 1e27, rel=1e-3) == -27.95
+
+    uneven = WavelengthArray(np.geomspace(1.2, 1.8, 50), "um")
+    assert not is_uniform(uneven.as_m)
+    with pytest.raises(ValueError):
+        dispersion_from_neff(np.ones(50), uneven, method="finite_difference")
+
+
+def test_dispersion_from_sellmeier_and_beta():
+    wl = WavelengthArray(np.linspace(1.2, 1.8, 301), "um")
+    analytic = Dispersion.from_sellmeier(1, SILICA_A, SILICA_B, wl, 1550)
+    n = sellmeier_table(1, SILICA_A, SILICA_B, wl)[0]
+    from_neff = Dispersion.from_neff(n, wl, 1550)
+    beta = 2 * np.pi * n / wl.as_m
+    from_beta = Dispersion.from_propagation_constanant(beta, wl, 1550)
+
+    np.testing.assert_allclose(from_neff.as_ps_nm_km, analytic.as_ps_nm_km, atol=1e-3)
+    np.testing.assert_allclose(from_beta.as_ps_nm_km, analytic.as_ps_nm_km, atol=1e-3)
@@ -0,0 +1,183 @@
+import pytest
+import numpy as np
+from photonics_helper import fiber
+from photonics_helper.fiber import Dispersion, PropagationConstant
+from photonics_helper.sellmeier import sellmeier_table
+from photonics_helper.base import (
+    Wavelength,
+    WavelengthArray,
+    AngularFrequencyArray,
+    C_MS,
+    PI,
+)
+
+
+@pytest.fixture
+def sample_dispersion():
+    wl = WavelengthArray(np.linspace(1500, 1600, 51), "nm")
+    values = np.linspace(15, 20, 51)  # ps/nm.km
+    return Dispersion(
+        wavelengths=wl,
+        values=values,
+        unit="ps/nm.km",
+        central_wavelength=Wavelength(1550, "nm"),
+    )
+
+
+def test_dispersion_fn_values(sample_dispersion):
+    assert pytest.approx(sample_dispersion.fn_ps_nm_km(1550)) == 17.5
+    assert pytest.approx(sample_dispersion.fn_s_m_m(1550)) == 17.5e-6
+    assert pytest.approx(sample_dispersion.fn(1.55e-6)) == 17.5e-6
+
+    beta2 = -((1.55e-6) ** 2) / (2 * PI * C_MS) * 17.5e-6
+    assert pytest.approx(sample_dispersion.get_beta2(1550)) == beta2
+
+
+def test_dispersion_spline_fitted_once(sample_dispersion, monkeypatch):
+    calls = []
+    make_splrep = fiber.make_splrep
+
+    def counting_splrep(*args, **kwargs):
+        calls.append(1)
+        return make_splrep(*args, **kwargs)
+
+    monkeypatch.setattr(fiber, "make_splrep", counting_splrep)
+    for _ in range(5):
+        sample_dispersion.fn_ps_nm_km(1550)
+        sample_dispersion.get_beta2(1550)
+    assert len(calls) == 2
+
+    sample_dispersion.clear_cache()
+    sample_dispersion.fn_ps_nm_km(1550)
+    assert len(calls) == 3
+
+
+def test_dispersion_out_of_range(sample_dispersion):
+    with pytest.raises(ValueError):
+        sample_dispersion.fn_ps_nm_km(1400)
+    with pytest.raises(ValueError):
+        sample_dispersion.fn(1.7e-6)
+    with pytest.raises(ValueError):
+        sample_dispersion.get_beta2(1650)
+
+
+def test_dispersion_fn_array(sample_dispersion):
+    wl = WavelengthArray(np.array([1510.0, 1550.0, 1590.0]), "nm")
+    scalar = [sample_dispersion.fn_ps_nm_km(x) for x in wl.as_nm]
+
+    values = sample_dispersion.fn_array(wl, "ps/nm.km")
+    assert isinstance(values, np.ndarray)
+    np.testing.assert_allclose(values, scalar)
+    np.testing.assert_allclose(sample_dispersion.fn_array(wl), np.array(scalar) * 1e-6)
+
+    beta2 = sample_dispersion.get_beta2_array(wl)
+    np.testing.assert_allclose(
+        beta2, [sample_dispersion.get_beta2(x) for x in wl.as_nm], rtol=1e-9
+    )
+
+
+def test_dispersion_fn_array_checks(sample_dispersion):
+    with pytest.raises(ValueError):
+        sample_dispersion.fn_array(WavelengthArray(np.array([1550, 1700]), "nm"))
+    with pytest.raises(TypeError):
+        sample_dispersion.get_beta2_array(np.array([1.55e-6]))
+
+
+def test_dispersion_does_not_print_by_default(sample_dispersion, capsys):
+    sample_dispersion.fn_ps_nm_km(1550)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.fixture
+def polynomial_beta():
+    omega = AngularFrequencyArray(np.linspace(1.1e15, 1.3e15, 200), "rad/s")
+    x = omega.as_rad_s - 1.2e15
+    beta = 5e6 + 4.8e-9 * x + 2e-26 * x**2 / 2 + 1e-40 * x**3 / 6
+    return PropagationConstant(beta, omega)
+
+
+def test_taylor_coefficients_polynomial(polynomial_beta):
+    coefficients = polynomial_beta.taylor_coefficients(1.2e15, order=3)
+    assert coefficients.shape == (4,)
+    np.testing.assert_allclose(coefficients, [5e6, 4.8e-9, 2e-26, 1e-40], rtol=1e-3)
+
+    centers = np.array([1.15e15, 1.2e15, 1.25e15])
+    table = polynomial_beta.taylor_coefficients(centers, order=3)
+    assert table.shape == (3, 4)
+    np.testing.assert_allclose(table[:, 2], 2e-26 + 1e-40 * (centers - 1.2e15))
+
+    with pytest.raises(ValueError):
+        polynomial_beta.taylor_coefficients(1.4e15)
+
+
+def test_taylor_coefficients_from_wavelengths():
+    wl = WavelengthArray(np.linspace(1.2, 1.9, 400), "um")
+    n = sellmeier_table(
+        1, [0.6961663, 0.4079426, 0.8974794], [0.0684043, 0.1162414, 9.896161], wl
+    )[0]
+    omega = wl.to_omega().as_rad_s
+    beta = PropagationConstant(n * omega / C_MS, wl)
+    center = Wavelength(1550, "nm").to_omega()
+    beta2 = beta.taylor_coefficients(center, order=2)[2]
+    # fused silica around 1550 nm
+    assert beta2 * 1e27 == pytest.approx(-27.95, abs=0.05)
+
+
+def test_beta2_from_neff(polynomial_beta):
+    omega = polynomial_beta.omegas
+    neff = polynomial_beta.values * C_MS / omega.as_rad_s
+    x = omega.as_rad_s - 1.2e15
+    for x_values in (omega, omega.to_wl()):
+        beta2 = PropagationConstant.beta2_from_neff(neff, x_values)
+        assert beta2.shape == (200,)
+        np.testing.assert_allclose(beta2[5:-5], (2e-26 + 1e-40 * x)[5:-5], rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        PropagationConstant.beta2_from_neff(neff[1:], omega)
+    with pytest.raises(TypeError):
+        PropagationConstant.beta2_from_neff(neff, omega.as_rad_s)
+
+
+def test_dispersion_operator(polynomial_beta):
+    delta = np.linspace(-2e13, 2e13, 9)
+    operator = polynomial_beta.dispersion_operator(delta, 1.2e15, order=3)
+    expected = 2e-26 * delta**2 / 2 + 1e-40 * delta**3 / 6
+    np.testing.assert_allclose(operator, expected, rtol=1e-3, atol=1e-12)
+
+    with_beta1 = polynomial_beta.dispersion_operator(
+        delta, np.array([1.2e15, 1.2e15]), order=3, include_beta1=True
+    )
+    assert with_beta1.shape == (2, 9)
+    np.testing.assert_allclose(with_beta1[1], expected + 4.8e-9 * delta, rtol=1e-3)
+
+
+def test_dispersion_single_precision():
+    wl = WavelengthArray(np.linspace(1.4, 1.7, 301), "um")
+    A = [0.6961663, 0.4079426, 0.8974794]
+    B = [0.0684043, 0.1162414, 9.896161]
+    neff = sellmeier_table(1, A, B, wl)[0]
+    double = Dispersion.from_neff(neff, wl, 1550)
+    single = Dispersion.from_neff(neff, wl, 1550, dtype="single")
+    assert single.dtype == np.float32 and single.as_s_m_m.dtype == np.float32
+
+    query = WavelengthArray(np.array([1500.0, 1550.0]), "nm", dtype="single")
+    assert single.fn_array(query).dtype == np.float32
+    assert single.get_beta2_array(query).dtype == np.float32
+    assert single.fn_ps_nm_km(1550) == pytest.approx(double.fn_ps_nm_km(1550), rel=1e-5)
+
+
+def test_single_precision_grid_endpoints():
+    wl = WavelengthArray(np.linspace(1500, 1600, 101), "nm", dtype="single")
+    dispersion = Dispersion(
+        wavelengths=wl,
+        values=np.linspace(15, 20, 101),
+        unit="ps/nm.km",
+        central_wavelength=Wavelength(1550, "nm"),
+    )
+    # float32(1600 nm) is below 1600 nm; the endpoints are still in range
+    assert dispersion.fn_ps_nm_km(1600) == pytest.approx(20, rel=1e-5)
+    assert dispersion.fn_ps_nm_km(1500) == pytest.approx(15, rel=1e-5)
+    values = dispersion.fn_array(WavelengthArray(np.linspace(1500, 1600, 11), "nm"))
+    np.testing.assert_allclose(values, np.linspace(15e-6, 20e-6, 11), rtol=1e-5)
+    with pytest.raises(ValueError):
+        dispersion.fn_ps_nm_km(1600.001)
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from photonics_helper.base import AngularFrequencyArray, C_MS, PI, Wavelength
+from photonics_helper.fiber import Dispersion, PropagationConstant
+from photonics_helper.fwm import PhaseMatching
+
+OMEGA0 = 2 * PI * C_MS / 1.55e-6
+BETAS = [5.9e6, 4.9e-9, -2e-27, 1e-40, 2e-55]
+
+
+def _beta(omega):
+    delta = omega - OMEGA0
+    return sum(b * delta**k / np.prod(range(1, k + 1)) for k, b in enumerate(BETAS))
+
+
+def _exact(pump, signal):
+    return _beta(signal) + _beta(2 * pump - signal) - 2 * _beta(pump)
+
+
+def _dispersion(omegas):
+    # beta2(omega) of the polynomial, as dispersion D on the wavelength grid
+    delta = omegas.as_rad_s - OMEGA0
+    beta2 = BETAS[2] + BETAS[3] * delta + BETAS[4] * delta**2 / 2
+    wl = omegas.to_wl()
+    return Dispersion(
+        wavelengths=wl,
+        values=-2 * PI * C_MS / wl.as_m**2 * beta2,
+        unit="s/m^2",
+        central_wavelength=Wavelength(1550, "nm"),
+    )
+
+
+@pytest.fixture
+def omegas():
+    return AngularFrequencyArray(np.linspace(0.85, 1.15, 3001) * OMEGA0, "rad/s")
+
+
+@pytest.fixture
+def pumps():
+    return AngularFrequencyArray(np.linspace(0.98, 1.02, 21) * OMEGA0, "rad/s")
+
+
+@pytest.fixture
+def signals():
+    return AngularFrequencyArray(np.linspace(0.9, 1.1, 301) * OMEGA0, "rad/s")
+
+
+def test_delta_beta_map(omegas, pumps, signals):
+    beta = PropagationConstant(_beta(omegas.as_rad_s), omegas)
+    matching = PhaseMatching(beta)
+    grid = matching.delta_beta(pumps[:, None], signals[None, :], chunk_size=1000)
+    expected = _exact(pumps.as_rad_s[:, None], signals.as_rad_s[None, :])
+    assert grid.shape == (21, 301)
+    np.testing.assert_allclose(grid, expected, rtol=1e-5, atol=1e-6)
+
+    # chunking and out= do not change the result
+    out = np.empty((21, 301))
+    result = matching.delta_beta(pumps[:, None], signals[None, :], None, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, grid)
+
+
+def test_delta_beta_taylor(pumps, signals):
+    # beta2 of tabulated beta is noise-limited on fine grids
+    omegas = AngularFrequencyArray(np.linspace(0.85, 1.15, 301) * OMEGA0, "rad/s")
+    beta = PropagationConstant(_beta(omegas.as_rad_s), omegas)
+    grid = PhaseMatching(beta, "taylor", order=2).delta_beta(
+        pumps[:, None], signals[None, :]
+    )
+    # beta2(omega_p) * (omega_s - omega_p)^2
+    delta = pumps.as_rad_s[:, None] - OMEGA0
+    beta2 = BETAS[2] + BETAS[3] * delta + BETAS[4] * delta**2 / 2
+    detuning = signals.as_rad_s[None, :] - pumps.as_rad_s[:, None]
+    np.testing.assert_allclose(grid, beta2 * detuning**2, rtol=1e-3)
+
+
+@pytest.mark.parametrize("method", ["spline", "taylor"])
+def test_delta_beta_from_dispersion(omegas, pumps, signals, method):
+    matching = PhaseMatching(_dispersion(omegas), method=method)
+    grid = matching.delta_beta(pumps[:, None], signals[None, :])
+    expected = _exact(pumps.as_rad_s[:, None], signals.as_rad_s[None, :])
+    # taylor takes beta4 from the slope of the cubic beta2 fit
+    atol = 1e-6 if method == "spline" else 1e-3 * np.abs(expected).max()
+    np.testing.assert_allclose(grid, expected, rtol=1e-5, atol=atol)
+
+
+def test_parametric_gain(omegas, pumps, signals):
+    matching = PhaseMatching(PropagationConstant(_beta(omegas.as_rad_s), omegas))
+    gamma, power, length = 0.01, 2.0, 300.0
+    gain = matching.gain(pumps[:, None], signals[None, :], gamma, power, length)
+    delta_beta = matching.delta_beta(pumps[:, None], signals[None, :])
+
+    g2 = (gamma * power) ** 2 - ((delta_beta + 2 * gamma * power) / 2) ** 2
+    g = np.sqrt(g2.astype(complex))
+    with np.errstate(invalid="ignore"):
+        growth = np.where(g == 0, length, np.sinh(g * length) / g)
+    expected = 1 + np.abs(gamma * power * growth) ** 2
+    np.testing.assert_allclose(gain, expected, rtol=1e-9)
+    # perfect phase matching peaks at cosh^2(gamma P L)
+    assert gain.max() <= np.cosh(gamma * power * length) ** 2 * (1 + 1e-12)
+    assert np.all(gain >= 1)
+
+
+@pytest.mark.parametrize("method", ["spline", "taylor"])
+def test_scalar_grid(method):
+    # a coarse grid keeps the taylor derivatives clear of noise
+    omegas = AngularFrequencyArray(np.linspace(0.85, 1.15, 301) * OMEGA0, "rad/s")
+    matching = PhaseMatching(
+        PropagationConstant(_beta(omegas.as_rad_s), omegas), method, order=4
+    )
+    pump = AngularFrequencyArray(np.array(OMEGA0), "rad/s")
+    signal = AngularFrequencyArray(np.array(1.01 * OMEGA0), "rad/s")
+    delta_beta = matching.delta_beta(pump, signal)
+    assert delta_beta.shape == ()
+    assert delta_beta == pytest.approx(_exact(OMEGA0, 1.01 * OMEGA0), rel=1e-3)
+    gain = matching.gain(pump, signal, 0.01, 2.0, 300.0)
+    assert gain.shape == () and gain >= 1
+
+
+def test_phase_matching_errors(omegas, pumps):
+    beta = PropagationConstant(_beta(omegas.as_rad_s), omegas)
+    with pytest.raises(ValueError):
+        PhaseMatching(beta, method="exact")
+    with pytest.raises(TypeError):
+        PhaseMatching(np.ones(3))
+    # beta of a Dispersion is a quintic spline: no beta6 to expand with
+    with pytest.raises(ValueError):
+        PhaseMatching(_dispersion(omegas), "taylor", order=6)
+    matching = PhaseMatching(beta)
+    far = AngularFrequencyArray(np.array([0.5 * OMEGA0]), "rad/s")
+    with pytest.raises(ValueError):
+        matching.delta_beta(pumps, far)
+    with pytest.raises(TypeError):
+        matching.delta_beta(pumps.as_rad_s, pumps)
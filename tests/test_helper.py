@@ -9,6 +9,10 @@ from photonics_helper import (
     AngularFrequencyArray,
     C_MS,
     PI,
+    parse_array,
+    get_precision,
+    precision,
+    set_precision,
 )
 
 
@@ -59,7 +63,8 @@ def test_frequency_to_wl():
 
 def test_omega_scalar():
     omega = AngularFrequency(628, "rad/ps")
-    assert pytest.approx(omega.as_rad_s) == 628e-12
+    assert pytest.approx(omega.as_rad_s) == 628e12
+    assert pytest.approx(omega.as_rad_ps) == 628
 
 
 def test_omega_invalid_unit():
@@ -102,6 +107,159 @@ def test_array_omega():
     assert isinstance(omega_arr.to_wl(), WavelengthArray)
 
 
+def test_array_units_round_trip():
+    # every unit a constructor accepts reads back unchanged through as_unit
+    for array in (WavelengthArray, FrequencyArray, AngularFrequencyArray):
+        for unit in array._UNITS:
+            values = array(np.array([1.0, 1550.0]), unit)
+            np.testing.assert_allclose(values.as_unit(unit), [1.0, 1550.0], rtol=1e-15)
+    omega = AngularFrequencyArray(np.array([628.0]), "rad/ps")
+    np.testing.assert_allclose(omega.as_rad_s, [628e12])
+
+
+def test_scalar_accessors_match_arrays():
+    # scalar and array accessors read the same factors from UNIT_FACTORS
+    cases = [
+        (Wavelength(1550, "nm"), WavelengthArray, {"um": "as_um", "nm": "as_nm"}),
+        (
+            Frequency(193.4, "THz"),
+            FrequencyArray,
+            {"THz": "as_THz", "GHz": "as_GHz", "MHz": "as_MHz"},
+        ),
+        (
+            AngularFrequency(1.2, "rad/ps"),
+            AngularFrequencyArray,
+            {"rad/ps": "as_rad_ps"},
+        ),
+    ]
+    for value, array_type, accessors in cases:
+        array = array_type.from_base(np.array([float(value)]))
+        for unit, name in accessors.items():
+            assert getattr(value, name) == array.as_unit(unit)[0]
+    assert AngularFrequency(1.2, "rad/ps").as_rad_ps == pytest.approx(1.2)
+    wn = Wavelength(1550, "nm").to_wn()
+    assert wn.as_1_cm == pytest.approx(1 / 1550e-7)
+    assert wn.as_angular == pytest.approx(2 * PI / 1550e-9)
+
+
 def test_array_invalid_unit():
     with pytest.raises(ValueError):
         WavelengthArray(np.array([500]), "cm")
+
+
+def test_array_base_accessor_is_view():
+    wl_arr = WavelengthArray(np.array([1550, 1310]), "nm")
+    assert np.shares_memory(wl_arr.as_m, wl_arr)
+    assert not isinstance(wl_arr.as_m, WavelengthArray)
+    assert not np.shares_memory(wl_arr.as_nm, wl_arr)
+
+
+def test_array_as_unit_out():
+    f_arr = FrequencyArray(np.array([100, 200]), "THz")
+    buf = np.empty(2)
+    result = f_arr.as_unit("GHz", out=buf)
+    assert result is buf
+    np.testing.assert_allclose(buf, [1e5, 2e5])
+    np.testing.assert_allclose(f_arr.as_THz, [100, 200])
+
+
+def test_array_conversion_out():
+    wl_arr = WavelengthArray(np.array([1550, 1310]), "nm")
+    buf = np.empty(2)
+    omega = wl_arr.to_omega(out=buf)
+    assert isinstance(omega, AngularFrequencyArray)
+    assert np.shares_memory(omega, buf)
+    np.testing.assert_allclose(omega, 2 * PI * C_MS / wl_arr.as_m)
+
+    # converting in place reuses the source buffer
+    freq = omega.to_freq(out=omega)
+    assert np.shares_memory(freq, buf)
+    np.testing.assert_allclose(freq.to_wl(), [1550e-9, 1310e-9])
+
+
+def test_from_base_skips_unit():
+    wl = Wavelength.from_base(1.55e-6)
+    assert isinstance(wl, Wavelength)
+    assert pytest.approx(wl.as_nm) == 1550
+
+    data = np.array([1e12, 2e12])
+    f_arr = FrequencyArray.from_base(data)
+    assert isinstance(f_arr, FrequencyArray)
+    assert np.shares_memory(f_arr, data)
+
+
+def test_parse_array():
+    wl_arr = parse_array(["1550 nm", "1.31 um", "2e-6 m"])
+    assert isinstance(wl_arr, WavelengthArray)
+    np.testing.assert_allclose(wl_arr.as_m, [1.55e-6, 1.31e-6, 2e-6])
+
+    f_arr = parse_array(np.array(["193.4 THz", "100  GHz"]))
+    assert isinstance(f_arr, FrequencyArray)
+    np.testing.assert_allclose(f_arr.as_Hz, [193.4e12, 100e9])
+
+
+def test_parse_array_invalid():
+    with pytest.raises(ValueError):
+        parse_array(["1550 nm", "193.4 THz"])
+    with pytest.raises(ValueError):
+        parse_array(["1550 cm"])
+    with pytest.raises(ValueError):
+        parse_array(["abc nm"])
+
+
+def test_single_precision_arrays():
+    wl = WavelengthArray(np.linspace(1500, 1600, 11), "nm", dtype="single")
+    assert wl.dtype == np.float32
+    assert wl.to_freq().dtype == np.float32
+    assert wl.to_omega().to_wl().dtype == np.float32
+    assert wl.to_freq().as_THz.dtype == np.float32
+    np.testing.assert_allclose(wl.to_freq().as_Hz, C_MS / wl.as_m, rtol=1e-6)
+
+
+def test_precision_policy():
+    assert get_precision() == "double"
+    with precision("single"):
+        assert FrequencyArray([190, 200], "THz").dtype == np.float32
+        assert parse_array(["1 nm", "2 nm"]).dtype == np.float32
+        # An explicit dtype wins over the policy
+        assert FrequencyArray([190], "THz", dtype=np.float64).dtype == np.float64
+    assert FrequencyArray([190], "THz").dtype == np.float64
+
+    with pytest.raises(ValueError):
+        set_precision("half")
+    with pytest.raises(ValueError):
+        WavelengthArray([1.0], "m", dtype=np.int32)
+
+
+def test_from_memmap_wraps_without_copy(tmp_path):
+    data = np.lib.format.open_memmap(
+        tmp_path / "wl.npy", mode="w+", dtype=np.float64, shape=(100,)
+    )
+    data[:] = np.linspace(1.5e-6, 1.6e-6, 100)
+    wl = WavelengthArray.from_memmap(data)
+    assert isinstance(wl, WavelengthArray)
+    assert np.shares_memory(wl, data)
+
+    wl = WavelengthArray.from_memmap(tmp_path / "wl.npy")
+    np.testing.assert_allclose(wl.as_m, data)
+
+
+def test_from_memmap_scales_raw_file(tmp_path):
+    np.linspace(180, 200, 10).tofile(tmp_path / "freq.bin")
+    with pytest.raises(ValueError):
+        FrequencyArray.from_memmap(tmp_path / "freq.bin", "THz")
+    f_arr = FrequencyArray.from_memmap(
+        tmp_path / "freq.bin", "THz", out=tmp_path / "freq.npy", chunk_size=3
+    )
+    assert isinstance(f_arr, FrequencyArray)
+    np.testing.assert_allclose(f_arr.as_THz, np.linspace(180, 200, 10))
+    np.testing.assert_allclose(np.load(tmp_path / "freq.npy"), f_arr)
+
+
+def test_chunked_conversion_to_file(tmp_path):
+    wl = WavelengthArray(np.linspace(1500, 1600, 1001), "nm")
+    freq = wl.to_freq(out=tmp_path / "freq.npy", chunk_size=64)
+    assert isinstance(freq, FrequencyArray)
+    np.testing.assert_allclose(freq, wl.to_freq())
+    np.testing.assert_allclose(np.load(tmp_path / "freq.npy"), wl.to_freq())
+    np.testing.assert_allclose(wl.as_unit("nm", chunk_size=100), wl.as_nm)
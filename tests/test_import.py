@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+HEAVY = ("scipy", "matplotlib", "rich", "concurrent.futures", "multiprocessing")
+
+
+def _loaded_after_import(statement: str) -> list[str]:
+    code = (
+        f"import sys; {statement}; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def test_import_does_not_load_heavy_modules():
+    assert _loaded_after_import("import photonics_helper") == []
+
+
+def test_import_does_not_install_traceback_hook():
+    code = (
+        "import sys; hook = sys.excepthook; import photonics_helper; "
+        "print(sys.excepthook is hook)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    assert out == "True"
+
+
+def test_scipy_loaded_on_first_spline():
+    statement = (
+        "import numpy as np; from photonics_helper import RefractiveIndex, WavelengthArray; "
+        "wl = WavelengthArray(np.linspace(1, 2, 20), 'um'); "
+        "RefractiveIndex(np.ones(20), np.zeros(20), wl).n_func(1.5e-6)"
+    )
+    assert "scipy" in _loaded_after_import(statement)
+
+
+def test_pools_loaded_on_first_parallel_call():
+    statement = (
+        "from photonics_helper import LazyArray; "
+        "LazyArray.linspace(1, 2, 100, 'um', chunk_size=10).compute(workers=2)"
+    )
+    assert _loaded_after_import(statement) == ["concurrent.futures"]
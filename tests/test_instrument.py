@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from photonics_helper import instrument
+from photonics_helper.base import Wavelength, WavelengthArray
+from photonics_helper.fiber import Dispersion
+from photonics_helper.materials import RefractiveIndex
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    previous = instrument.is_enabled()
+    instrument.reset()
+    yield
+    instrument.enable(previous)
+    instrument.reset()
+
+
+def test_disabled_records_nothing():
+    instrument.disable()
+    wl = WavelengthArray(np.linspace(1.3, 1.8, 100), "um")
+    wl.to_freq()
+    Wavelength(1550, "nm").to_freq()
+    assert instrument.snapshot() == {"counters": {}, "timers": {}}
+
+
+def test_conversion_counters():
+    wl = WavelengthArray(np.linspace(1.3, 1.8, 100), "um")
+    out = np.empty(100)
+    with instrument.instrumented():
+        wl.to_freq()
+        wl.to_omega(out=out)
+        Wavelength(1550, "nm").to_freq()
+    counters = instrument.snapshot()["counters"]
+    assert counters["base.array_conversions"] == 2
+    assert counters["base.array_elements"] == 200
+    assert counters["base.array_allocations"] == 1
+    assert counters["base.scalar_conversions"] == 2
+
+
+def test_spline_fits_evaluations_and_cache():
+    index = RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), 200)
+    dispersion = Dispersion.from_neff(
+        index.n, WavelengthArray(np.linspace(1.3, 1.8, 200), "um"), 1550
+    )
+    with instrument.instrumented():
+        dispersion.fn_ps_nm_km(1550)
+        dispersion.fn_ps_nm_km(1560)
+        index.n_array(WavelengthArray(np.array([1.4, 1.5, 1.6]), "um"))
+    data = instrument.snapshot()
+    assert data["timers"]["spline.fit"]["calls"] == 2
+    assert data["timers"]["fiber.spline_eval"]["calls"] == 2
+    assert data["timers"]["materials.spline_eval"]["items"] == 3
+    assert data["counters"]["fiber.spline_cache.misses"] == 1
+    assert data["counters"]["fiber.spline_cache.hits"] == 1
+
+    flat = instrument.flat_snapshot()
+    assert flat["spline.fit.calls"] == 2
+    assert flat["fiber.spline_cache.hits"] == 1
+
+    instrument.reset()
+    assert instrument.snapshot() == {"counters": {}, "timers": {}}
@@ -0,0 +1,105 @@
+import pytest
+import numpy as np
+from photonics_helper.base import (
+    FrequencyArray,
+    Wavelength,
+    WavelengthArray,
+    AngularFrequencyArray,
+)
+from photonics_helper.fiber import Dispersion
+from photonics_helper.lazy import LazyArray
+from photonics_helper.materials import RefractiveIndex
+
+
+@pytest.fixture
+def sample_dispersion():
+    wl = WavelengthArray(np.linspace(1500, 1600, 51), "nm")
+    return Dispersion(
+        wavelengths=wl,
+        values=np.linspace(15, 20, 51),
+        unit="ps/nm.km",
+        central_wavelength=Wavelength(1550, "nm"),
+    )
+
+
+def test_linspace_matches_numpy():
+    lazy = LazyArray.linspace(1500, 1600, 1001, "nm", chunk_size=64)
+    values = lazy.compute(workers=3)
+    assert isinstance(values, WavelengthArray)
+    np.testing.assert_array_equal(values, np.linspace(1500, 1600, 1001) * 1e-9)
+    assert len(lazy) == 1001
+    assert sum(part.size for _, part in lazy.chunks()) == 1001
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_conversions_are_fused(workers):
+    eager = WavelengthArray(np.linspace(1500, 1600, 1000), "nm")
+    lazy = LazyArray(np.linspace(1500, 1600, 1000), "nm", chunk_size=100)
+
+    freq = lazy.to_freq()
+    omega = freq.to_omega()
+    assert "1 pending operations" in repr(omega)
+    result = omega.compute(workers=workers)
+    assert isinstance(result, AngularFrequencyArray)
+    np.testing.assert_allclose(result, eager.to_omega(), rtol=1e-15)
+    np.testing.assert_allclose(
+        freq.as_unit("THz").compute(workers=workers), eager.to_freq().as_THz
+    )
+    np.testing.assert_allclose(lazy.to_wn().compute(), eager.to_wn())
+    np.testing.assert_allclose(freq.to_wl().compute(), eager, rtol=1e-15)
+
+
+def test_eager_source_and_npy_out(tmp_path):
+    freq = FrequencyArray(np.linspace(190, 200, 500), "THz")
+    lazy = LazyArray(freq, chunk_size=64)
+    assert lazy.array_type is FrequencyArray
+
+    path = tmp_path / "wl.npy"
+    lazy.to_wl().compute(out=path)
+    np.testing.assert_allclose(np.load(path), freq.to_wl())
+
+    # a .npy path as source is memory-mapped, not read
+    again = LazyArray(path, chunk_size=64).to_freq().compute()
+    np.testing.assert_allclose(again, freq)
+
+
+def test_lazy_dispersion_and_index(sample_dispersion):
+    wl = LazyArray.linspace(1510, 1590, 2001, "nm", chunk_size=256)
+    eager = WavelengthArray(np.linspace(1510, 1590, 2001), "nm")
+
+    dispersion = sample_dispersion.fn_array(wl, "ps/nm.km")
+    beta2 = sample_dispersion.get_beta2_array(wl)
+    assert isinstance(dispersion, LazyArray)
+    assert dispersion.array_type is None
+    np.testing.assert_allclose(
+        dispersion.compute(), sample_dispersion.fn_array(eager, "ps/nm.km")
+    )
+    np.testing.assert_allclose(
+        beta2.compute(workers=2), sample_dispersion.get_beta2_array(eager)
+    )
+    with pytest.raises(TypeError):
+        dispersion.to_freq()
+    with pytest.raises(TypeError):
+        wl.map(np.sqrt).as_unit("nm")
+
+    # frequencies are converted to wavelengths inside the graph
+    index = RefractiveIndex(np.linspace(1.45, 1.44, 51), np.zeros(51), eager[::40])
+    n = index.n_array(LazyArray(eager.to_freq()))
+    np.testing.assert_allclose(n.compute(), index.n_array(eager), rtol=1e-12)
+
+
+def test_errors_surface_on_compute(sample_dispersion):
+    wl = LazyArray.linspace(1400, 1600, 100, "nm", chunk_size=10)
+    lazy = sample_dispersion.fn_array(wl)
+    with pytest.raises(ValueError):
+        lazy.compute()
+    with pytest.raises(ValueError):
+        sample_dispersion.fn_array(wl, "ps/km")
+    with pytest.raises(ValueError):
+        LazyArray(np.ones(3), "mm")
+    with pytest.raises(ValueError):
+        LazyArray(np.ones(3), chunk_size=0)
+    with pytest.raises(ValueError):
+        LazyArray(WavelengthArray(np.ones(3), "nm"), "nm")
+    with pytest.raises(ValueError):
+        LazyArray(np.ones(3)).compute(out=np.empty(4))
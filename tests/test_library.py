@@ -0,0 +1,110 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from photonics_helper.library import (
+    compile_library,
+    iter_library,
+    load_library,
+    read_nk_file,
+)
+from photonics_helper.materials import RefractiveIndex
+
+YAML_NK = """\
+# this file is part of refractiveindex.info database
+REFERENCES: "test"
+DATA:
+  - type: tabulated nk
+    data: |
+        0.30 5.00 4.20
+        0.25 1.69 3.07
+        0.40 5.57 0.39
+SPECS:
+    temperature: 300 K
+"""
+
+YAML_N_K = """\
+DATA:
+  - type: tabulated n
+    data: |
+        0.5 1.50
+        1.0 1.45
+        1.5 1.44
+  - type: tabulated k
+    data: |
+        0.5 0.0
+        1.5 0.2
+"""
+
+CSV_N_K = "wl,n\n0.5,1.5\n1.0,1.45\n1.5,1.44\n\nwl,k\n0.5,0.01\n1.5,0.03\n"
+
+
+@pytest.fixture
+def library_dir(tmp_path):
+    (tmp_path / "main" / "Si").mkdir(parents=True)
+    (tmp_path / "main" / "Si" / "Green.yml").write_text(YAML_NK)
+    (tmp_path / "split.yaml").write_text(YAML_N_K)
+    (tmp_path / "glass.csv").write_text(CSV_N_K)
+    return tmp_path
+
+
+def test_read_nk_file(library_dir):
+    ri = read_nk_file(library_dir / "main" / "Si" / "Green.yml")
+    assert isinstance(ri, RefractiveIndex)
+    assert_array_almost_equal(ri.wl.as_um, [0.25, 0.30, 0.40])
+    assert_array_almost_equal(ri.n, [1.69, 5.00, 5.57])
+    assert_array_almost_equal(ri.k, [3.07, 4.20, 0.39])
+
+    ri = read_nk_file(library_dir / "split.yaml")
+    assert_array_almost_equal(ri.k, [0.0, 0.1, 0.2])
+
+    ri = read_nk_file(library_dir / "glass.csv")
+    assert_array_almost_equal(ri.n, [1.5, 1.45, 1.44])
+    assert_array_almost_equal(ri.k, [0.01, 0.02, 0.03])
+
+
+def test_read_nk_file_without_table(tmp_path):
+    path = tmp_path / "formula.yml"
+    path.write_text("DATA:\n  - type: formula 2\n    coefficients: 0 1 2\n")
+    with pytest.raises(ValueError):
+        read_nk_file(path)
+
+
+def test_read_nk_file_bad_block_type(library_dir):
+    path = library_dir / "bad.yml"
+    path.write_text(YAML_N_K.replace("tabulated k", "tabulated"))
+    with pytest.raises(ValueError, match="bad.yml: unsupported data type: 'tabulated'"):
+        list(iter_library(library_dir, workers=2))
+
+
+def test_read_nk_file_k_on_shorter_grid(tmp_path):
+    path = tmp_path / "short_k.csv"
+    path.write_text(
+        "wl,n\n0.5,1.5\n1.0,1.45\n1.5,1.44\n2.0,1.43\n\nwl,k\n0.9,0.01\n2.0,0.03\n"
+    )
+    ri = read_nk_file(path)
+    # k is not extended below 0.9 um, so the 0.5 um n point is dropped
+    assert_array_almost_equal(ri.wl.as_um, [1.0, 1.5, 2.0])
+    assert_array_almost_equal(ri.k, [0.0118182, 0.0209091, 0.03])
+
+    path.write_text("wl,n\n0.5,1.5\n1.0,1.45\n\nwl,k\n1.5,0.01\n2.0,0.03\n")
+    with pytest.raises(ValueError, match="short_k.csv"):
+        read_nk_file(path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_library(library_dir, workers):
+    names = [name for name, _ in iter_library(library_dir, workers=workers)]
+    assert names == ["glass", "main/Si/Green", "split"]
+
+
+def test_compile_and_load_library(library_dir, tmp_path):
+    destination = tmp_path / "library.npz"
+    assert compile_library(library_dir, destination, workers=1) == 3
+
+    library = load_library(destination)
+    assert sorted(library) == ["glass", "main/Si/Green", "split"]
+    expected = read_nk_file(library_dir / "main" / "Si" / "Green.yml")
+    loaded = library["main/Si/Green"]
+    assert_array_almost_equal(loaded.wl, expected.wl)
+    assert_array_almost_equal(loaded.n, expected.n)
+    assert_array_almost_equal(loaded.k, expected.k)
@@ -70,3 +70,72 @@ def test_sellmeier_coefficient_mismatch():
 
     with pytest.raises(ValueError):
         RefractiveIndex.from_alt_sellmeier(A0=1, A=A, B=B, wl_from_to_in_m=wl_range)
+
+
+def test_index_interpolation(sample_refractive_index):
+    """Test scalar and array interpolation of n and k"""
+    assert pytest.approx(sample_refractive_index.n_func(1.5e-6)) == 1.5
+    assert pytest.approx(sample_refractive_index.k_func(1.5e-6)) == 0.0
+
+    wl = WavelengthArray(np.array([1100, 1500, 1900]), "nm")
+    assert_array_almost_equal(sample_refractive_index.n_array(wl), [1.5, 1.5, 1.5])
+    assert_array_almost_equal(sample_refractive_index.k_array(wl), [0.0, 0.0, 0.0])
+
+
+def test_index_out_of_range(sample_refractive_index):
+    """Test wavelength limits of interpolation"""
+    with pytest.raises(AttributeError):
+        sample_refractive_index.n_func(3e-6)
+    with pytest.raises(AttributeError):
+        sample_refractive_index.n_array(WavelengthArray(np.array([0.5, 1.5]), "um"))
+
+
+def test_single_precision_index():
+    A = [0.6961663, 0.4079426, 0.8974794]
+    B = [0.0684043, 0.1162414, 9.896161]
+    single = RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), 100, dtype="single")
+    double = RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), 100)
+    assert single.n.dtype == np.float32 and single.wl.dtype == np.float32
+    assert single.n_complex.dtype == np.complex64
+    np.testing.assert_allclose(single.n, double.n, rtol=1e-6)
+
+    wl = WavelengthArray(np.array([1.4, 1.5, 1.6]), "um", dtype="single")
+    assert single.n_array(wl).dtype == np.float32
+
+    # the float64 endpoints of the grid are within the float32 grid's range
+    grid = WavelengthArray(np.linspace(1.3, 1.8, 100), "um")
+    np.testing.assert_allclose(single.n_array(grid), double.n, rtol=1e-6)
+    with pytest.raises(AttributeError):
+        single.n_func(1.8001e-6)
+
+
+def test_group_index_and_gvd():
+    A = [0.6961663, 0.4079426, 0.8974794]
+    B = [0.0684043, 0.1162414, 9.896161]
+    sellmeier = RefractiveIndex.from_sellmeier(1, A, B, (1.2, 1.9), 400)
+    tabulated = RefractiveIndex(n=sellmeier.n, k=sellmeier.k, wl=sellmeier.wl)
+    wl = WavelengthArray(np.linspace(1.3, 1.8, 1000), "um")
+
+    # fused silica: n_g ~ 1.4626 and beta2 ~ -27.9 ps^2/km at 1550 nm
+    ng = sellmeier.group_index(wl)
+    assert ng.shape == wl.shape
+    np.testing.assert_allclose(tabulated.group_index(wl), ng, rtol=1e-7)
+    np.testing.assert_allclose(tabulated.gvd(wl), sellmeier.gvd(wl), rtol=1e-3)
+    c1550 = WavelengthArray(np.array([1550.0]), "nm")
+    assert sellmeier.group_index(c1550)[0] == pytest.approx(1.4626, abs=1e-4)
+    assert sellmeier.gvd(c1550)[0] * 1e27 == pytest.approx(-27.9, abs=0.2)
+
+    np.testing.assert_allclose(sellmeier.group_velocity(wl) * ng, 299792458.0)
+    np.testing.assert_allclose(sellmeier.group_delay(wl) * 299792458.0, ng)
+    assert sellmeier.group_index().shape == sellmeier.wl.shape
+
+
+def test_walk_off(sample_refractive_index):
+    from photonics_helper.base import Wavelength
+
+    delay = sample_refractive_index.walk_off(Wavelength(1500, "nm"))
+    np.testing.assert_allclose(delay, 0, atol=1e-15)
+    with pytest.raises(TypeError):
+        sample_refractive_index.walk_off(1.5e-6)
+    with pytest.raises(AttributeError):
+        sample_refractive_index.group_index(WavelengthArray([3.0], "um"))
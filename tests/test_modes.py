@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+from photonics_helper.modes import ModeSet
+from photonics_helper.fiber import Dispersion
+from photonics_helper.base import WavelengthArray, C_MS, PI
+from photonics_helper.sellmeier import sellmeier_derivatives
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+@pytest.fixture
+def wavelengths():
+    return WavelengthArray(np.linspace(1.4, 1.7, 301), "um")
+
+
+@pytest.fixture
+def modes(wavelengths):
+    n, _, _ = sellmeier_derivatives(1, [A, [a * 1.01 for a in A]], [B, B], wavelengths)
+    return ModeSet(n, wavelengths, names=["LP01", "LP11"])
+
+
+def test_modeset_layout(modes, wavelengths):
+    assert len(modes) == 2
+    assert modes.neff.shape == (2, wavelengths.size)
+    assert modes.neff.flags["C_CONTIGUOUS"]
+    np.testing.assert_allclose(modes.beta, 2 * PI * modes.neff / wavelengths.as_m)
+
+    with pytest.raises(ValueError):
+        ModeSet(np.ones((2, 5)), wavelengths)
+    with pytest.raises(ValueError):
+        ModeSet(modes.neff, wavelengths, names=["LP01"])
+    with pytest.raises(TypeError):
+        ModeSet(modes.neff, wavelengths.as_m)
+
+
+def test_modeset_matches_per_mode(modes, wavelengths):
+    dispersion = modes.dispersion("ps/nm.km")
+    for i in range(len(modes)):
+        single = Dispersion.from_neff(modes.neff[i], wavelengths, 1550)
+        np.testing.assert_allclose(dispersion[i], single._values * 1e6, rtol=1e-5)
+    assert modes.to_dispersion("LP11", 1550).fn_ps_nm_km(1550) == pytest.approx(
+        dispersion[1, 150]
+    )
+    coarse = modes.to_dispersion(0, 1550, "finite_difference", accuracy=2)
+    np.testing.assert_allclose(
+        coarse._values, modes.dispersion(method="finite_difference", accuracy=2)[0]
+    )
+    assert modes.beta2()[0, 150] * 1e27 == pytest.approx(-27.95, abs=0.05)
+
+
+def test_group_index_and_walk_off(modes, wavelengths):
+    n, dn, _ = sellmeier_derivatives(1, [A, [a * 1.01 for a in A]], [B, B], wavelengths)
+    np.testing.assert_allclose(
+        modes.group_index(), n - wavelengths.as_m * dn, rtol=1e-9
+    )
+
+    delay = modes.group_delay()
+    np.testing.assert_allclose(delay, modes.group_index() / C_MS)
+    np.testing.assert_allclose(modes.walk_off("LP01")[1], delay[1] - delay[0])
+    pairs = modes.walk_off()
+    assert pairs.shape == (2, 2, wavelengths.size)
+    np.testing.assert_allclose(pairs[0, 1], -pairs[1, 0])
+
+
+def test_from_propagation_constant(modes, wavelengths):
+    again = ModeSet.from_propagation_constant(modes.beta, wavelengths)
+    np.testing.assert_allclose(again.neff, modes.neff)
+    assert again.names == ["mode_0", "mode_1"]
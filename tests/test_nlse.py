@@ -0,0 +1,78 @@
+import pytest
+import numpy as np
+from photonics_helper.nlse import SplitStepSolver, gaussian_pulse, sech_pulse
+from photonics_helper.fiber import PropagationConstant
+from photonics_helper.base import AngularFrequencyArray
+
+
+@pytest.fixture
+def times():
+    return np.linspace(-20e-12, 20e-12, 2**12, endpoint=False)
+
+
+def test_gaussian_dispersive_broadening(times):
+    beta2 = -20e-27
+    pulse = gaussian_pulse(times, 1e-12)
+    t0 = 1e-12 / (2 * np.sqrt(np.log(2)))
+    length = 2 * t0**2 / abs(beta2)
+
+    solver = SplitStepSolver.from_betas(times, [beta2])
+    out = solver.propagate(pulse, length)
+    # No nonlinearity: a single step is exact
+    assert solver.steps == 1
+    assert np.max(np.abs(out)) == pytest.approx(5**-0.25, rel=1e-9)
+
+
+def test_fundamental_soliton(times):
+    beta2, gamma, t0 = -20e-27, 1.3e-3, 0.5e-12
+    peak = abs(beta2) / (gamma * t0**2)
+    pulse = sech_pulse(times, 2 * np.arccosh(np.sqrt(2)) * t0, peak)
+
+    solver = SplitStepSolver.from_betas(times, [beta2], gamma=gamma)
+    out = solver.propagate(pulse, 3 * t0**2 / abs(beta2), max_phase=1e-2)
+    assert solver.steps > 1
+    np.testing.assert_allclose(np.abs(out), np.abs(pulse), atol=1e-3 * np.sqrt(peak))
+
+
+def test_self_phase_modulation_and_loss(times):
+    pulse = gaussian_pulse(times, 1e-12, peak_power=2.0)
+    solver = SplitStepSolver.from_betas(times, [], gamma=1e-2, alpha=1e-3)
+    out = solver.propagate(pulse, 100.0)
+    energy = np.sum(np.abs(out) ** 2) / np.sum(np.abs(pulse) ** 2)
+    assert energy == pytest.approx(np.exp(-0.1), rel=1e-9)
+
+    lossless = SplitStepSolver.from_betas(times, [], gamma=1e-2)
+    out = lossless.propagate(pulse, 100.0)
+    np.testing.assert_allclose(np.abs(out), np.abs(pulse), atol=1e-12)
+    assert np.angle(out[times.size // 2]) == pytest.approx(2.0, rel=1e-9)
+
+
+def test_third_order_dispersion_delays_pulse(times):
+    pulse = gaussian_pulse(times, 1e-12)
+    solver = SplitStepSolver.from_betas(times, [0.0, 1e-39])
+    power = np.abs(solver.propagate(pulse, 1000.0)) ** 2
+    assert np.sum(times * power) / np.sum(power) > 0
+
+
+def test_from_propagation_constant_matches_betas(times):
+    omega = AngularFrequencyArray(np.linspace(1.1e15, 1.3e15, 200), "rad/s")
+    x = omega.as_rad_s - 1.2e15
+    beta = PropagationConstant(
+        5e6 + 4.8e-9 * x + 2e-26 * x**2 / 2 + 1e-40 * x**3 / 6, omega
+    )
+    solver = SplitStepSolver.from_propagation_constant(beta, times, 1.2e15, order=3)
+    expected = SplitStepSolver.from_betas(times, [2e-26, 1e-40])
+    pulse = gaussian_pulse(times, 1e-12)
+    np.testing.assert_allclose(
+        solver.propagate(pulse, 10.0), expected.propagate(pulse, 10.0), atol=1e-6
+    )
+
+
+def test_solver_checks(times):
+    solver = SplitStepSolver.from_betas(times, [-20e-27])
+    with pytest.raises(ValueError):
+        solver.propagate(np.ones(10), 1.0)
+    with pytest.raises(ValueError):
+        solver.propagate(np.ones(times.size), -1.0)
+    with pytest.raises(ValueError):
+        SplitStepSolver(np.array([0.0, 1.0, 3.0]), np.zeros(3))
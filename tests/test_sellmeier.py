@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+from photonics_helper.base import WavelengthArray
+from photonics_helper.materials import RefractiveIndex
+from photonics_helper.sellmeier import sellmeier_derivatives, sellmeier_table
+
+SILICA_A = [0.6961663, 0.4079426, 0.8974794]
+SILICA_B = [0.0684043, 0.1162414, 9.896161]
+
+
+def test_sellmeier_table_matches_from_sellmeier():
+    """Single material table matches RefractiveIndex.from_sellmeier"""
+    ri = RefractiveIndex.from_sellmeier(
+        A0=1, A=SILICA_A, B=SILICA_B, wl_from_to_in_um=(0.5, 2.0), n_points=50
+    )
+    table = sellmeier_table(1, SILICA_A, SILICA_B, ri.wl)
+
+    assert table.shape == (1, 50)
+    assert_array_almost_equal(table[0], ri.n)
+    assert pytest.approx(table[0][np.argmin(abs(ri.wl.as_um - 1.55))], 1e-3) == 1.444
+
+
+def test_sellmeier_table_multi_material_and_chunks():
+    """Ragged coefficient rows are padded and chunking gives identical results"""
+    wl = WavelengthArray(np.linspace(0.6, 1.8, 1001), "um")
+    A0 = [1.0, 2.0]
+    A = [SILICA_A, [0.5]]
+    B = [SILICA_B, [0.2]]
+
+    table = sellmeier_table(A0, A, B, wl)
+    chunked = sellmeier_table(A0, A, B, wl, chunk_size=64)
+
+    assert table.shape == (2, 1001)
+    assert np.array_equal(table, chunked)
+    expected = np.sqrt(2.0 + 0.5 * wl.as_um**2 / (wl.as_um**2 - 0.2**2))
+    assert_array_almost_equal(table[1], expected)
+
+
+def test_sellmeier_table_errors():
+    wl = WavelengthArray(np.linspace(0.6, 1.8, 10), "um")
+    with pytest.raises(ValueError):
+        sellmeier_table(1, [[1.0, 2.0]], [[1.0]], wl)
+    # ragged tables of the same padded shape, but one row is short of a term
+    with pytest.raises(ValueError):
+        sellmeier_table(1, [SILICA_A, [0.5]], [SILICA_B, [0.2, 0.3]], wl)
+    with pytest.raises(ValueError):
+        sellmeier_derivatives(1, [[0.5, 0.1], SILICA_A], [[0.2], SILICA_B], wl)
+    with pytest.raises(ValueError):
+        sellmeier_table([1, 2, 3], [[1.0], [2.0]], [[0.1], [0.2]], wl)
+    with pytest.raises(TypeError):
+        sellmeier_table(1, [1.0], [0.1], np.linspace(0.6, 1.8, 10))
@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+import numpy as np
+from photonics_helper import instrument
+from photonics_helper.base import Wavelength, WavelengthArray
+from photonics_helper.fiber import Dispersion
+from photonics_helper.materials import RefractiveIndex
+from photonics_helper.server import LookupClient, LookupServer
+
+
+@pytest.fixture
+def objects():
+    wl = WavelengthArray(np.linspace(1500, 1600, 51), "nm")
+    dispersion = Dispersion(
+        wavelengths=wl,
+        values=np.linspace(15, 20, 51),
+        unit="ps/nm.km",
+        central_wavelength=Wavelength(1550, "nm"),
+    )
+    index = RefractiveIndex(np.linspace(1.45, 1.44, 51), np.zeros(51), wl)
+    return {"smf": dispersion, "silica": index}
+
+
+def test_coalesces_concurrent_requests(objects):
+    wavelengths = np.linspace(1510, 1590, 200)
+
+    async def run():
+        server = LookupServer(objects, window=0.05)
+        return await asyncio.gather(
+            *(
+                server.evaluate({"op": "dispersion", "name": "smf", "wavelength": w})
+                for w in wavelengths
+            ),
+            server.evaluate(
+                {"op": "index", "name": "silica", "wavelength": [1520.0, 1580.0]}
+            ),
+        )
+
+    with instrument.instrumented():
+        *values, index = asyncio.run(run())
+        counters = instrument.snapshot()["counters"]
+
+    expected = objects["smf"].fn_array(WavelengthArray(wavelengths, "nm"), "ps/nm.km")
+    np.testing.assert_allclose(values, expected)
+    assert all(isinstance(value, float) for value in values)
+    assert index == pytest.approx([1.448, 1.442])
+    # one batch per distinct quantity
+    assert counters["server.batches"] == 2
+    assert counters["server.requests"] == 201
+
+
+def test_bad_request_fails_alone(objects):
+    async def run():
+        server = LookupServer(objects, window=0.05)
+        return await asyncio.gather(
+            server.evaluate({"op": "dispersion", "name": "smf", "wavelength": 1550}),
+            server.evaluate({"op": "dispersion", "name": "smf", "wavelength": 1700}),
+            server.evaluate({"op": "dispersion", "name": "none", "wavelength": 1550}),
+            server.evaluate({"op": "index", "name": "smf", "wavelength": 1550}),
+            server.evaluate({"op": "index", "name": "silica", "wavelength": 1400}),
+            server.evaluate({"op": "unknown"}),
+            return_exceptions=True,
+        )
+
+    good, *errors = asyncio.run(run())
+    assert good == pytest.approx(17.5)
+    assert [type(error) for error in errors] == [
+        ValueError,
+        KeyError,
+        KeyError,
+        AttributeError,
+        ValueError,
+    ]
+
+
+@pytest.mark.parametrize("transport", ["tcp", "unix"])
+def test_client_roundtrip(objects, transport, tmp_path):
+    async def run():
+        server = LookupServer(objects)
+        path = tmp_path / "lookup.sock" if transport == "unix" else None
+        address = await server.start(path)
+        try:
+            if transport == "unix":
+                client = await LookupClient.connect(path=address)
+            else:
+                client = await LookupClient.connect(port=address[1])
+            async with client:
+                names = await client.names()
+                values = await asyncio.gather(
+                    *(client.dispersion("smf", w) for w in (1520, 1550, 1580))
+                )
+                beta2 = await client.dispersion("smf", [1.55], "um", "beta2")
+                frequency = await client.convert(
+                    1550, "wavelength", "nm", "frequency", "THz"
+                )
+                with pytest.raises(ValueError):
+                    await client.dispersion("smf", 1700)
+                with pytest.raises(KeyError):
+                    await client.index("none", 1550)
+        finally:
+            await server.close()
+        return names, values, beta2, frequency
+
+    names, values, beta2, frequency = asyncio.run(run())
+    assert names == ["silica", "smf"]
+    assert values == pytest.approx([16.0, 17.5, 19.0])
+    assert beta2 == pytest.approx([objects["smf"].get_beta2(1550)])
+    assert frequency == pytest.approx(193.414489, rel=1e-8)
+
+
+def test_server_errors(objects):
+    with pytest.raises(ValueError):
+        LookupServer(window=-1)
+    with pytest.raises(TypeError):
+        LookupServer({"bad": np.ones(3)})
+
+    async def run():
+        server = LookupServer(objects)
+        with pytest.raises(RuntimeError):
+            await server.serve_forever()
+        with pytest.raises(ValueError):
+            await LookupClient.connect()
+
+    asyncio.run(run())
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from photonics_helper.base import WavelengthArray
+from photonics_helper.fiber import Dispersion, PropagationConstant
+from photonics_helper.materials import RefractiveIndex
+from photonics_helper.stepindex import StepIndexFiber
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+@pytest.fixture
+def smf():
+    # SMF-28-like: germanium-doped core approximated by a constant offset
+    cladding = RefractiveIndex.from_sellmeier(1, A, B, (0.5, 2.0), 2000)
+    core = RefractiveIndex(n=cladding.n + 0.0052, k=cladding.k, wl=cladding.wl)
+    return StepIndexFiber(core, cladding, 4.1e-6)
+
+
+def _reference_u(V, l):
+    from scipy.optimize import brentq
+    from scipy.special import jn_zeros, jv, kv
+
+    def equation(u):
+        w = np.sqrt(V * V - u * u)
+        return u * jv(l - 1, u) * kv(l, w) + w * kv(abs(l - 1), w) * jv(l, u)
+
+    # the first root lies below the first zero of J_l
+    upper = min(V - 1e-9, jn_zeros(l, 1)[0])
+    return brentq(equation, 1e-6, upper, xtol=1e-15) / V
+
+
+def test_lp_modes_match_reference(smf):
+    wl = WavelengthArray(np.linspace(0.7, 1.7, 3001), "um")
+    V = smf.v_number(wl)
+    s01 = smf.normalized_u(wl, 0, 1)
+    s11 = smf.normalized_u(wl, 1, 1)
+    for i in range(0, wl.size, 250):
+        assert s01[i] == pytest.approx(_reference_u(V[i], 0), abs=1e-12)
+    # LP11 is cut off below V = 2.405
+    np.testing.assert_array_equal(np.isnan(s11), V < 2.404826)
+    guided = np.flatnonzero(V > 2.5)
+    for i in guided[::200]:
+        assert s11[i] == pytest.approx(_reference_u(V[i], 1), abs=1e-12)
+
+    neff = smf.neff(wl)
+    assert np.all((neff > smf.cladding.n_array(wl)) & (neff < smf.core.n_array(wl)))
+    assert np.all(smf.neff(wl, 1, 1)[guided] < neff[guided])
+
+
+def test_fiber_dispersion(smf):
+    wl = WavelengthArray(np.linspace(1.2, 1.7, 501), "um")
+    dispersion = smf.dispersion(wl, 1550)
+    assert isinstance(dispersion, Dispersion)
+    assert dispersion.fn_ps_nm_km(1550) == pytest.approx(17, abs=1)
+
+    beta = smf.propagation_constant(wl)
+    assert isinstance(beta, PropagationConstant)
+    np.testing.assert_allclose(beta.values, 2 * np.pi * smf.neff(wl) / wl.as_m)
+
+
+def test_mode_set_and_errors(smf):
+    wl = WavelengthArray(np.linspace(0.6, 0.7, 50), "um")
+    modes = smf.mode_set(wl, [(0, 1), (1, 1), (2, 1), (0, 2)])
+    assert modes.names == ["LP01", "LP11", "LP21", "LP02"]
+    assert np.all(np.diff(modes.neff, axis=0) < 0)
+
+    with pytest.raises(ValueError):
+        smf.dispersion(WavelengthArray(np.linspace(1.2, 1.7, 51), "um"), 1550, l=1)
+    with pytest.raises(ValueError):
+        StepIndexFiber(1.44, 1.45, 4e-6).neff(wl)
+    with pytest.raises(ValueError):
+        smf.neff(wl, 0, 0)
+    with pytest.raises(TypeError):
+        smf.neff(wl.as_m)
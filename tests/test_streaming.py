@@ -0,0 +1,99 @@
+import pytest
+import numpy as np
+from photonics_helper.base import WavelengthArray
+from photonics_helper.fiber import Dispersion
+from photonics_helper.materials import RefractiveIndex
+from photonics_helper.streaming import stream_range, stream_spectrum, wavelength_chunks
+
+A = [0.6961663, 0.4079426, 0.8974794]
+B = [0.0684043, 0.1162414, 9.896161]
+
+
+@pytest.fixture
+def index():
+    return RefractiveIndex.from_sellmeier(1, A, B, (1.2, 1.9), 500)
+
+
+@pytest.fixture
+def dispersion():
+    wl = WavelengthArray(np.linspace(1.2, 1.9, 500), "um")
+    return Dispersion.from_sellmeier(1, A, B, wl, 1550)
+
+
+def test_wavelength_chunks_match_linspace():
+    chunks = [wl.copy() for wl in wavelength_chunks(1300, 1700, 1001, chunk_size=64)]
+    assert [c.size for c in chunks[:2]] == [64, 64]
+    assert sum(c.size for c in chunks) == 1001
+    np.testing.assert_allclose(
+        np.concatenate(chunks), np.linspace(1300e-9, 1700e-9, 1001), rtol=1e-14
+    )
+    assert np.concatenate(chunks)[-1] == 1700e-9
+
+    with pytest.raises(ValueError):
+        next(wavelength_chunks(1300, 1700, 1))
+
+
+def test_stream_range(dispersion, index):
+    wl = WavelengthArray(np.linspace(1300, 1700, 1000), "nm")
+    chunks = list(
+        (w.copy(), d.copy(), b.copy(), n.copy(), k.copy())
+        for w, d, b, n, k in stream_range(
+            1300, 1700, 1000, dispersion, index, unit="ps/nm.km", chunk_size=128
+        )
+    )
+    assert len(chunks) == 8
+    w, d, b, n, k = (np.concatenate(parts) for parts in zip(*chunks))
+    np.testing.assert_allclose(w, wl.as_m, rtol=1e-14)
+    np.testing.assert_allclose(d, dispersion.fn_array(wl, "ps/nm.km"))
+    np.testing.assert_allclose(b, dispersion.get_beta2_array(wl))
+    np.testing.assert_allclose(n, index.n_array(wl))
+    np.testing.assert_allclose(k, index.k_array(wl))
+
+
+@pytest.mark.parametrize("dtype", ["single", "double"])
+def test_stream_single_precision_objects(dtype):
+    index = RefractiveIndex.from_sellmeier(1, A, B, (1.3, 1.8), 200, dtype="single")
+    wl = WavelengthArray(np.linspace(1.3, 1.8, 200), "um", dtype="single")
+    dispersion = Dispersion.from_sellmeier(1, A, B, wl, 1550)
+    assert dispersion.dtype == np.float32
+
+    # a range spanning the objects' own limits, endpoints included
+    lower, upper = index.wl.as_nm[[0, -1]]
+    chunks = [
+        (w.copy(), n.copy())
+        for w, _, _, n, _ in stream_range(
+            1300, 1800, 1000, dispersion, index, chunk_size=128, dtype=dtype
+        )
+    ]
+    w, n = (np.concatenate(parts) for parts in zip(*chunks))
+    assert w.size == 1000 and w.dtype == np.dtype(
+        np.float32 if dtype == "single" else np.float64
+    )
+    assert n.dtype == np.float32
+    np.testing.assert_allclose(w[[0, -1]] * 1e9, [lower, upper], rtol=1e-6)
+    np.testing.assert_allclose(
+        n,
+        index.n_array(WavelengthArray(np.linspace(1300, 1800, 1000), "nm")),
+        rtol=1e-6,
+    )
+
+
+def test_stream_reuses_buffers(index):
+    blocks = [WavelengthArray(np.linspace(1.3, 1.6, 300), "um")] * 2
+    seen = set()
+    for wl, d, beta2, n, k in stream_spectrum(blocks, index=index, chunk_size=100):
+        assert d is None and beta2 is None
+        assert wl.size == 100
+        seen.add(n.__array_interface__["data"][0])
+    assert len(seen) == 1
+
+
+def test_stream_errors(dispersion, index):
+    with pytest.raises(ValueError):
+        next(stream_range(1300, 1700, 100))
+    with pytest.raises(ValueError):
+        next(stream_range(1000, 1700, 100, dispersion=dispersion))
+    with pytest.raises(AttributeError):
+        next(stream_range(1000, 1700, 100, index=index))
+    with pytest.raises(TypeError):
+        next(stream_spectrum([np.linspace(1.3, 1.6, 10)], index=index))
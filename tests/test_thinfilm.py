@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+from photonics_helper.base import WavelengthArray
+from photonics_helper.materials import RefractiveIndex
+from photonics_helper.thinfilm import transfer_matrix
+
+
+def _reference(indices, thicknesses, wl, angle, polarization):
+    # Textbook characteristic-matrix product for a single point
+    n = np.asarray(indices, dtype=complex)
+    cos = np.sqrt(1 - (n[0] * np.sin(angle) / n) ** 2)
+    cos = np.where((n * cos).imag < 0, -cos, cos)
+    if polarization == "s":
+        eta = n * cos
+    else:
+        eta = n / cos
+    M = np.eye(2, dtype=complex)
+    for j, d in enumerate(thicknesses, start=1):
+        delta = 2 * np.pi * n[j] * cos[j] * d / wl
+        M = M @ np.array(
+            [
+                [np.cos(delta), -1j * np.sin(delta) / eta[j]],
+                [-1j * eta[j] * np.sin(delta), np.cos(delta)],
+            ]
+        )
+    B, C = M @ np.array([1, eta[-1]])
+    r = (eta[0] * B - C) / (eta[0] * B + C)
+    T = 4 * eta[0].real * eta[-1].real / abs(eta[0] * B + C) ** 2
+    return abs(r) ** 2, T
+
+
+def test_single_interface_and_ar_coating():
+    wl = WavelengthArray(np.linspace(400, 800, 5), "nm")
+    bare = transfer_matrix([], [], wl, substrate=1.5)
+    np.testing.assert_allclose(bare.R(), 0.04)
+    np.testing.assert_allclose(bare.T(), 0.96)
+
+    n = np.sqrt(1.5)
+    coated = transfer_matrix([n], [600e-9 / (4 * n)], wl, substrate=1.5)
+    assert coated.R()[2] < 1e-12
+    assert bare.shape == (5,)
+
+    brewster = transfer_matrix([], [], wl, np.arctan(1.5), substrate=1.5)
+    np.testing.assert_allclose(brewster.R_p, 0, atol=1e-15)
+    tir = transfer_matrix([], [], wl, np.radians(60), ambient=1.5)
+    np.testing.assert_allclose(tir.R_s, 1)
+    np.testing.assert_allclose(tir.T_p, 0, atol=1e-15)
+
+
+def test_matches_characteristic_matrix():
+    indices = [1.0, 2.3, 0.15 + 3.5j, 1.46, 1.52]
+    thicknesses = [80e-9, 10e-9, 120e-9]
+    wl = WavelengthArray(np.linspace(450, 750, 7), "nm")
+    angles = np.radians([0, 30, 70])
+    result = transfer_matrix(indices[1:-1], thicknesses, wl, angles, 1.0, 1.52)
+    assert result.shape == (7, 3)
+    for i, w in enumerate(wl.as_m):
+        for a, angle in enumerate(angles):
+            for polarization in ("s", "p"):
+                R, T = _reference(indices, thicknesses, w, angle, polarization)
+                assert result.R(polarization)[i, a] == pytest.approx(R, rel=1e-9)
+                assert result.T(polarization)[i, a] == pytest.approx(T, rel=1e-9)
+    assert np.all(result.A_s > 0) and np.all(result.A_p > 0)
+
+
+def test_many_stacks():
+    wl = WavelengthArray(np.linspace(400, 800, 50), "nm")
+    glass = RefractiveIndex(
+        n=np.full(20, 1.46),
+        k=np.zeros(20),
+        wl=WavelengthArray(np.linspace(0.3, 1, 20), "um"),
+    )
+    thicknesses = np.array([[50e-9, 100e-9], [80e-9, 90e-9], [120e-9, 10e-9]])
+    angles = np.linspace(0, 1.2, 4)
+    batch = transfer_matrix([2.1, glass], thicknesses, wl, angles, substrate=1.5)
+    assert batch.shape == (3, 50, 4)
+    for i, stack in enumerate(thicknesses):
+        single = transfer_matrix([2.1, 1.46], stack, wl, angles, substrate=1.5)
+        np.testing.assert_allclose(batch.R_s[i], single.R_s, rtol=1e-12)
+        np.testing.assert_allclose(batch.T_p[i], single.T_p, rtol=1e-12)
+    # lossless stacks conserve energy
+    np.testing.assert_allclose(batch.R() + batch.T(), 1, atol=1e-12)
+
+
+def test_transfer_matrix_errors():
+    wl = WavelengthArray(np.linspace(400, 800, 5), "nm")
+    with pytest.raises(ValueError):
+        transfer_matrix([1.5], [1e-7, 2e-7], wl)
+    with pytest.raises(ValueError):
+        transfer_matrix([1.5], [1e-7], wl, angles=2.0)
+    with pytest.raises(TypeError):
+        transfer_matrix([1.5], [1e-7], wl.as_m)
+    with pytest.raises(TypeError):
+        transfer_matrix(["glass"], [1e-7], wl)
+    with pytest.raises(ValueError):
+        transfer_matrix([1.5], [1e-7], wl).R("circular")